@@ -10,8 +10,32 @@
  * 5. Execute as: Me
  * 6. Who has access: Anyone
  * 7. Copy Web App URL
+ *
+ * Protokol upload per chunk (dipakai transfer_data_to_sheets):
+ * - action "init":     { uploadId, spreadsheetId, sheetName, header, totalRows, totalChunks }
+ *                      Upload baru: sheet dibersihkan dan header ditulis. Upload dengan uploadId
+ *                      yang sama dan belum selesai: dilanjutkan (nextChunk = chunk berikutnya),
+ *                      kecuali sheet sudah ditulis upload/delta lain sejak itu atau status upload
+ *                      lebih tua dari UPLOAD_STATE_TTL_MS; dalam hal itu upload dimulai dari awal.
+ * - action "append":   { uploadId, chunkIndex, offset, encoding: "gzip+base64", payload }
+ *                      Baris ditulis mulai baris data ke-offset (aman dikirim ulang).
+ * - action "finalize": { uploadId, totalRows } - sisa baris lama dihapus, status upload dihapus.
+ *
+ * Delta sync (hanya baris yang berubah sejak upload terakhir):
+ * - action "delta":    { deltaId, spreadsheetId, sheetName, header, expectedRows, encoding, payload }
+ *                      payload: { updates: [[baris, jumlah, rows]], deletes: [[baris, jumlah]] (dari bawah),
+ *                      inserts: [rows] }. Jika header/jumlah baris sheet tidak cocok dengan manifest
+ *                      aplikasi, status "conflict" dikirim dan aplikasi melakukan upload penuh.
+ * Request tanpa "action" tetap memakai cara lama (clear lalu tulis semua "data").
  */
 
+const UPLOAD_STATE_PREFIX = "upload_";
+const DELTA_STATE_PREFIX = "delta_";
+// Penulis terakhir setiap sheet (uploadId, "delta:<deltaId>", atau "legacy")
+const SHEET_WRITER_PREFIX = "writer_";
+// Status upload yang tidak diperbarui selama ini dianggap ditinggalkan dan dihapus saat init
+const UPLOAD_STATE_TTL_MS = 24 * 60 * 60 * 1000;
+
 /**
  * Fungsi ini berjalan ketika permintaan HTTP POST diterima oleh Web App.
  * Ia menerima data publikasi dan menuliskannya ke spreadsheet yang ditentukan.
@@ -22,6 +46,11 @@ function doPost(e) {
     // 1. Parse data JSON yang dikirim dari Python
     const requestData = JSON.parse(e.postData.contents);
 
+    // Upload per chunk
+    if (requestData.action) {
+      return jsonResponse(handleUploadAction(requestData));
+    }
+
     // 2. Ekstrak parameter yang diperlukan dari request
     const spreadsheetId = requestData.spreadsheetId;
     const sheetName = requestData.sheetName;
@@ -32,16 +61,10 @@ function doPost(e) {
       throw new Error("Parameter 'spreadsheetId', 'sheetName', atau 'data' tidak valid atau hilang.");
     }
 
-    // 3. Buka spreadsheet target menggunakan ID-nya
-    const spreadsheet = SpreadsheetApp.openById(spreadsheetId);
+    // 3. Buka spreadsheet target dan dapatkan sheet (dibuat jika belum ada)
+    const sheet = getOrCreateSheet(spreadsheetId, sheetName);
 
-    // 4. Dapatkan sheet target berdasarkan nama. Jika tidak ada, buat baru.
-    let sheet = spreadsheet.getSheetByName(sheetName);
-    if (!sheet) {
-      sheet = spreadsheet.insertSheet(sheetName);
-    }
-
-    // 5. Bersihkan sheet dan tulis data baru
+    // 4. Bersihkan sheet dan tulis data baru
     sheet.clear();
     const numRows = data.length;
     const numCols = data[0] ? data[0].length : 0;
@@ -49,26 +72,256 @@ function doPost(e) {
     if (numRows > 0 && numCols > 0) {
       sheet.getRange(1, 1, numRows, numCols).setValues(data);
     }
+    markSheetWriter(PropertiesService.getScriptProperties(), spreadsheetId, sheetName, "legacy");
 
-    // 6. Kirim respons sukses kembali ke Python
-    return ContentService.createTextOutput(
-      JSON.stringify({
-        status: "success",
-        message: `Data berhasil ditulis ke sheet '${sheetName}'.`,
-        rowsWritten: numRows,
-        columnsWritten: numCols,
-      })
-    ).setMimeType(ContentService.MimeType.JSON);
+    // 5. Kirim respons sukses kembali ke Python
+    return jsonResponse({
+      status: "success",
+      message: `Data berhasil ditulis ke sheet '${sheetName}'.`,
+      rowsWritten: numRows,
+      columnsWritten: numCols,
+    });
   } catch (error) {
-    // 7. Jika terjadi error, kirim respons error kembali ke Python
+    // 6. Jika terjadi error, kirim respons error kembali ke Python
     Logger.log(error.toString()); // Catat error untuk debugging
-    return ContentService.createTextOutput(
-      JSON.stringify({
-        status: "error",
-        message: error.toString(),
-      })
-    ).setMimeType(ContentService.MimeType.JSON);
+    return jsonResponse({
+      status: "error",
+      message: error.toString(),
+    });
+  }
+}
+
+/**
+ * Membuat respons JSON untuk dikirim kembali ke Python.
+ * @param {Object} body - Isi respons.
+ */
+function jsonResponse(body) {
+  return ContentService.createTextOutput(JSON.stringify(body)).setMimeType(ContentService.MimeType.JSON);
+}
+
+/**
+ * Membuka spreadsheet berdasarkan ID dan mengembalikan sheet dengan nama tertentu
+ * (dibuat baru jika belum ada).
+ */
+function getOrCreateSheet(spreadsheetId, sheetName) {
+  const spreadsheet = SpreadsheetApp.openById(spreadsheetId);
+  let sheet = spreadsheet.getSheetByName(sheetName);
+  if (!sheet) {
+    sheet = spreadsheet.insertSheet(sheetName);
   }
+  return sheet;
+}
+
+/**
+ * Mencatat penulis terakhir sebuah sheet, agar upload lain yang terputus tidak dilanjutkan
+ * di atas data yang sudah ditimpa.
+ * @param {Properties} properties - Script Properties.
+ * @param {string} spreadsheetId - ID spreadsheet.
+ * @param {string} sheetName - Nama sheet.
+ * @param {string} writerId - uploadId, "delta:<deltaId>", atau "legacy".
+ */
+function markSheetWriter(properties, spreadsheetId, sheetName, writerId) {
+  properties.setProperty(SHEET_WRITER_PREFIX + spreadsheetId + "_" + sheetName, writerId);
+}
+
+/**
+ * Menghapus status upload lain yang sudah kedaluwarsa (lebih tua dari UPLOAD_STATE_TTL_MS)
+ * atau menulis ke sheet yang sama dengan upload baru (tidak bisa dilanjutkan lagi).
+ * @param {Properties} properties - Script Properties.
+ * @param {Object} request - Request action "init".
+ */
+function deleteStaleUploads(properties, request) {
+  const now = Date.now();
+  const all = properties.getProperties();
+  Object.keys(all).forEach((key) => {
+    if (!key.startsWith(UPLOAD_STATE_PREFIX) || key === UPLOAD_STATE_PREFIX + request.uploadId) {
+      return;
+    }
+    let state = null;
+    try {
+      state = JSON.parse(all[key]);
+    } catch (error) {
+      // Status rusak: dihapus
+    }
+    const expired = !state || !state.updatedAt || now - state.updatedAt > UPLOAD_STATE_TTL_MS;
+    const sameSheet = state && state.spreadsheetId === request.spreadsheetId && state.sheetName === request.sheetName;
+    if (expired || sameSheet) {
+      properties.deleteProperty(key);
+    }
+  });
+}
+
+/**
+ * Menjalankan satu aksi upload per chunk (init/append/finalize). Status upload (sheet tujuan
+ * dan chunk terakhir yang diterima) disimpan di Script Properties agar upload bisa dilanjutkan.
+ * @param {Object} request - Request dengan field "action" dan "uploadId".
+ */
+function handleUploadAction(request) {
+  if (!request.uploadId && request.action !== "delta") {
+    throw new Error("Parameter 'uploadId' hilang.");
+  }
+
+  const lock = LockService.getScriptLock();
+  lock.waitLock(30000);
+  try {
+    if (request.action === "delta") {
+      return applyDelta(request);
+    }
+
+    const properties = PropertiesService.getScriptProperties();
+    const key = UPLOAD_STATE_PREFIX + request.uploadId;
+    const stored = properties.getProperty(key);
+    let state = stored ? JSON.parse(stored) : null;
+
+    if (request.action === "init") {
+      if (!request.spreadsheetId || !request.sheetName || !Array.isArray(request.header)) {
+        throw new Error("Parameter 'spreadsheetId', 'sheetName', atau 'header' tidak valid atau hilang.");
+      }
+      deleteStaleUploads(properties, request);
+
+      const writer = properties.getProperty(SHEET_WRITER_PREFIX + request.spreadsheetId + "_" + request.sheetName);
+      const resumable = state && writer === request.uploadId &&
+        state.spreadsheetId === request.spreadsheetId && state.sheetName === request.sheetName &&
+        state.updatedAt && Date.now() - state.updatedAt <= UPLOAD_STATE_TTL_MS;
+      if (resumable) {
+        // Upload yang sama belum selesai dan sheet belum ditulis pihak lain: lanjutkan dari chunk berikutnya
+        state.updatedAt = Date.now();
+        properties.setProperty(key, JSON.stringify(state));
+        return { status: "success", resumed: true, nextChunk: state.nextChunk };
+      }
+
+      const sheet = getOrCreateSheet(request.spreadsheetId, request.sheetName);
+      sheet.clear();
+      if (request.header.length > 0) {
+        sheet.getRange(1, 1, 1, request.header.length).setValues([request.header]);
+      }
+
+      state = {
+        spreadsheetId: request.spreadsheetId,
+        sheetName: request.sheetName,
+        numCols: request.header.length,
+        totalChunks: request.totalChunks,
+        nextChunk: 0,
+        updatedAt: Date.now(),
+      };
+      properties.setProperty(key, JSON.stringify(state));
+      markSheetWriter(properties, request.spreadsheetId, request.sheetName, request.uploadId);
+      return { status: "success", resumed: false, nextChunk: 0 };
+    }
+
+    if (!state) {
+      throw new Error(`Upload '${request.uploadId}' tidak ditemukan. Mulai ulang dengan action 'init'.`);
+    }
+    const sheet = getOrCreateSheet(state.spreadsheetId, state.sheetName);
+
+    if (request.action === "append") {
+      const rows = decodeRows(request);
+      if (rows.length > 0 && state.numCols > 0) {
+        // Baris 1 adalah header; offset dihitung dari baris data pertama
+        sheet.getRange(2 + request.offset, 1, rows.length, state.numCols).setValues(rows);
+      }
+      state.nextChunk = Math.max(state.nextChunk, request.chunkIndex + 1);
+      state.updatedAt = Date.now();
+      properties.setProperty(key, JSON.stringify(state));
+      return { status: "success", chunkIndex: request.chunkIndex, nextChunk: state.nextChunk };
+    }
+
+    if (request.action === "finalize") {
+      const rowsWritten = request.totalRows + 1;
+      // Hapus sisa baris di bawah data (mis. dari upload lama yang lebih panjang)
+      const lastRow = sheet.getLastRow();
+      if (lastRow > rowsWritten) {
+        sheet.getRange(rowsWritten + 1, 1, lastRow - rowsWritten, sheet.getMaxColumns()).clearContent();
+      }
+      properties.deleteProperty(key);
+      return {
+        status: "success",
+        message: `Data berhasil ditulis ke sheet '${state.sheetName}'.`,
+        rowsWritten: rowsWritten,
+        columnsWritten: state.numCols,
+      };
+    }
+
+    throw new Error(`Action tidak dikenal: ${request.action}`);
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+/**
+ * Menerapkan delta ke sheet dengan penulisan range yang ditargetkan: baris berubah ditimpa
+ * (satu setValues per rentang berurutan), baris hilang dihapus dari bawah, baris baru
+ * ditambahkan di akhir. Delta dengan deltaId yang sama tidak diterapkan dua kali.
+ * @param {Object} request - Request action "delta".
+ */
+function applyDelta(request) {
+  if (!request.deltaId || !request.spreadsheetId || !request.sheetName || !Array.isArray(request.header)) {
+    throw new Error("Parameter 'deltaId', 'spreadsheetId', 'sheetName', atau 'header' tidak valid atau hilang.");
+  }
+
+  const properties = PropertiesService.getScriptProperties();
+  const key = DELTA_STATE_PREFIX + request.spreadsheetId + "_" + request.sheetName;
+  const applied = properties.getProperty(key);
+  if (applied) {
+    const previous = JSON.parse(applied);
+    if (previous.deltaId === request.deltaId) {
+      // Request diulang (mis. response sebelumnya tidak sampai): kirim hasil yang sama
+      return previous.result;
+    }
+  }
+
+  const spreadsheet = SpreadsheetApp.openById(request.spreadsheetId);
+  const sheet = spreadsheet.getSheetByName(request.sheetName);
+  const numCols = request.header.length;
+  if (!sheet || sheet.getLastRow() !== request.expectedRows || numCols === 0) {
+    return { status: "conflict", message: "Jumlah baris sheet tidak cocok dengan upload terakhir" };
+  }
+  const currentHeader = sheet.getRange(1, 1, 1, numCols).getDisplayValues()[0];
+  if (currentHeader.join("\u0000") !== request.header.join("\u0000")) {
+    return { status: "conflict", message: "Header sheet tidak cocok dengan upload terakhir" };
+  }
+
+  const delta = decodeRows(request);
+  let cellsWritten = 0;
+
+  (delta.updates || []).forEach(([startRow, count, rows]) => {
+    sheet.getRange(startRow, 1, count, numCols).setValues(rows);
+    cellsWritten += count * numCols;
+  });
+
+  let deleted = 0;
+  (delta.deletes || []).forEach(([startRow, count]) => {
+    sheet.deleteRows(startRow, count);
+    deleted += count;
+  });
+
+  const inserts = delta.inserts || [];
+  if (inserts.length > 0) {
+    sheet.getRange(request.expectedRows - deleted + 1, 1, inserts.length, numCols).setValues(inserts);
+    cellsWritten += inserts.length * numCols;
+  }
+
+  const result = {
+    status: "success",
+    message: `Perubahan berhasil ditulis ke sheet '${request.sheetName}'.`,
+    rowsWritten: request.expectedRows - deleted + inserts.length,
+    rowsDeleted: deleted,
+    cellsWritten: cellsWritten,
+  };
+  properties.setProperty(key, JSON.stringify({ deltaId: request.deltaId, result: result }));
+  markSheetWriter(properties, request.spreadsheetId, request.sheetName, "delta:" + request.deltaId);
+  return result;
+}
+
+/**
+ * Mengambil isi request append/delta (payload JSON yang di-gzip lalu base64, atau "rows" biasa).
+ */
+function decodeRows(request) {
+  if (request.encoding === "gzip+base64") {
+    const compressed = Utilities.newBlob(Utilities.base64Decode(request.payload), "application/x-gzip");
+    return JSON.parse(Utilities.ungzip(compressed).getDataAsString("UTF-8"));
+  }
+  return request.rows || [];
 }
 
 /**
@@ -94,3 +347,29 @@ function testDoPost() {
   const result = doPost(testData);
   Logger.log(result.getContent());
 }
+
+/**
+ * Fungsi test untuk upload per chunk (init -> append gzip -> finalize).
+ */
+function testChunkedUpload() {
+  const post = (body) => JSON.parse(doPost({ postData: { contents: JSON.stringify(body) } }).getContent());
+  const uploadId = "test-" + Date.now();
+  const gzipRows = (rows) =>
+    Utilities.base64Encode(Utilities.gzip(Utilities.newBlob(JSON.stringify(rows), "application/json")).getBytes());
+
+  Logger.log(post({
+    action: "init",
+    uploadId: uploadId,
+    spreadsheetId: "YOUR_SPREADSHEET_ID_HERE", // Ganti dengan ID spreadsheet test Anda
+    sheetName: "TestSheet",
+    header: ["Nama Dosen", "Judul", "Tahun"],
+    totalRows: 3,
+    totalChunks: 2,
+  }));
+  Logger.log(post({ action: "append", uploadId: uploadId, chunkIndex: 0, offset: 0, encoding: "gzip+base64",
+    payload: gzipRows([["Bambang Riyanto", "Machine Learning Research", "2023"],
+                       ["Siti Nurhaliza", "Data Mining Applications", "2022"]]) }));
+  Logger.log(post({ action: "append", uploadId: uploadId, chunkIndex: 1, offset: 2, encoding: "gzip+base64",
+    payload: gzipRows([["Ahmad Dahlan", "Deep Learning Methods", "2024"]]) }));
+  Logger.log(post({ action: "finalize", uploadId: uploadId, totalRows: 3 }));
+}
@@ -0,0 +1,123 @@
+"""
+Benchmark pembuatan ringkasan DOCX (generate_summary_docx) pada data publikasi sintetis.
+
+Membandingkan cara lama (table.add_row() per publikasi dengan iterrows) dengan tabel yang
+dibangun sekaligus sebagai XML, serta pembuatan DOCX terpisah per kelompok secara paralel
+(generate_summary_docx_parts). Isi tabel kedua cara juga dibandingkan.
+
+Usage:
+    python benchmark_docx.py                       # 300 dosen x 40 publikasi
+    python benchmark_docx.py --dosen 1000 --publikasi 50
+    python benchmark_docx.py --parts 100 --workers 4
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import pandas as pd
+from docx import Document
+
+from src.core_logic import file_handler
+
+
+def make_publications(num_dosen: int, per_dosen: int) -> pd.DataFrame:
+    """
+    Membuat DataFrame publikasi sintetis.
+
+    Args:
+        num_dosen (int): Jumlah dosen
+        per_dosen (int): Jumlah publikasi per dosen
+
+    Returns:
+        pd.DataFrame: Kolom Judul, Venue, Tahun, Sitasi, Nama Dosen
+    """
+    rng = random.Random(42)
+    words = ["analisis", "sistem", "model", "data", "jaringan", "pembelajaran", "optimasi", "metode"]
+    rows = []
+    for d in range(num_dosen):
+        for p in range(per_dosen):
+            rows.append({
+                'Judul': " ".join(rng.choice(words) for _ in range(rng.randint(4, 12))).capitalize(),
+                'Venue': f"Jurnal {rng.choice(words).capitalize()} {rng.randint(1, 20)}",
+                'Tahun': str(rng.randint(2000, 2025)),
+                'Sitasi': str(rng.randint(0, 300)),
+                'Nama Dosen': f"Dosen {d:04d}",
+            })
+    return pd.DataFrame(rows)
+
+
+def legacy_summary_docx(df: pd.DataFrame, filename: str) -> str:
+    """
+    Cara lama: satu table.add_row() per publikasi dari group.iterrows() (sebagai pembanding).
+    """
+    doc = Document()
+    doc.add_heading('Ringkasan Publikasi Google Scholar', 0)
+    for dosen_name, group in df.groupby('Nama Dosen'):
+        doc.add_heading(f'{dosen_name}', level=1)
+        table = doc.add_table(rows=1, cols=4)
+        table.style = 'Light Grid Accent 1'
+        hdr_cells = table.rows[0].cells
+        for cell, text in zip(hdr_cells, ('No', 'Judul', 'Venue', 'Tahun')):
+            cell.text = text
+        for idx, (_, row) in enumerate(group.iterrows(), 1):
+            row_cells = table.add_row().cells
+            row_cells[0].text = str(idx)
+            row_cells[1].text = str(row.get('Judul', ''))
+            row_cells[2].text = str(row.get('Venue', ''))
+            row_cells[3].text = str(row.get('Tahun', ''))
+    doc.save(filename)
+    return filename
+
+
+def table_texts(path: str) -> list:
+    """
+    Isi semua tabel dalam dokumen sebagai list baris teks.
+    """
+    return [[cell.text for cell in row.cells] for table in Document(path).tables for row in table.rows]
+
+
+def timed(label: str, func, *args):
+    """
+    Menjalankan func dan menampilkan durasinya.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:>8.2f} s")
+    return result, elapsed
+
+
+def main():
+    """Main entry point dengan argparse."""
+    parser = argparse.ArgumentParser(description="Benchmark pembuatan ringkasan DOCX")
+    parser.add_argument('--dosen', type=int, default=300, help="Jumlah dosen")
+    parser.add_argument('--publikasi', type=int, default=40, help="Jumlah publikasi per dosen")
+    parser.add_argument('--parts', type=int, default=50, help="Dosen per file untuk DOCX terpisah")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses DOCX terpisah (default: CPU)")
+    parser.add_argument('--skip-legacy', action='store_true', help="Lewati cara lama (lambat untuk data besar)")
+    args = parser.parse_args()
+
+    df = make_publications(args.dosen, args.publikasi)
+    print(f"Benchmark DOCX: {args.dosen} dosen x {args.publikasi} publikasi = {len(df)} baris\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bulk_path, bulk_time = timed("Tabel XML sekaligus (generate_summary_docx)",
+                                     file_handler.generate_summary_docx, df, os.path.join(tmp, "bulk.docx"))
+
+        if not args.skip_legacy:
+            legacy_path, legacy_time = timed("Cara lama (add_row + iterrows)",
+                                             legacy_summary_docx, df, os.path.join(tmp, "legacy.docx"))
+            same = "sama" if table_texts(bulk_path) == table_texts(legacy_path) else "BERBEDA"
+            print(f"{'Speedup':<40} {legacy_time / bulk_time:>7.1f}x  (isi tabel {same})")
+
+        paths, _ = timed(f"DOCX terpisah ({args.parts} dosen/file, paralel)",
+                         file_handler.generate_summary_docx_parts, df, os.path.join(tmp, "parts"),
+                         None, args.parts, args.workers)
+        print(f"{'':<40} {len(paths):>8} file")
+
+
+if __name__ == "__main__":
+    main()
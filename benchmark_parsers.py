@@ -0,0 +1,125 @@
+"""
+Benchmark parser HTML (SoupParser vs LxmlParser) pada halaman Google Scholar yang tersimpan.
+
+Halaman dibaca dari folder cache halaman (cache/pages, file .html.gz hasil PageCache)
+atau folder berisi file .html biasa. Setiap halaman dikenali sebagai halaman profil,
+detail, atau pencarian, lalu di-parse berulang kali oleh kedua parser. Output kedua
+parser juga dibandingkan.
+
+Usage:
+    python benchmark_parsers.py                     # Pakai cache/pages
+    python benchmark_parsers.py --pages saved_html  # Folder berisi file .html
+    python benchmark_parsers.py --repeat 20
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+
+from src.core_logic.parsers import PARSERS
+
+
+def load_pages(pages_dir: str) -> dict:
+    """
+    Membaca semua halaman tersimpan dan mengelompokkannya per jenis.
+
+    Args:
+        pages_dir (str): Folder halaman (.html atau .html.gz)
+
+    Returns:
+        dict: {'profile': [...], 'detail': [...], 'search': [...]}
+    """
+    pages = {'profile': [], 'detail': [], 'search': []}
+
+    for root, _, files in os.walk(pages_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            if name.endswith('.html.gz'):
+                with gzip.open(path, 'rt', encoding='utf-8') as f:
+                    f.readline()  # Baris pertama cache adalah metadata JSON
+                    html = f.read()
+            elif name.endswith('.html'):
+                with open(path, 'r', encoding='utf-8') as f:
+                    html = f.read()
+            else:
+                continue
+
+            if 'gsc_oci_table' in html:
+                pages['detail'].append(html)
+            elif 'gsc_a_tr' in html:
+                pages['profile'].append(html)
+            elif 'gs_rt2' in html:
+                pages['search'].append(html)
+
+    return pages
+
+
+def run_parser(parser, page_type: str, html: str):
+    """
+    Menjalankan method parser yang sesuai dengan jenis halaman.
+    """
+    if page_type == 'profile':
+        return parser.parse_profile_rows(html), parser.has_more_publications(html)
+    if page_type == 'detail':
+        return parser.parse_detail(html)
+    return parser.parse_search_profile_url(html)
+
+
+def benchmark(pages: dict, repeat: int):
+    """
+    Mengukur waktu parsing per jenis halaman untuk setiap parser dan menampilkan speedup.
+
+    Args:
+        pages (dict): Halaman per jenis (hasil load_pages)
+        repeat (int): Jumlah pengulangan parsing per halaman
+    """
+    parsers = {name: cls() for name, cls in PARSERS.items()}
+
+    print(f"{'Jenis':<10} {'Halaman':>8} " + " ".join(f"{name + ' (ms)':>12}" for name in parsers) + f" {'Speedup':>9}  Output")
+    print("-" * 70)
+
+    for page_type, htmls in pages.items():
+        if not htmls:
+            continue
+
+        timings = {}
+        outputs = {}
+        for name, parser in parsers.items():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                result = [run_parser(parser, page_type, html) for html in htmls]
+            timings[name] = (time.perf_counter() - start) / (repeat * len(htmls)) * 1000
+            outputs[name] = result
+
+        speedup = timings['bs4'] / timings['lxml'] if timings['lxml'] else 0
+        same = "sama" if outputs['bs4'] == outputs['lxml'] else "BERBEDA"
+        print(f"{page_type:<10} {len(htmls):>8} " + " ".join(f"{timings[name]:>12.3f}" for name in parsers)
+              + f" {speedup:>8.1f}x  {same}")
+
+
+def main():
+    """Main entry point dengan argparse."""
+    parser = argparse.ArgumentParser(description="Benchmark parser HTML Google Scholar")
+    parser.add_argument('--pages', default="cache/pages", help="Folder halaman tersimpan (.html / .html.gz)")
+    parser.add_argument('--repeat', type=int, default=5, help="Jumlah pengulangan per halaman")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.pages):
+        print(f"ERROR: Folder tidak ditemukan: {args.pages}")
+        print("Jalankan scraping dengan cache aktif terlebih dahulu, atau gunakan --pages")
+        sys.exit(1)
+
+    pages = load_pages(args.pages)
+    total = sum(len(htmls) for htmls in pages.values())
+    if total == 0:
+        print(f"ERROR: Tidak ada halaman Google Scholar di {args.pages}")
+        sys.exit(1)
+
+    print(f"Benchmark {total} halaman dari {args.pages} ({args.repeat}x pengulangan)\n")
+    benchmark(pages, max(1, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
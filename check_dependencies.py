@@ -22,6 +22,13 @@ def check_dependencies():
         'dotenv': 'python-dotenv>=1.0.0'
     }
     
+    # Package opsional: fitur tetap jalan tanpa package ini
+    optional_dependencies = {
+        'psutil': 'psutil (recycle Chrome berdasarkan pemakaian memori)',
+        'pyarrow': 'pyarrow (output Parquet)',
+        'xlsxwriter': 'xlsxwriter (penulisan Excel lebih cepat)'
+    }
+    
     print("=" * 60)
     print("CHECKING DEPENDENCIES")
     print("=" * 60)
@@ -35,6 +42,13 @@ def check_dependencies():
             missing_packages.append(package_name)
             print(f"❌ {package_name} - MISSING")
     
+    for module_name, description in optional_dependencies.items():
+        try:
+            __import__(module_name)
+            print(f"✅ {description}")
+        except ImportError:
+            print(f"⚪ {description} - opsional, tidak terinstall")
+    
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
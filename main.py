@@ -6,13 +6,21 @@ Usage:
     python main.py              # Mode CLI (default)
     python main.py --gui        # Mode GUI
     python main.py --cli        # Mode CLI (explicit)
+    python main.py --shards 4   # Mode CLI multi-proses (4 proses scraper)
+    python main.py --coordinator / --worker  # Job queue bersama untuk beberapa mesin
 """
 
 import os
 import sys
 import argparse
+import multiprocessing
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
+import pandas as pd
+
 # Tambahkan path src ke sys.path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -20,11 +28,19 @@ from core_logic.file_handler import (
     read_dosen_from_file,
     save_to_csv,
     save_to_excel,
+    save_to_parquet,
     generate_summary_docx,
+    generate_summary_docx_parts,
+    export_from_store,
     ensure_output_directory
 )
 from core_logic.utils import clean_dosen_name
 from core_logic.scraper import GoogleScholarScraper
+from core_logic.checkpoint import CheckpointJournal, journal_path_for
+from core_logic.sinks import create_sink, publications_to_dataframe
+from core_logic.job_queue import JobQueue
+from core_logic.result_store import ResultStore
+from core_logic.logger import merge_session_summaries
 
 
 # ==================== KONFIGURASI CLI ====================
@@ -32,22 +48,95 @@ INPUT_FILE_PATH = "input/daftar_dosen.csv"
 OUTPUT_DIR = "output"
 HEADLESS_MODE = False
 WAIT_TIME = 10
+NUM_WORKERS = 1  # Jumlah browser Chrome paralel
+FETCH_MODE = "selenium"  # "selenium" atau "http" (Chrome hanya dipakai saat CAPTCHA)
+PAGINATION = "url"  # "url" (cstart/pagesize, 100 baris per halaman) atau "click" (tombol 'Tampilkan lainnya')
+DETAIL_CONCURRENCY = 4  # Jumlah halaman detail yang diambil bersamaan (thread HTTP / tab browser)
+PIPELINE = "sync"  # "sync" (per dosen) atau "async" (pipeline asyncio, fetch tumpang tindih antar dosen)
+PIPELINE_CONCURRENCY = 8  # Total fetch bersamaan pada pipeline "async"
+PER_HOST_LIMIT = 4  # Fetch bersamaan maksimal per host pada pipeline "async"
+PARSER = "lxml"  # Parser HTML: "lxml" (cepat) atau "bs4" (BeautifulSoup, referensi)
+CACHE_DIR = "cache/pages"  # Cache HTML di disk (None = nonaktif)
+CACHE_MAX_MB = 500  # Ukuran maksimal cache sebelum halaman lama dihapus
+CACHE_ONLY = False  # True = replay dari cache tanpa akses jaringan (lihat --cache-only)
+PROFILE_ID_CACHE = "cache/profile_ids.json"  # Cache nama dosen -> profil (None = selalu cari ulang)
+PROFILE_OVERRIDES_FILE = "input/profile_overrides.csv"  # Override manual (kolom: Nama, Profil)
+SNAPSHOT_DIR = "cache/snapshots"  # Snapshot publikasi per dosen dari run terakhir
+INCREMENTAL = False  # True = detail hanya diambil untuk publikasi baru/berubah (lihat --incremental)
+RATE_LIMIT_PER_MINUTE = 30  # Laju awal fetch (halaman/menit); naik/turun otomatis (None = tanpa rate limit)
+RATE_LIMIT_MIN = 4  # Laju minimal setelah CAPTCHA/timeout
+RATE_LIMIT_MAX = 120  # Laju maksimal
+LEAN_DRIVER = True  # Chrome tanpa gambar/CSS/font dan pageLoadStrategy 'eager'
+CHROME_PROFILE_DIR = "cache/chrome_profile"  # Profil Chrome persisten per worker (cookies bertahan; None = sementara)
+NUM_SHARDS = 1  # Jumlah proses scraper untuk daftar dosen yang sangat besar (lihat --shards)
+FILE_FORMATS = ('csv', 'excel', 'docx', 'parquet')
+OUTPUT_FORMATS = ('csv', 'excel', 'docx')  # Kombinasi 'csv', 'excel', 'docx', 'parquet' (lihat --formats)
+DOCX_LECTURERS_PER_FILE = None  # Pecah ringkasan DOCX per N dosen, dibuat paralel (None = satu file)
+STREAM_FORMAT = None  # "csv", "jsonl", atau "parquet": publikasi ditulis ke file setiap dosen selesai (lihat --stream)
+RESULT_STORE_PATH = None  # Database hasil, mis. "output/results.db" (upsert per dosen, riwayat, --export; None = nonaktif)
+JOB_QUEUE_PATH = "cache/job_queue.db"  # Database job queue coordinator/worker (taruh di folder bersama untuk multi-mesin)
+JOB_LEASE_SECONDS = 300  # Lease tugas; tugas kembali ke antrian jika worker berhenti mengirim heartbeat
+JOB_MAX_ATTEMPTS = 3  # Percobaan maksimal per dosen sebelum ditandai gagal
+JOB_POLL_SECONDS = 10  # Jeda pengecekan progres coordinator / antrian kosong pada worker
 # ========================================================
 
 
-def run_cli():
-    """Menjalankan aplikasi dalam mode CLI."""
-    print("=" * 70)
-    print("GOOGLE SCHOLAR SCRAPER - MODE CLI")
-    print("=" * 70)
-    print()
+def build_scraper(cache_only: bool, incremental: bool,
+                  user_data_dir: str = CHROME_PROFILE_DIR, rate_share: int = 1) -> GoogleScholarScraper:
+    """
+    Membuat GoogleScholarScraper dari konfigurasi CLI.
+    
+    Args:
+        cache_only (bool): Jalankan parser ulang dari cache tanpa akses jaringan
+        incremental (bool): Ambil halaman detail hanya untuk publikasi baru/berubah
+        user_data_dir (str): Folder profil Chrome (tiap shard memakai folder sendiri)
+        rate_share (int): Jumlah proses yang berbagi IP yang sama; RATE_LIMIT_* dibagi rata
+                          agar total laju semua proses tetap sesuai konfigurasi
+        
+    Returns:
+        GoogleScholarScraper: Instance scraper
+    """
+    rate_share = max(1, rate_share)
+    return GoogleScholarScraper(
+        headless=HEADLESS_MODE,
+        wait_time=WAIT_TIME,
+        num_workers=NUM_WORKERS,
+        fetch_mode=FETCH_MODE,
+        pagination=PAGINATION,
+        detail_concurrency=DETAIL_CONCURRENCY,
+        pipeline=PIPELINE,
+        pipeline_concurrency=PIPELINE_CONCURRENCY,
+        per_host_limit=PER_HOST_LIMIT,
+        parser=PARSER,
+        cache_dir=CACHE_DIR,
+        cache_max_mb=CACHE_MAX_MB,
+        cache_only=cache_only,
+        profile_cache_path=PROFILE_ID_CACHE,
+        profile_overrides_path=PROFILE_OVERRIDES_FILE,
+        snapshot_dir=SNAPSHOT_DIR,
+        incremental=incremental,
+        rate_per_minute=RATE_LIMIT_PER_MINUTE / rate_share if RATE_LIMIT_PER_MINUTE else None,
+        min_rate_per_minute=RATE_LIMIT_MIN / rate_share,
+        max_rate_per_minute=RATE_LIMIT_MAX / rate_share,
+        lean_driver=LEAN_DRIVER,
+        user_data_dir=user_data_dir,
+        result_store_path=RESULT_STORE_PATH
+    )
+
+
+def _read_cli_input() -> list:
+    """
+    Langkah 1-3 mode CLI: memeriksa, membaca, dan membersihkan nama dosen dari INPUT_FILE_PATH.
     
+    Returns:
+        list: Nama dosen yang sudah dibersihkan, atau None jika file tidak ada/gagal dibaca/kosong
+    """
     # Step 1: Validasi file input
     print(f"[1/6] Memeriksa file input: {INPUT_FILE_PATH}")
     if not os.path.exists(INPUT_FILE_PATH):
         print(f"ERROR: File tidak ditemukan: {INPUT_FILE_PATH}")
         print(f"Silakan buat file tersebut atau ubah INPUT_FILE_PATH di main.py")
-        return
+        return None
     
     # Step 2: Baca nama dosen dari file
     print(f"[2/6] Membaca daftar nama dosen...")
@@ -56,11 +145,11 @@ def run_cli():
         print(f"      Berhasil membaca {len(dosen_names_raw)} nama dosen")
     except Exception as e:
         print(f"ERROR: Gagal membaca file: {e}")
-        return
+        return None
     
     if not dosen_names_raw:
         print("ERROR: Tidak ada nama dosen dalam file")
-        return
+        return None
     
     # Step 3: Bersihkan nama
     print(f"[3/6] Membersihkan nama dari gelar akademis...")
@@ -73,29 +162,92 @@ def run_cli():
         print(f"      ... dan {len(dosen_names_raw) - 3} nama lainnya")
     print()
     
+    return dosen_names_clean
+
+
+def run_cli(cache_only: bool = False, incremental: bool = False, resume_session_id: str = None,
+            stream_format: str = None, formats: tuple = None):
+    """
+    Menjalankan aplikasi dalam mode CLI.
+    
+    Args:
+        cache_only (bool): Jalankan parser ulang dari cache tanpa akses jaringan
+        incremental (bool): Ambil halaman detail hanya untuk publikasi baru/berubah
+        resume_session_id (str): Session ID yang dilanjutkan (dosen yang sudah selesai dilewati)
+        stream_format (str): 'csv', 'jsonl', atau 'parquet' untuk menulis hasil ke file setiap
+                             dosen selesai tanpa menyimpan semua publikasi di memori
+        formats (tuple): Format file akhir (default: OUTPUT_FORMATS)
+    """
+    cache_only = cache_only or CACHE_ONLY
+    formats = tuple(formats or OUTPUT_FORMATS)
+    incremental = incremental or INCREMENTAL
+    stream_format = stream_format or STREAM_FORMAT
+    
+    print("=" * 70)
+    print("GOOGLE SCHOLAR SCRAPER - MODE CLI")
+    print("=" * 70)
+    print()
+    
+    # Resume: daftar dosen diambil dari journal session, sehingga session dari GUI (file input
+    # lain) tetap dilanjutkan dengan dosen yang sama; journal lama tanpa daftar memakai file input
+    saved_session = None
+    if resume_session_id:
+        saved_session = CheckpointJournal(journal_path_for(resume_session_id)).load_session()
+    if saved_session:
+        dosen_names_clean = saved_session['dosen']
+        print(f"[1/6] Daftar dosen dari journal session {resume_session_id}: {len(dosen_names_clean)} nama")
+        print()
+    else:
+        dosen_names_clean = _read_cli_input()
+        if dosen_names_clean is None:
+            return
+    
     # Step 4: Scraping
     print(f"[4/6] Memulai scraping...")
     print(f"      Mode: {'Headless' if HEADLESS_MODE else 'Browser visible'}")
     print(f"      Timeout: {WAIT_TIME} detik")
+    print(f"      Worker: {NUM_WORKERS}")
+    print(f"      Fetch: {FETCH_MODE}")
+    print(f"      Cache: {CACHE_DIR or 'nonaktif'}{' (cache-only)' if cache_only else ''}")
+    print(f"      Incremental: {'ya' if incremental else 'tidak'}")
+    if resume_session_id:
+        print(f"      Resume session: {resume_session_id}")
+    if stream_format:
+        print(f"      Stream: {stream_format}")
     print()
     
-    scraper = GoogleScholarScraper(headless=HEADLESS_MODE, wait_time=WAIT_TIME)
+    scraper = build_scraper(cache_only, incremental)
+    base_path = _output_base_path()
+    
+    # Mode stream: publikasi langsung ditulis ke file, DataFrame hanya dibangun jika dibutuhkan
+    try:
+        sink = create_sink(stream_format, base_path) if stream_format else None
+    except (ValueError, ImportError) as e:
+        print(f"ERROR: {e}")
+        return
     
     try:
-        df_results = scraper.run_scraper(dosen_names_clean)
+        df_results = scraper.run_scraper(dosen_names_clean, resume_session_id=resume_session_id,
+                                         sink=sink, return_dataframe=sink is None)
     except Exception as e:
         print(f"ERROR: {e}")
         return
+    finally:
+        if sink:
+            sink.close()
     
     # Step 5: Validasi
+    total = sink.rows if sink else len(df_results)
     print()
-    print(f"[5/6] Scraping selesai! Total: {len(df_results)} publikasi")
+    print(f"[5/6] Scraping selesai! Total: {total} publikasi")
     
-    if len(df_results) == 0:
+    if total == 0:
         print("      PERINGATAN: Tidak ada data")
         return
     
-    if 'Nama Dosen' in df_results.columns:
+    if sink:
+        print(f"      ✓ Stream {stream_format.upper()}: {os.path.basename(sink.path)} ({sink.lecturers} dosen)")
+    elif 'Nama Dosen' in df_results.columns:
         print("\n      Statistik:")
         stats = df_results.groupby('Nama Dosen').size().sort_values(ascending=False)
         for dosen, count in stats.items():
@@ -104,31 +256,403 @@ def run_cli():
     # Step 6: Simpan
     print()
     print(f"[6/6] Menyimpan hasil...")
-    
+    if df_results is None:
+        df_results = sink.to_dataframe()
+    # File stream sudah berisi format yang sama; tidak perlu ditulis dua kali
+    formats = tuple(fmt for fmt in formats if fmt != stream_format)
+    save_results(df_results, base_path=base_path, formats=formats)
+
+
+def _output_base_path() -> str:
+    """
+    Returns:
+        str: Path output tanpa ekstensi: OUTPUT_DIR/publikasi_<nama file input>_<timestamp>
+    """
     output_dir = ensure_output_directory(OUTPUT_DIR)
     input_filename = os.path.splitext(os.path.basename(INPUT_FILE_PATH))[0]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    base_filename = f"publikasi_{input_filename}_{timestamp}"
+    return os.path.join(output_dir, f"publikasi_{input_filename}_{timestamp}")
+
+
+def save_results(df_results: pd.DataFrame, dosen_names: list = None, base_path: str = None,
+                 formats: tuple = None):
+    """
+    Menyimpan hasil ke CSV, Excel, DOCX summary, dan/atau Parquet di OUTPUT_DIR.
+    Hasil run disimpan dari df_results. Hanya jika df_results None (run_export) file diekspor
+    dari result store: data terbaru setiap dosen di dosen_names, termasuk hasil run lama.
+    
+    Args:
+        df_results (pd.DataFrame): Hasil scraping (None = ekspor dari result store)
+        dosen_names (list): Dosen yang diekspor dari result store, sesuai urutan input
+        base_path (str): Path output tanpa ekstensi (default: path baru dengan timestamp)
+        formats (tuple): Kombinasi 'csv', 'excel', 'docx', 'parquet' (default: OUTPUT_FORMATS)
+    """
+    formats = OUTPUT_FORMATS if formats is None else formats
+    base_path = base_path or _output_base_path()
+    output_dir = os.path.dirname(base_path)
+    
+    if df_results is None:
+        try:
+            paths = export_from_store(ResultStore(RESULT_STORE_PATH), base_path,
+                                      dosen_names=dosen_names, formats=formats,
+                                      docx_lecturers_per_file=DOCX_LECTURERS_PER_FILE)
+        except Exception as e:
+            print(f"ERROR: {e}")
+            return
+        if not paths:
+            print(f"      PERINGATAN: Tidak ada data di {RESULT_STORE_PATH} untuk dosen ini")
+            return
+        print(f"      🗄️  Diekspor dari {RESULT_STORE_PATH}")
+        for label, path in (('CSV', paths.get('csv')), ('Excel', paths.get('excel')),
+                            ('DOCX', paths.get('docx')), ('Parquet', paths.get('parquet'))):
+            if path:
+                print(f"      ✓ {label}: {os.path.basename(path)}")
+    else:
+        _save_dataframe(df_results, base_path, formats)
+    
+    print()
+    print("=" * 70)
+    print("SELESAI!")
+    print("=" * 70)
+    print(f"Output: {output_dir}")
+    print()
+
+
+def _save_dataframe(df_results: pd.DataFrame, base_path: str, formats: tuple = ('csv', 'excel', 'docx')):
+    """
+    Menyimpan DataFrame hasil run langsung ke CSV, Excel, DOCX, dan/atau Parquet (tanpa result store).
     
+    Args:
+        df_results (pd.DataFrame): Hasil scraping
+        base_path (str): Path output tanpa ekstensi
+        formats (tuple): Kombinasi 'csv', 'excel', 'docx', 'parquet'
+    """
     try:
-        csv_path = save_to_csv(df_results, os.path.join(output_dir, f"{base_filename}.csv"))
-        print(f"      ✓ CSV: {os.path.basename(csv_path)}")
+        if 'csv' in formats:
+            csv_path = save_to_csv(df_results, f"{base_path}.csv")
+            print(f"      ✓ CSV: {os.path.basename(csv_path)}")
         
-        excel_path = save_to_excel(df_results, os.path.join(output_dir, f"{base_filename}.xlsx"))
-        print(f"      ✓ Excel: {os.path.basename(excel_path)}")
+        if 'excel' in formats:
+            excel_path = save_to_excel(df_results, f"{base_path}.xlsx")
+            print(f"      ✓ Excel: {os.path.basename(excel_path)}")
         
-        docx_path = generate_summary_docx(df_results, os.path.join(output_dir, f"{base_filename}_summary.docx"))
-        print(f"      ✓ DOCX: {os.path.basename(docx_path)}")
+        if 'docx' in formats and DOCX_LECTURERS_PER_FILE:
+            docx_paths = generate_summary_docx_parts(df_results, f"{base_path}_summary",
+                                                     lecturers_per_part=DOCX_LECTURERS_PER_FILE)
+            print(f"      ✓ DOCX: {len(docx_paths)} file di {os.path.basename(base_path)}_summary/")
+        elif 'docx' in formats:
+            docx_path = generate_summary_docx(df_results, f"{base_path}_summary.docx")
+            print(f"      ✓ DOCX: {os.path.basename(docx_path)}")
+        
+        if 'parquet' in formats:
+            parquet_path = save_to_parquet(df_results, f"{base_path}.parquet")
+            print(f"      ✓ Parquet: {os.path.basename(parquet_path)}")
     except Exception as e:
         print(f"ERROR: {e}")
+
+
+def _run_shard(shard_id: int, dosen_names: list, shard_dir: str, run_id: str,
+               cache_only: bool, incremental: bool, num_shards: int = 1) -> dict:
+    """
+    Menjalankan satu shard di proses terpisah: scraper sendiri, profil Chrome sendiri,
+    dan session log '<run_id>_shard<id>'. Hasil ditulis ke shard_<id>.pkl.
+    Semua shard memakai IP yang sama, sehingga laju fetch tiap shard adalah
+    RATE_LIMIT_* dibagi num_shards.
+    
+    Args:
+        shard_id (int): Nomor shard
+        dosen_names (list): Nama dosen (sudah dibersihkan) untuk shard ini
+        shard_dir (str): Folder file hasil parsial
+        run_id (str): ID run sharded (dipakai juga untuk resume)
+        cache_only (bool): Jalankan parser ulang dari cache tanpa akses jaringan
+        incremental (bool): Ambil halaman detail hanya untuk publikasi baru/berubah
+        num_shards (int): Jumlah shard yang berjalan bersamaan
+        
+    Returns:
+        dict: shard_id, session_id, result_path, rows
+    """
+    session_id = f"{run_id}_shard{shard_id}"
+    user_data_dir = os.path.join(CHROME_PROFILE_DIR, f"shard_{shard_id}") if CHROME_PROFILE_DIR else None
+    scraper = build_scraper(cache_only, incremental, user_data_dir=user_data_dir, rate_share=num_shards)
+    
+    # Session lama dilanjutkan jika journal shard ini sudah ada (run_id yang sama = resume)
+    resume = os.path.isdir(os.path.join("logging", f"session_{session_id}"))
+    df = scraper.run_scraper(dosen_names,
+                             resume_session_id=session_id if resume else None,
+                             session_id=session_id)
+    
+    result_path = os.path.join(shard_dir, f"shard_{shard_id}.pkl")
+    df.to_pickle(result_path)
+    return {'shard_id': shard_id, 'session_id': session_id, 'result_path': result_path, 'rows': len(df)}
+
+
+def merge_shard_results(result_paths: list, dosen_order: list) -> pd.DataFrame:
+    """
+    Menggabungkan hasil parsial semua shard menjadi satu DataFrame dengan urutan dosen
+    sesuai file input.
+    
+    Args:
+        result_paths (list): Path file shard_<id>.pkl
+        dosen_order (list): Nama dosen sesuai urutan input
+        
+    Returns:
+        pd.DataFrame: Hasil gabungan
+    """
+    frames = [pd.read_pickle(path) for path in result_paths]
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    
+    merged = pd.concat(frames, ignore_index=True, sort=False)
+    
+    # Kolom tahun yang tidak ada di salah satu shard bernilai 0, bukan NaN
+    cited_cols = [col for col in merged.columns if str(col).endswith('_cited_by')]
+    if cited_cols:
+        merged[cited_cols] = merged[cited_cols].fillna(0).astype(int)
+        other_cols = [col for col in merged.columns if col not in cited_cols]
+        merged = merged[other_cols + sorted(cited_cols)]
+    
+    if 'Nama Dosen' in merged.columns:
+        position = {name: i for i, name in enumerate(dosen_order)}
+        merged['_urutan'] = merged['Nama Dosen'].map(position)
+        merged = (merged.sort_values('_urutan', kind='stable')
+                  .drop(columns='_urutan')
+                  .reset_index(drop=True))
+    return merged
+
+
+def run_sharded(num_shards: int, cache_only: bool = False, incremental: bool = False,
+                resume_run_id: str = None, formats: tuple = None):
+    """
+    Menjalankan CLI dengan beberapa proses scraper. Daftar dosen dibagi round-robin ke
+    num_shards proses; tiap proses menulis hasil parsial, lalu hasil digabung menjadi satu
+    CSV/XLSX/DOCX dan satu summary log gabungan.
+    
+    Args:
+        num_shards (int): Jumlah proses
+        cache_only (bool): Jalankan parser ulang dari cache tanpa akses jaringan
+        incremental (bool): Ambil halaman detail hanya untuk publikasi baru/berubah
+        resume_run_id (str): ID run sharded yang dilanjutkan (jumlah shard harus sama)
+        formats (tuple): Format file akhir (default: OUTPUT_FORMATS)
+    """
+    cache_only = cache_only or CACHE_ONLY
+    incremental = incremental or INCREMENTAL
+    
+    print("=" * 70)
+    print(f"GOOGLE SCHOLAR SCRAPER - MODE CLI ({num_shards} SHARD)")
+    print("=" * 70)
+    print()
+    
+    if not os.path.exists(INPUT_FILE_PATH):
+        print(f"ERROR: File tidak ditemukan: {INPUT_FILE_PATH}")
         return
     
+    try:
+        dosen_names = [clean_dosen_name(name) for name in read_dosen_from_file(INPUT_FILE_PATH)]
+    except Exception as e:
+        print(f"ERROR: Gagal membaca file: {e}")
+        return
+    
+    if not dosen_names:
+        print("ERROR: Tidak ada nama dosen dalam file")
+        return
+    
+    num_shards = max(1, min(num_shards, len(dosen_names)))
+    run_id = resume_run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+    shard_dir = os.path.join(ensure_output_directory(OUTPUT_DIR), f"shards_{run_id}")
+    os.makedirs(shard_dir, exist_ok=True)
+    
+    # Round-robin agar dosen dengan banyak publikasi tidak menumpuk di satu shard
+    shards = [dosen_names[i::num_shards] for i in range(num_shards)]
+    print(f"🧩 Run {run_id}: {len(dosen_names)} dosen dibagi ke {num_shards} proses")
+    for i, names in enumerate(shards):
+        print(f"   Shard {i}: {len(names)} dosen")
+    if RATE_LIMIT_PER_MINUTE and not cache_only:
+        print(f"🚦 Rate limit dibagi ke {num_shards} shard: "
+              f"{RATE_LIMIT_PER_MINUTE / num_shards:.1f} halaman/menit per shard")
     print()
+    
+    results = []
+    # 'spawn' agar tiap proses mulai bersih (tanpa thread/driver warisan dari proses induk)
+    with ProcessPoolExecutor(max_workers=num_shards,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = {
+            executor.submit(_run_shard, i, names, shard_dir, run_id, cache_only, incremental, num_shards): i
+            for i, names in enumerate(shards)
+        }
+        for future in as_completed(futures):
+            shard_id = futures[future]
+            try:
+                result = future.result()
+                results.append(result)
+                print(f"✅ Shard {shard_id} selesai: {result['rows']} publikasi")
+            except Exception as e:
+                print(f"❌ Shard {shard_id} gagal: {e}")
+    
+    if len(results) < num_shards:
+        print(f"⚠️ {num_shards - len(results)} shard gagal; jalankan ulang dengan --shards {num_shards} --resume {run_id}")
+    
+    results.sort(key=lambda r: r['shard_id'])
+    merge_session_summaries(
+        [os.path.join("logging", f"session_{r['session_id']}") for r in results],
+        session_id=run_id
+    )
+    
+    df_results = merge_shard_results([r['result_path'] for r in results], dosen_names)
+    print()
+    print(f"🧩 Hasil gabungan: {len(df_results)} publikasi dari {len(results)} shard")
+    if df_results.empty:
+        print("      PERINGATAN: Tidak ada data")
+        return
+    save_results(df_results, formats=formats)
+
+
+def _read_clean_names() -> list:
+    """
+    Membaca dan membersihkan nama dosen dari INPUT_FILE_PATH.
+    
+    Returns:
+        list: Nama dosen yang sudah dibersihkan (kosong jika file tidak ada/gagal dibaca)
+    """
+    if not os.path.exists(INPUT_FILE_PATH):
+        print(f"ERROR: File tidak ditemukan: {INPUT_FILE_PATH}")
+        return []
+    try:
+        return [clean_dosen_name(name) for name in read_dosen_from_file(INPUT_FILE_PATH)]
+    except Exception as e:
+        print(f"ERROR: Gagal membaca file: {e}")
+        return []
+
+
+def run_coordinator(queue_path: str = JOB_QUEUE_PATH, job_id: str = None, formats: tuple = None):
+    """
+    Mode coordinator: membuat job (satu tugas per dosen) di job queue, menunggu worker
+    menyelesaikan semua tugas, lalu menyimpan hasil gabungan ke CSV/Excel/DOCX.
+    Jika job_id sudah ada di queue, coordinator hanya menunggu dan menyimpan hasil job tersebut.
+    
+    Args:
+        queue_path (str): Path database job queue
+        job_id (str): ID job (default: timestamp baru)
+        formats (tuple): Format file akhir (default: OUTPUT_FORMATS)
+    """
+    job_queue = JobQueue(queue_path, lease_seconds=JOB_LEASE_SECONDS, max_attempts=JOB_MAX_ATTEMPTS)
+    
     print("=" * 70)
-    print("SELESAI!")
+    print("GOOGLE SCHOLAR SCRAPER - COORDINATOR")
     print("=" * 70)
-    print(f"Output: {output_dir}")
+    
+    dosen_names = _read_clean_names()
+    if not dosen_names:
+        print("ERROR: Tidak ada nama dosen dalam file")
+        return
+    
+    job_id = job_queue.create_job(dosen_names, job_id=job_id)
+    print(f"📋 Job {job_id}: {job_queue.progress(job_id)['total']} dosen di {queue_path}")
+    print(f"   Jalankan worker: python main.py --worker --queue {queue_path} --job {job_id}")
     print()
+    
+    last = None
+    while True:
+        progress = job_queue.progress(job_id)
+        if progress != last:
+            print(f"⏳ {progress['done']} selesai, {progress['failed']} gagal, "
+                  f"{progress['leased']} dikerjakan, {progress['pending']} menunggu")
+            last = progress
+        if progress['pending'] == 0 and progress['leased'] == 0:
+            break
+        time.sleep(JOB_POLL_SECONDS)
+    
+    for failure in job_queue.failures(job_id):
+        print(f"❌ {failure['nama']} ({failure['attempts']}x): {failure['error']}")
+    
+    publications = job_queue.results(job_id)
+    if RESULT_STORE_PATH:
+        # Worker di mesin lain menulis ke result store lokalnya; hasil job disimpan juga di sini
+        store = ResultStore(RESULT_STORE_PATH)
+        by_dosen = {}
+        for pub in publications:
+            by_dosen.setdefault(pub['Nama Dosen'], []).append(pub)
+        for nama_dosen, pubs in by_dosen.items():
+            store.upsert_lecturer(nama_dosen, pubs, session_id=job_id)
+    
+    df_results = publications_to_dataframe(publications)
+    print()
+    print(f"📦 Hasil job {job_id}: {len(df_results)} publikasi")
+    if df_results.empty:
+        print("      PERINGATAN: Tidak ada data")
+        return
+    save_results(df_results, formats=formats)
+
+
+def run_worker(queue_path: str = JOB_QUEUE_PATH, job_id: str = None, worker_id: str = None,
+               cache_only: bool = False, incremental: bool = False):
+    """
+    Mode worker: mengambil tugas dari job queue sampai job selesai. Beberapa worker boleh
+    berjalan bersamaan, di mesin yang sama maupun di mesin lain yang membuka queue yang sama.
+    
+    Args:
+        queue_path (str): Path database job queue
+        job_id (str): ID job (default: job terbaru di queue)
+        worker_id (str): ID worker (default: <hostname>-<pid>)
+        cache_only (bool): Jalankan parser ulang dari cache tanpa akses jaringan
+        incremental (bool): Ambil halaman detail hanya untuk publikasi baru/berubah
+    """
+    job_queue = JobQueue(queue_path, lease_seconds=JOB_LEASE_SECONDS, max_attempts=JOB_MAX_ATTEMPTS)
+    job_id = job_id or job_queue.latest_job()
+    if not job_id:
+        print(f"ERROR: Belum ada job di {queue_path}; jalankan coordinator terlebih dahulu")
+        return
+    
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    user_data_dir = os.path.join(CHROME_PROFILE_DIR, f"queue_{worker_id}") if CHROME_PROFILE_DIR else None
+    scraper = build_scraper(cache_only or CACHE_ONLY, incremental or INCREMENTAL, user_data_dir=user_data_dir)
+    
+    print(f"👷 Worker {worker_id} mengerjakan job {job_id}")
+    completed = scraper.run_queue_worker(job_queue, job_id, worker_id, poll_seconds=JOB_POLL_SECONDS)
+    print(f"👷 Worker {worker_id} selesai: {completed} dosen dikirim ke coordinator")
+
+
+def run_export(formats: tuple = None):
+    """
+    Mengekspor ulang CSV/Excel/DOCX/Parquet dari result store untuk dosen di INPUT_FILE_PATH tanpa scraping.
+    
+    Args:
+        formats (tuple): Format file yang diekspor (default: OUTPUT_FORMATS)
+    """
+    if not RESULT_STORE_PATH or not os.path.exists(RESULT_STORE_PATH):
+        print(f"ERROR: Result store tidak ditemukan: {RESULT_STORE_PATH}")
+        return
+    
+    dosen_names = _read_clean_names()
+    if not dosen_names:
+        print("ERROR: Tidak ada nama dosen dalam file")
+        return
+    
+    stats = ResultStore(RESULT_STORE_PATH).get_stats()
+    print(f"🗄️  {RESULT_STORE_PATH}: {stats['lecturers']} dosen, {stats['publications']} publikasi")
+    save_results(None, dosen_names, formats=formats)
+
+
+def show_history(nama_dosen: str):
+    """
+    Menampilkan riwayat perubahan publikasi satu dosen dari result store.
+    
+    Args:
+        nama_dosen (str): Nama dosen (dibersihkan dari gelar seperti di file input)
+    """
+    if not RESULT_STORE_PATH or not os.path.exists(RESULT_STORE_PATH):
+        print(f"ERROR: Result store tidak ditemukan: {RESULT_STORE_PATH}")
+        return
+    
+    nama_dosen = clean_dosen_name(nama_dosen)
+    history = ResultStore(RESULT_STORE_PATH).lecturer_history(nama_dosen)
+    print(f"📜 Riwayat perubahan {nama_dosen}: {len(history)} perubahan")
+    for change in history:
+        if change['field'] == 'removed':
+            print(f"   {change['changed_at']}  [{change['pub_key']}] hilang dari profil: {change['old_value']}")
+        else:
+            print(f"   {change['changed_at']}  [{change['pub_key']}] {change['field']}: "
+                  f"{change['old_value']} → {change['new_value']}")
 
 
 def run_gui():
@@ -147,6 +671,24 @@ def run_gui():
         sys.exit(1)
 
 
+def parse_formats(value: str) -> tuple:
+    """
+    Parser argumen --formats ('csv,parquet' -> ('csv', 'parquet')).
+    
+    Args:
+        value (str): Daftar format dipisah koma
+        
+    Returns:
+        tuple: Format yang valid, urutan sesuai input
+    """
+    formats = tuple(dict.fromkeys(fmt.strip().lower() for fmt in value.split(',') if fmt.strip()))
+    invalid = [fmt for fmt in formats if fmt not in FILE_FORMATS]
+    if invalid or not formats:
+        raise argparse.ArgumentTypeError(
+            f"Format tidak valid: {', '.join(invalid) or value}. Gunakan {', '.join(FILE_FORMATS)}")
+    return formats
+
+
 def main():
     """Main entry point dengan argparse."""
     parser = argparse.ArgumentParser(
@@ -157,6 +699,17 @@ Examples:
   python main.py              # Mode CLI (default)
   python main.py --gui        # Mode GUI
   python main.py --cli        # Mode CLI (explicit)
+  python main.py --cache-only # Replay parser dari cache tanpa akses jaringan
+  python main.py --incremental # Refresh: detail hanya untuk publikasi baru/berubah
+  python main.py --resume 20250101_120000  # Lanjutkan session yang terhenti
+  python main.py --shards 4   # 4 proses scraper, hasil digabung di akhir
+  python main.py --shards 4 --resume 20250101_120000  # Lanjutkan run sharded
+  python main.py --coordinator                 # Buat job di job queue, tunggu hasil worker
+  python main.py --worker --queue cache/job_queue.db  # Worker (boleh banyak, di banyak mesin)
+  python main.py --stream jsonl  # Tulis publikasi ke file setiap dosen selesai (csv/jsonl/parquet)
+  python main.py --export     # Ekspor ulang CSV/XLSX/DOCX dari result store tanpa scraping
+  python main.py --formats csv,parquet  # Pilih format file akhir (csv, excel, docx, parquet)
+  python main.py --history "Budi Santoso"  # Riwayat perubahan publikasi satu dosen
         """
     )
     
@@ -172,14 +725,110 @@ Examples:
         help='Jalankan dalam mode CLI (command line interface) - default'
     )
     
+    parser.add_argument(
+        '--cache-only',
+        action='store_true',
+        help='Mode CLI tanpa akses jaringan: semua halaman dibaca dari cache (replay parser)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Mode CLI refresh: halaman detail hanya diambil untuk publikasi yang baru atau berubah'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        metavar='SESSION_ID',
+        help='Mode CLI: lanjutkan session yang terhenti, dosen yang sudah selesai diambil dari journal'
+    )
+    
+    parser.add_argument(
+        '--shards',
+        type=int,
+        metavar='N',
+        default=NUM_SHARDS,
+        help='Mode CLI multi-proses: daftar dosen dibagi ke N proses scraper, hasil digabung di akhir'
+    )
+    
+    parser.add_argument(
+        '--coordinator',
+        action='store_true',
+        help='Buat job di job queue (satu tugas per dosen), tunggu worker, lalu simpan hasil gabungan'
+    )
+    
+    parser.add_argument(
+        '--worker',
+        action='store_true',
+        help='Ambil dan kerjakan tugas dari job queue sampai job selesai'
+    )
+    
+    parser.add_argument(
+        '--queue',
+        metavar='PATH',
+        default=JOB_QUEUE_PATH,
+        help=f'Path database job queue (default: {JOB_QUEUE_PATH})'
+    )
+    
+    parser.add_argument(
+        '--job',
+        metavar='JOB_ID',
+        help='ID job untuk --coordinator/--worker (default: job baru / job terbaru)'
+    )
+    
+    parser.add_argument(
+        '--worker-id',
+        metavar='NAME',
+        help='ID worker (default: <hostname>-<pid>); ID tetap = profil Chrome tetap'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        choices=['csv', 'jsonl', 'parquet'],
+        help='Mode CLI: tulis publikasi ke file setiap dosen selesai, tanpa menampung semua baris di memori'
+    )
+    
+    parser.add_argument(
+        '--formats',
+        type=parse_formats,
+        metavar='LIST',
+        help=f"Format file akhir, dipisah koma: {', '.join(FILE_FORMATS)} (default: {','.join(OUTPUT_FORMATS)})"
+    )
+    
+    parser.add_argument(
+        '--export',
+        action='store_true',
+        help='Ekspor CSV/XLSX/DOCX dari result store untuk dosen di file input, tanpa scraping'
+    )
+    
+    parser.add_argument(
+        '--history',
+        metavar='NAMA',
+        help='Tampilkan riwayat perubahan publikasi satu dosen dari result store'
+    )
+    
     args = parser.parse_args()
     
     # Determine mode
     if args.gui:
         run_gui()
+    elif args.export:
+        run_export(formats=args.formats)
+    elif args.history:
+        show_history(args.history)
+    elif args.coordinator:
+        run_coordinator(args.queue, job_id=args.job, formats=args.formats)
+    elif args.worker:
+        run_worker(args.queue, job_id=args.job, worker_id=args.worker_id,
+                   cache_only=args.cache_only, incremental=args.incremental)
     else:
         # Default to CLI
-        run_cli()
+        if args.shards > 1:
+            run_sharded(args.shards, cache_only=args.cache_only, incremental=args.incremental,
+                        resume_run_id=args.resume, formats=args.formats)
+            return
+        run_cli(cache_only=args.cache_only, incremental=args.incremental, resume_session_id=args.resume,
+                stream_format=args.stream, formats=args.formats)
 
 
 if __name__ == "__main__":
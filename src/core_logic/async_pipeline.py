@@ -0,0 +1,336 @@
+"""
+Asyncio pipeline module for Google Scholar scraper.
+Versi alur scraping berbasis asyncio: pencarian nama -> daftar publikasi profil -> halaman
+detail -> penyimpanan hasil, dihubungkan oleh antrian terbatas (backpressure). Fetch dan
+parsing tetap memakai helper GoogleScholarScraper (_load_html, parser, cache, rate limiter,
+fallback CAPTCHA), dijalankan di thread agar waktu tunggu jaringan saling tumpang tindih
+antar dosen dan antar publikasi.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlsplit
+
+from .http_fetcher import CaptchaDetectedError
+from .utils import build_profile_page_url
+
+
+class LecturerJob:
+    """
+    State satu dosen yang bergerak melalui stage pipeline.
+    """
+
+    def __init__(self, idx: int, nama_dosen: str):
+        """
+        Args:
+            idx (int): Posisi dosen di daftar input (urutan hasil)
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+        """
+        self.idx = idx
+        self.nama_dosen = nama_dosen
+        self.profile_url: Optional[str] = None
+        self.from_profile_cache = False
+        self.rows: List[Dict] = []
+        self.snapshot: Dict[str, Dict] = {}
+        self.details_by_url: Dict[str, Dict] = {}
+        self.pending = 0  # Halaman detail yang belum selesai diambil
+        self.error: Optional[Exception] = None
+        self.start = time.perf_counter()
+
+
+class AsyncScrapePipeline:
+    """
+    Pipeline scraping 4 stage dengan antrian terbatas:
+    1. resolver: nama dosen -> URL profil (cache profil atau halaman pencarian)
+    2. profile: URL profil -> semua baris publikasi (per halaman cstart/pagesize)
+    3. detail: satu halaman detail per publikasi
+    4. sink: gabungkan detail, catat ke journal/snapshot/logger, simpan hasil
+    Jumlah fetch bersamaan dibatasi secara global (concurrency) dan per host (per_host_limit).
+    """
+
+    def __init__(self, scraper, concurrency: int = 8, per_host_limit: int = 4,
+                 page_size: int = 100, resolver_workers: int = 2, profile_workers: int = 2,
+                 queue_size: Optional[int] = None):
+        """
+        Inisialisasi pipeline.
+
+        Args:
+            scraper (GoogleScholarScraper): Scraper yang menyediakan fetch, parser, cache, dan logger
+            concurrency (int): Jumlah fetch bersamaan maksimal (juga jumlah worker stage detail)
+            per_host_limit (int): Jumlah fetch bersamaan maksimal ke satu host
+            page_size (int): Jumlah baris per halaman profil (parameter pagesize)
+            resolver_workers (int): Jumlah task stage pencarian nama
+            profile_workers (int): Jumlah task stage daftar publikasi
+            queue_size (Optional[int]): Kapasitas antrian antar stage (default 2 x concurrency)
+        """
+        self.scraper = scraper
+        self.concurrency = max(1, int(concurrency))
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.page_size = page_size
+        self.resolver_workers = max(1, int(resolver_workers))
+        self.profile_workers = max(1, int(profile_workers))
+        self.queue_size = queue_size or self.concurrency * 2
+
+        self.total = 0
+        self.results: Dict[int, List[Dict]] = {}
+        self._global_limit: Optional[asyncio.Semaphore] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def run(self, dosen_list: List[str]) -> List[Dict]:
+        """
+        Menjalankan pipeline sampai semua dosen selesai (atau scraper diminta berhenti).
+
+        Args:
+            dosen_list (List[str]): List nama dosen yang sudah dibersihkan
+
+        Returns:
+            List[Dict]: Semua publikasi, urut sesuai dosen_list
+        """
+        self.total = len(dosen_list)
+        self.results = {}
+        asyncio.run(self._run(dosen_list))
+
+        all_publications = []
+        for idx in range(len(dosen_list)):
+            all_publications.extend(self.results.get(idx, []))
+        return all_publications
+
+    async def _run(self, dosen_list: List[str]):
+        """
+        Membuat antrian dan task setiap stage, lalu menunggu antrian kosong berurutan dari hulu ke hilir.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="pipeline-fetch")
+        loop.set_default_executor(executor)
+
+        self._global_limit = asyncio.Semaphore(self.concurrency)
+        self._host_limits = {}
+
+        names_q: asyncio.Queue = asyncio.Queue()
+        profile_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        detail_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        sink_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        for idx, nama_dosen in enumerate(dosen_list):
+            names_q.put_nowait((idx, nama_dosen))
+
+        print(f"🚀 Pipeline asyncio: {self.concurrency} fetch bersamaan, maksimal {self.per_host_limit} per host")
+
+        tasks = [asyncio.create_task(self._resolver_stage(names_q, profile_q)) for _ in range(self.resolver_workers)]
+        tasks += [asyncio.create_task(self._profile_stage(profile_q, detail_q, sink_q)) for _ in range(self.profile_workers)]
+        tasks += [asyncio.create_task(self._detail_stage(detail_q, sink_q)) for _ in range(self.concurrency)]
+        tasks.append(asyncio.create_task(self._sink_stage(sink_q)))
+
+        try:
+            # Setiap stage memanggil task_done setelah item diteruskan ke stage berikutnya
+            for stage_queue in (names_q, profile_q, detail_q, sink_q):
+                await stage_queue.join()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            executor.shutdown(wait=True)
+
+    async def _fetch(self, url: str, refresh: bool = False) -> Optional[str]:
+        """
+        Mengambil HTML lewat scraper._load_html di thread, dengan batas global dan per host.
+
+        Args:
+            url (str): URL halaman Google Scholar
+            refresh (bool): Lewati cache halaman
+
+        Returns:
+            Optional[str]: HTML halaman, atau None jika gagal
+        """
+        host = urlsplit(url).netloc
+        host_limit = self._host_limits.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+
+        async with self._global_limit:
+            async with host_limit:
+                return await asyncio.to_thread(self.scraper._load_html, url, refresh)
+
+    def _fail(self, job: LecturerJob, error_msg: str, error_type: str):
+        """
+        Mencatat dosen yang gagal ke logger.
+        """
+        print(f"❌ {job.nama_dosen}: {error_msg}")
+        if self.scraper.logger:
+            self.scraper.logger.log_failure(job.nama_dosen, error_msg, error_type)
+
+    def _fail_exception(self, job: LecturerJob, error: Exception):
+        """
+        Mencatat exception sebagai kegagalan CAPTCHA atau SCRAPING_ERROR (sama dengan alur sinkron).
+        """
+        error_msg = str(error).lower()
+        if 'captcha' in error_msg or 'recaptcha' in error_msg or 'unusual traffic' in error_msg:
+            self._fail(job, str(error), "CAPTCHA")
+        else:
+            self._fail(job, str(error), "SCRAPING_ERROR")
+
+    async def _resolver_stage(self, names_q: asyncio.Queue, profile_q: asyncio.Queue):
+        """
+        Stage 1: mencari URL profil setiap dosen.
+        """
+        scraper = self.scraper
+        while True:
+            idx, nama_dosen = await names_q.get()
+            job = LecturerJob(idx, nama_dosen)
+            try:
+                # Dosen yang belum dimulai dilewati; dilanjutkan lewat resume
+                if scraper._stop_event.is_set():
+                    continue
+
+                print(f"\n[{idx + 1}/{self.total}] Memproses: {nama_dosen}{scraper._rate_label()}")
+                if scraper.journal:
+                    scraper.journal.start_dosen(nama_dosen)
+
+                job.profile_url = scraper._get_cached_profile_url(nama_dosen)
+                job.from_profile_cache = job.profile_url is not None
+
+                if not job.profile_url:
+                    with scraper._timed('search', nama_dosen):
+                        search_html = await self._fetch(scraper._build_search_url(nama_dosen))
+                    if search_html is None:
+                        self._fail(job, "Gagal melakukan pencarian", "SEARCH_FAILED")
+                        continue
+
+                    job.profile_url = scraper._parse_search_profile_url(search_html)
+                    if not job.profile_url:
+                        self._fail(job, "Profil tidak ditemukan", "PROFILE_NOT_FOUND")
+                        continue
+
+                    scraper._remember_profile_url(nama_dosen, job.profile_url)
+
+                await profile_q.put(job)
+            except Exception as e:
+                self._fail_exception(job, e)
+            finally:
+                names_q.task_done()
+
+    async def _collect_rows(self, job: LecturerJob):
+        """
+        Mengambil semua halaman profil (cstart/pagesize) satu dosen dan mengumpulkan barisnya.
+
+        Raises:
+            Exception: Jika halaman profil gagal dimuat
+        """
+        scraper = self.scraper
+        scraped_titles: Set[str] = set()
+        page_number = 1
+        cstart = 0
+
+        while True:
+            page_url = build_profile_page_url(job.profile_url, cstart, self.page_size)
+            with scraper._timed('profile_page', job.nama_dosen):
+                profile_html = await self._fetch(page_url)
+            if profile_html is None:
+                # Profil dari cache mungkin sudah tidak valid; cari ulang pada run berikutnya
+                if job.from_profile_cache and page_number == 1 and scraper.profile_cache:
+                    scraper.profile_cache.invalidate(job.nama_dosen)
+                raise Exception(f"Gagal memuat halaman profil: {page_url}")
+
+            page_rows = scraper.parser.parse_profile_rows(profile_html)
+            job.rows.extend(scraper._filter_new_rows(page_rows, scraped_titles))
+
+            # Berhenti berdasarkan isi halaman (bukan hasil de-duplikasi judul)
+            if not page_rows or not scraper._has_more_publications_html(profile_html):
+                break
+
+            cstart += self.page_size
+            page_number += 1
+
+        print(f"  📚 {job.nama_dosen}: {len(job.rows)} artikel dari {page_number} halaman profil")
+
+    async def _profile_stage(self, profile_q: asyncio.Queue, detail_q: asyncio.Queue, sink_q: asyncio.Queue):
+        """
+        Stage 2: mengumpulkan baris publikasi lalu mengirim halaman detail yang perlu diambil
+        ke stage detail (detail yang tidak berubah diambil dari snapshot).
+        """
+        scraper = self.scraper
+        while True:
+            job = await profile_q.get()
+            try:
+                try:
+                    await self._collect_rows(job)
+                    job.snapshot = scraper._load_snapshot(job.nama_dosen)
+                    reused, fetch_urls, changed_urls = scraper._plan_row_details(job.rows, job.snapshot)
+                except Exception as e:
+                    self._fail_exception(job, e)
+                    continue
+
+                job.details_by_url.update(reused)
+                urls = [url for url in dict.fromkeys(fetch_urls) if url]
+
+                # pending diisi sebelum antrian agar dosen tidak dianggap selesai terlalu cepat
+                job.pending = len(urls)
+                if not urls:
+                    await sink_q.put(job)
+                for url in urls:
+                    await detail_q.put((job, url, url in changed_urls))
+            finally:
+                profile_q.task_done()
+
+    async def _detail_stage(self, detail_q: asyncio.Queue, sink_q: asyncio.Queue):
+        """
+        Stage 3: mengambil dan mem-parse satu halaman detail. Dosen diteruskan ke sink
+        setelah halaman detail terakhirnya selesai.
+        """
+        scraper = self.scraper
+        while True:
+            job, url, refresh = await detail_q.get()
+            try:
+                # Setelah CAPTCHA gagal diselesaikan, sisa detail dosen ini tidak diambil
+                if job.error is None:
+                    with scraper._timed('detail', job.nama_dosen):
+                        html = await self._fetch(url, refresh)
+                    job.details_by_url[url] = scraper._parse_detail_html(html) if html else {}
+            except CaptchaDetectedError as e:
+                job.error = e
+            except Exception as e:
+                print(f"    ⚠️  Gagal mengambil detail {url}: {e}")
+                job.details_by_url[url] = {}
+            finally:
+                job.pending -= 1
+                if job.pending == 0:
+                    await sink_q.put(job)
+                detail_q.task_done()
+
+    async def _sink_stage(self, sink_q: asyncio.Queue):
+        """
+        Stage 4: menggabungkan detail ke baris publikasi dan mencatat dosen yang selesai.
+        """
+        scraper = self.scraper
+        while True:
+            job = await sink_q.get()
+            try:
+                if job.error is not None:
+                    self._fail_exception(job, job.error)
+                    continue
+
+                # Snapshot memakai tanda tangan baris sebelum detail digabung (Tahun bisa berubah)
+                new_snapshot: Dict[str, Dict] = {}
+                scraper._update_snapshot(job.rows, job.details_by_url, new_snapshot)
+
+                publications = []
+                for pub_data in job.rows:
+                    scraper._apply_publication_details(pub_data, job.details_by_url.get(pub_data['Detail_Link'], {}))
+                    publications.append(scraper._finalize_publication(pub_data, job.nama_dosen))
+
+                if scraper.journal:
+                    scraper.journal.record_batch(job.nama_dosen, publications)
+                scraper._save_snapshot(job.nama_dosen, new_snapshot)
+                if scraper.journal:
+                    scraper.journal.mark_done(job.nama_dosen, len(publications))
+                scraper._store_results(job.nama_dosen, publications, job.profile_url)
+
+                self.results[job.idx] = publications if scraper._keep_results else []
+                print(f"\n✅ Selesai: {job.nama_dosen} - {len(publications)} publikasi total")
+                if scraper.logger:
+                    scraper.logger.log_success(job.nama_dosen, len(publications), f"Profile: {job.profile_url}")
+                    scraper.logger.record_timing('dosen_total', time.perf_counter() - job.start, job.nama_dosen)
+            except Exception as e:
+                self._fail_exception(job, e)
+            finally:
+                sink_q.task_done()
@@ -0,0 +1,172 @@
+"""
+Checkpoint journal module for Google Scholar scraper.
+Mencatat hasil scraping ke file JSONL append-only setelah setiap batch publikasi dan
+setiap dosen selesai, sehingga session yang terhenti (crash, Chrome tertutup, atau
+dihentikan dari GUI) bisa dilanjutkan tanpa mengulang dosen yang sudah selesai.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+def journal_path_for(session_id: str, log_dir: str = "logging") -> str:
+    """
+    Path journal sebuah session (sama dengan yang dipakai run_scraper).
+
+    Args:
+        session_id (str): Session ID
+        log_dir (str): Base directory logging
+
+    Returns:
+        str: Path logging/session_<id>/journal_<id>.jsonl
+    """
+    return os.path.join(log_dir, f"session_{session_id}", f"journal_{session_id}.jsonl")
+
+
+class CheckpointJournal:
+    """
+    Journal JSONL append-only. Setiap baris adalah satu event:
+    - {"event": "session", "dosen": [...], "years": [...]}: daftar dosen dan tahun run ini
+      (dipakai resume, sehingga tidak bergantung pada file input atau pilihan di GUI)
+    - {"event": "start", "nama": ...}: dosen mulai diproses (batch sebelumnya untuk dosen ini dibuang)
+    - {"event": "batch", "nama": ..., "publications": [...]}: satu batch publikasi selesai
+    - {"event": "done", "nama": ..., "count": ...}: dosen selesai dengan sukses
+    Satu instance aman dipakai bersama oleh beberapa worker thread.
+    """
+
+    def __init__(self, journal_path: str):
+        """
+        Inisialisasi journal.
+
+        Args:
+            journal_path (str): Path file JSONL (dibuat jika belum ada)
+        """
+        self.journal_path = journal_path
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(journal_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    def _append(self, record: Dict):
+        """
+        Menulis satu event ke journal dan memaksa data tersimpan ke disk.
+
+        Args:
+            record (Dict): Event yang akan ditulis
+        """
+        record['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        line = json.dumps(record, ensure_ascii=False, default=str)
+
+        with self._lock:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def start_session(self, dosen_list: List[str], years: Optional[List[int]] = None):
+        """
+        Mencatat daftar dosen dan tahun cited-by yang diproses session ini.
+
+        Args:
+            dosen_list (List[str]): Nama dosen yang sudah dibersihkan, sesuai urutan input
+            years (Optional[List[int]]): Tahun untuk kolom cited-by (None = semua tahun)
+        """
+        self._append({'event': 'session', 'dosen': list(dosen_list),
+                      'years': sorted(years) if years else None})
+
+    def load_session(self) -> Optional[Dict]:
+        """
+        Membaca daftar dosen dan tahun dari event session terakhir di journal.
+
+        Returns:
+            Optional[Dict]: {'dosen': [...], 'years': [...] atau None}, atau None jika journal
+                            belum ada atau dibuat sebelum event session dicatat
+        """
+        if not os.path.exists(self.journal_path):
+            return None
+
+        session = None
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get('event') == 'session':
+                    session = {'dosen': record.get('dosen', []), 'years': record.get('years')}
+        return session
+
+    def start_dosen(self, nama_dosen: str):
+        """
+        Mencatat bahwa dosen mulai diproses.
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+        """
+        self._append({'event': 'start', 'nama': nama_dosen})
+
+    def record_batch(self, nama_dosen: str, publications: List[Dict]):
+        """
+        Mencatat satu batch publikasi yang sudah lengkap (sudah digabung dengan detail).
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            publications (List[Dict]): Publikasi dalam batch ini
+        """
+        if publications:
+            self._append({'event': 'batch', 'nama': nama_dosen, 'publications': publications})
+
+    def mark_done(self, nama_dosen: str, publications_count: int):
+        """
+        Mencatat bahwa dosen selesai di-scrape dengan sukses.
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            publications_count (int): Jumlah publikasi dosen
+        """
+        self._append({'event': 'done', 'nama': nama_dosen, 'count': publications_count})
+
+    def load_completed(self) -> Dict[str, List[Dict]]:
+        """
+        Membaca journal dan mengembalikan publikasi dosen yang sudah selesai.
+        Baris terakhir yang terpotong (crash saat menulis) diabaikan.
+
+        Returns:
+            Dict[str, List[Dict]]: Publikasi per nama dosen yang berstatus selesai
+        """
+        if not os.path.exists(self.journal_path):
+            return {}
+
+        pending: Dict[str, List[Dict]] = {}
+        completed: Dict[str, List[Dict]] = {}
+
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                nama = record.get('nama')
+                event = record.get('event')
+
+                if event == 'start':
+                    pending[nama] = []
+                    completed.pop(nama, None)
+                elif event == 'batch':
+                    pending.setdefault(nama, []).extend(record.get('publications', []))
+                elif event == 'done':
+                    completed[nama] = pending.pop(nama, [])
+
+        for publications in completed.values():
+            for pub in publications:
+                # JSON menyimpan key tahun sebagai string; kembalikan ke int
+                per_year = pub.get('Cited_By_Per_Year')
+                if isinstance(per_year, dict):
+                    pub['Cited_By_Per_Year'] = {int(year): count for year, count in per_year.items()}
+
+        return completed
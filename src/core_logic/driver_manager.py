@@ -0,0 +1,166 @@
+"""
+Driver manager module for Google Scholar scraper.
+Menyimpan satu Chrome WebDriver yang tetap hidup antar run (misalnya antar scraping di GUI),
+memeriksa kesehatannya sebelum dipakai ulang, dan mendaur ulang driver setelah sejumlah
+halaman atau saat pemakaian memori Chrome terlalu besar.
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+try:
+    import psutil
+except ImportError:  # psutil opsional: tanpa psutil, recycle hanya berdasarkan jumlah halaman
+    psutil = None
+
+
+def is_driver_healthy(driver) -> bool:
+    """
+    Memeriksa apakah WebDriver dan browser masih merespons.
+
+    Args:
+        driver: Selenium WebDriver
+
+    Returns:
+        bool: True jika driver bisa menjalankan JavaScript dan masih punya jendela
+    """
+    try:
+        return driver.execute_script("return 1;") == 1 and bool(driver.window_handles)
+    except Exception:
+        return False
+
+
+def driver_memory_mb(driver) -> Optional[float]:
+    """
+    Menghitung total memori (RSS) proses chromedriver beserta semua proses Chrome turunannya.
+
+    Args:
+        driver: Selenium WebDriver
+
+    Returns:
+        Optional[float]: Memori dalam MB, None jika psutil tidak terinstall atau PID tidak diketahui
+    """
+    if psutil is None:
+        return None
+
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / (1024 * 1024)
+
+
+class DriverManager:
+    """
+    Pemilik satu WebDriver yang bisa dipakai ulang oleh beberapa run scraper berturut-turut.
+    Driver dibuat lewat factory dari scraper, lalu dibuat ulang jika konfigurasinya berubah,
+    tidak merespons, sudah memuat max_pages halaman, atau memakai lebih dari max_memory_mb.
+    """
+
+    def __init__(self, max_pages: int = 500, max_memory_mb: int = 1500):
+        """
+        Inisialisasi driver manager.
+
+        Args:
+            max_pages (int): Jumlah halaman sebelum driver didaur ulang (0 = tanpa batas)
+            max_memory_mb (int): Batas memori Chrome dalam MB sebelum driver didaur ulang
+                                 (0 = tanpa batas; hanya berlaku jika psutil terinstall)
+        """
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.driver = None
+        self.config = None
+        self.pages = 0
+        self.starts = 0
+        self.recycles = 0
+        self._lock = threading.Lock()
+
+    def _recycle_reason(self, config: Any) -> Optional[str]:
+        """
+        Menentukan apakah driver saat ini harus dibuat ulang.
+
+        Returns:
+            Optional[str]: Alasan daur ulang, None jika driver masih layak dipakai
+        """
+        if config != self.config:
+            return "konfigurasi browser berubah"
+        if not is_driver_healthy(self.driver):
+            return "driver tidak merespons"
+        if self.max_pages and self.pages >= self.max_pages:
+            return f"{self.pages} halaman dimuat"
+        if self.max_memory_mb:
+            memory = driver_memory_mb(self.driver)
+            if memory is not None and memory > self.max_memory_mb:
+                return f"memori Chrome {memory:.0f} MB"
+        return None
+
+    def get_driver(self, factory: Callable[[], Any], config: Any = None):
+        """
+        Mengembalikan driver yang sehat: driver yang ada dipakai ulang, atau dibuat baru lewat factory.
+
+        Args:
+            factory (Callable[[], Any]): Fungsi pembuat WebDriver baru
+            config (Any): Konfigurasi browser (headless, lean, profil); driver dibuat ulang jika berubah
+
+        Returns:
+            WebDriver yang siap dipakai
+        """
+        with self._lock:
+            if self.driver is not None:
+                reason = self._recycle_reason(config)
+                if reason is None:
+                    return self.driver
+                print(f"♻️  Membuat ulang Chrome: {reason}")
+                self.recycles += 1
+                self._quit()
+
+            self.driver = factory()
+            self.config = config
+            self.pages = 0
+            self.starts += 1
+            return self.driver
+
+    def record_pages(self, count: int = 1):
+        """
+        Menambah hitungan halaman yang dimuat oleh driver saat ini.
+
+        Args:
+            count (int): Jumlah halaman
+        """
+        with self._lock:
+            self.pages += count
+
+    def has_driver(self) -> bool:
+        """
+        Returns:
+            bool: True jika ada driver yang sedang disimpan
+        """
+        return self.driver is not None
+
+    def _quit(self):
+        """
+        Menutup driver saat ini (dipanggil di dalam lock).
+        """
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"⚠️ Gagal menutup Chrome: {e}")
+        self.driver = None
+        self.config = None
+        self.pages = 0
+
+    def close(self):
+        """
+        Menutup driver (misalnya saat aplikasi ditutup).
+        """
+        with self._lock:
+            self._quit()
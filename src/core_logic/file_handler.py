@@ -1,16 +1,47 @@
 """
 File handler module for Google Scholar scraper.
-Menangani operasi baca/tulis file untuk berbagai format (CSV, TXT, XLSX, DOCX).
+Menangani operasi baca/tulis file untuk berbagai format (CSV, TXT, XLSX, DOCX, Parquet).
 """
 
+import base64
 import csv
+import gzip
+import hashlib
+import json
+import multiprocessing
 import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional
+from xml.sax.saxutils import escape
 import pandas as pd
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from dotenv import load_dotenv
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional: hanya dibutuhkan untuk output Parquet
+    pa = None
+    pq = None
+
+try:
+    import xlsxwriter
+except ImportError:  # xlsxwriter opsional: tanpa ini save_to_excel memakai openpyxl write-only
+    xlsxwriter = None
+
+from .result_store import ResultStore
+from .sheets_manifest import SheetManifest, compute_delta
+
+# Kolom dengan sedikit nilai unik yang diulang di banyak baris: disimpan dictionary-encoded
+PARQUET_DICTIONARY_COLUMNS = ('Nama Dosen', 'Journal_Name', 'Publisher')
 
 # Load environment variables dari file .env
 load_dotenv()
@@ -115,9 +146,43 @@ def save_to_csv(df: pd.DataFrame, filename: str) -> str:
     return os.path.abspath(filename)
 
 
+def _excel_column_widths(df: pd.DataFrame, max_width: int = 50) -> List[int]:
+    """
+    Lebar kolom Excel dari panjang teks terpanjang per kolom (header atau nilai), dihitung
+    per kolom dengan operasi string pandas, bukan loop per cell.
+    
+    Args:
+        df (pd.DataFrame): DataFrame yang akan ditulis
+        max_width (int): Lebar maksimal kolom
+        
+    Returns:
+        List[int]: Lebar setiap kolom sesuai urutan df.columns
+    """
+    widths = []
+    for position, column in enumerate(df.columns):
+        lengths = df.iloc[:, position].dropna().astype(str).str.len()
+        longest = max(len(str(column)), int(lengths.max()) if len(lengths) else 0)
+        widths.append(min(longest + 2, max_width))
+    return widths
+
+
+def _excel_values(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Menyiapkan nilai untuk ditulis ke Excel: kosong/NaN menjadi None (cell kosong),
+    dict/list (mis. Cited_By_Per_Year) menjadi teks.
+    """
+    values = df.astype(object).where(df.notna(), None)
+    for position in range(values.shape[1]):
+        column = values.iloc[:, position]
+        if column.map(lambda v: isinstance(v, (dict, list))).any():
+            values.iloc[:, position] = column.map(lambda v: str(v) if isinstance(v, (dict, list)) else v)
+    return values
+
+
 def save_to_excel(df: pd.DataFrame, filename: str) -> str:
     """
-    Menyimpan DataFrame ke file Excel dengan formatting.
+    Menyimpan DataFrame ke file Excel secara streaming (xlsxwriter constant_memory jika terpasang,
+    jika tidak openpyxl write-only) dengan lebar kolom otomatis.
     
     Args:
         df (pd.DataFrame): DataFrame berisi data publikasi
@@ -134,29 +199,179 @@ def save_to_excel(df: pd.DataFrame, filename: str) -> str:
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
-    # Simpan dengan formatting
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Publications')
+    header = [str(column) for column in df.columns]
+    widths = _excel_column_widths(df)
+    rows = _excel_values(df).itertuples(index=False, name=None)
+    
+    if xlsxwriter is not None:
+        # constant_memory: setiap baris langsung ditulis ke file sementara (lebih cepat dari openpyxl)
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_urls': False})
+        worksheet = workbook.add_worksheet('Publications')
+        for index, width in enumerate(widths):
+            worksheet.set_column(index, index, width)
+        worksheet.write_row(0, 0, header)
+        for row_index, row in enumerate(rows, start=1):
+            worksheet.write_row(row_index, 0, row)
+        workbook.close()
+        return os.path.abspath(filename)
+    
+    # Write-only workbook: baris langsung di-stream ke file tanpa membangun objek cell
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Publications')
+    
+    # Lebar kolom harus diatur sebelum baris pertama ditulis
+    for index, width in enumerate(widths, start=1):
+        worksheet.column_dimensions[get_column_letter(index)].width = width
+    
+    worksheet.append(header)
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(filename)
+    
+    return os.path.abspath(filename)
+
+
+def _int_array(values: pd.Series, arrow_type):
+    """
+    Mengubah kolom teks/angka menjadi array integer Arrow; nilai kosong atau bukan angka menjadi null.
+    """
+    numbers = pd.to_numeric(values, errors='coerce').astype('Int64')
+    return pa.array(numbers, type=pa.int64()).cast(arrow_type)
+
+
+def dataframe_to_arrow(df: pd.DataFrame):
+    """
+    Mengubah DataFrame publikasi menjadi tabel Arrow bertipe:
+    - Tahun: int16, Sitasi dan <tahun>_cited_by: int32 (kosong = null)
+    - Cited_By_Per_Year: map<int16, int32>
+    - Nama Dosen, Journal_Name, Publisher: dictionary<int32, string>
+    - kolom lain: string
+    Tipe ditentukan dari nama kolom, sehingga batch berbeda dengan kolom yang sama selalu
+    menghasilkan skema yang sama.
+    
+    Args:
+        df (pd.DataFrame): DataFrame berisi data publikasi
         
-        # Dapatkan worksheet untuk formatting
-        worksheet = writer.sheets['Publications']
+    Returns:
+        pyarrow.Table: Tabel dengan skema bertipe
+    """
+    if pa is None:
+        raise ImportError("Output Parquet membutuhkan pyarrow (pip install pyarrow)")
+    
+    arrays = []
+    for column in df.columns:
+        values = df[column]
+        name = str(column)
+        if name == 'Tahun':
+            array = _int_array(values, pa.int16())
+        elif name == 'Sitasi' or name.endswith('_cited_by'):
+            array = _int_array(values, pa.int32())
+        elif name == 'Cited_By_Per_Year':
+            array = pa.array(
+                [[(int(year), int(count)) for year, count in m.items()] if isinstance(m, dict) else None
+                 for m in values],
+                type=pa.map_(pa.int16(), pa.int32())
+            )
+        else:
+            text = values.astype(object).where(values.notna(), None).map(
+                lambda v: v if v is None or isinstance(v, str) else str(v))
+            array = pa.array(text, type=pa.string(), from_pandas=True)
+            if name in PARQUET_DICTIONARY_COLUMNS:
+                array = array.dictionary_encode()
+        arrays.append(array)
+    
+    return pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+
+
+def save_to_parquet(df: pd.DataFrame, filename: str) -> str:
+    """
+    Menyimpan DataFrame ke file Parquet dengan skema bertipe (lihat dataframe_to_arrow).
+    
+    Args:
+        df (pd.DataFrame): DataFrame berisi data publikasi
+        filename (str): Nama file output (dengan atau tanpa ekstensi .parquet)
         
-        # Auto-adjust kolom width
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+    Returns:
+        str: Path lengkap file yang disimpan
+    """
+    if not filename.endswith('.parquet'):
+        filename += '.parquet'
+    
+    # Pastikan direktori output ada
+    output_dir = os.path.dirname(filename)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
     
+    pq.write_table(dataframe_to_arrow(df), filename, compression='zstd')
     return os.path.abspath(filename)
 
 
+# Kolom tabel ringkasan DOCX: (header, kolom DataFrame)
+SUMMARY_TABLE_COLUMNS = (('Judul', 'Judul'), ('Venue', 'Venue'), ('Tahun', 'Tahun'))
+
+# Karakter kontrol yang tidak valid di XML (python-docx menolak teks yang mengandungnya)
+_XML_INVALID_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _run_content_xml(text: str) -> str:
+    """
+    Isi <w:r> untuk teks cell, sama dengan setter run.text python-docx
+    (tab -> <w:tab/>, baris baru -> <w:br/>).
+    """
+    parts = []
+    for piece in re.split(r'(\t|\r\n|\n|\r)', _XML_INVALID_CHARS.sub('', text)):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\n', '\r', '\r\n'):
+            parts.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if piece != piece.strip() else ''
+            parts.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return ''.join(parts)
+
+
+def _add_publication_table(doc, df: pd.DataFrame):
+    """
+    Menambahkan tabel No/Judul/Venue/Tahun ke dokumen. Baris header dibuat lewat python-docx
+    (style dan lebar kolom), semua baris data dibangun sebagai satu string XML dari array kolom
+    lalu di-parse sekali, alih-alih table.add_row() per publikasi (yang makin lambat saat
+    tabel membesar).
+    
+    Args:
+        doc: Dokumen python-docx
+        df (pd.DataFrame): Publikasi yang ditulis ke tabel
+    """
+    table = doc.add_table(rows=1, cols=len(SUMMARY_TABLE_COLUMNS) + 1)
+    table.style = 'Light Grid Accent 1'
+    
+    hdr_cells = table.rows[0].cells
+    hdr_cells[0].text = 'No'
+    for cell, (header, _) in zip(hdr_cells[1:], SUMMARY_TABLE_COLUMNS):
+        cell.text = header
+    
+    if df.empty:
+        return table
+    
+    widths = [grid_col.w for grid_col in table._tbl.tblGrid.gridCol_lst]
+    cell_start = [f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width.twips}"/></w:tcPr><w:p><w:r>'
+                  for width in widths]
+    columns = [range(1, len(df) + 1)] + [
+        df[column].map(str) if column in df.columns else [''] * len(df)
+        for _, column in SUMMARY_TABLE_COLUMNS
+    ]
+    
+    rows_xml = ''.join(
+        '<w:tr>' + ''.join(
+            f'{start}{_run_content_xml(str(value))}</w:r></w:p></w:tc>'
+            for start, value in zip(cell_start, values)
+        ) + '</w:tr>'
+        for values in zip(*columns)
+    )
+    rows = parse_xml(f'<w:tbl {nsdecls("w")}>{rows_xml}</w:tbl>')
+    table._tbl.extend(list(rows))
+    return table
+
+
 def generate_summary_docx(df: pd.DataFrame, filename: str) -> str:
     """
     Membuat dokumen Word berisi ringkasan publikasi.
@@ -199,49 +414,100 @@ def generate_summary_docx(df: pd.DataFrame, filename: str) -> str:
             doc.add_paragraph()
             
             # Tambahkan tabel publikasi
-            table = doc.add_table(rows=1, cols=4)
-            table.style = 'Light Grid Accent 1'
-            
-            # Header tabel
-            hdr_cells = table.rows[0].cells
-            hdr_cells[0].text = 'No'
-            hdr_cells[1].text = 'Judul'
-            hdr_cells[2].text = 'Venue'
-            hdr_cells[3].text = 'Tahun'
-            
-            # Isi tabel
-            for idx, (_, row) in enumerate(group.iterrows(), 1):
-                row_cells = table.add_row().cells
-                row_cells[0].text = str(idx)
-                row_cells[1].text = str(row.get('Judul', ''))
-                row_cells[2].text = str(row.get('Venue', ''))
-                row_cells[3].text = str(row.get('Tahun', ''))
+            _add_publication_table(doc, group)
             
             doc.add_paragraph()
     else:
         # Jika tidak ada kolom nama dosen, buat tabel sederhana
         doc.add_heading('Semua Publikasi', level=1)
-        table = doc.add_table(rows=1, cols=4)
-        table.style = 'Light Grid Accent 1'
-        
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'No'
-        hdr_cells[1].text = 'Judul'
-        hdr_cells[2].text = 'Venue'
-        hdr_cells[3].text = 'Tahun'
-        
-        for idx, (_, row) in enumerate(df.iterrows(), 1):
-            row_cells = table.add_row().cells
-            row_cells[0].text = str(idx)
-            row_cells[1].text = str(row.get('Judul', ''))
-            row_cells[2].text = str(row.get('Venue', ''))
-            row_cells[3].text = str(row.get('Tahun', ''))
+        _add_publication_table(doc, df)
     
     # Simpan dokumen
     doc.save(filename)
     return os.path.abspath(filename)
 
 
+def generate_summary_docx_parts(df: pd.DataFrame, output_dir: str, group_column: Optional[str] = None,
+                                lecturers_per_part: int = 200, max_workers: Optional[int] = None) -> List[str]:
+    """
+    Membuat ringkasan DOCX terpisah (satu file per kelompok) secara paralel di beberapa proses.
+    Kelompok diambil dari group_column (misalnya kolom 'Fakultas') jika ada di DataFrame;
+    jika tidak, dosen dibagi per lecturers_per_part dosen sesuai urutan.
+    
+    Args:
+        df (pd.DataFrame): DataFrame berisi data publikasi
+        output_dir (str): Folder output file DOCX
+        group_column (Optional[str]): Kolom pengelompokan (default: bagi per jumlah dosen)
+        lecturers_per_part (int): Jumlah dosen per file jika tidak memakai group_column
+        max_workers (Optional[int]): Jumlah proses (default: jumlah CPU)
+        
+    Returns:
+        List[str]: Path file DOCX yang dibuat, sesuai urutan kelompok
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    if group_column and group_column in df.columns:
+        parts = [(str(name), group) for name, group in df.groupby(group_column, sort=True)]
+    elif 'Nama Dosen' in df.columns:
+        names = list(dict.fromkeys(df['Nama Dosen']))
+        size = max(1, lecturers_per_part)
+        parts = [
+            (f"part{i // size + 1:03d}", df[df['Nama Dosen'].isin(names[i:i + size])])
+            for i in range(0, len(names), size)
+        ]
+    else:
+        parts = [("part001", df)]
+    
+    filenames = [
+        os.path.join(output_dir, f"summary_{re.sub(r'[^A-Za-z0-9_-]+', '_', name).strip('_') or 'lainnya'}.docx")
+        for name, _ in parts
+    ]
+    if len(parts) <= 1 or max_workers == 1:
+        return [generate_summary_docx(part, filename) for (_, part), filename in zip(parts, filenames)]
+    
+    # 'spawn' agar proses anak mulai bersih (aman juga dipanggil dari thread GUI)
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(generate_summary_docx, [part for _, part in parts], filenames))
+
+
+def export_from_store(store: ResultStore, base_path: str, dosen_names: Optional[List[str]] = None,
+                      years: Optional[List[int]] = None, formats: tuple = ('csv', 'excel', 'docx'),
+                      docx_lecturers_per_file: Optional[int] = None) -> Dict[str, str]:
+    """
+    Mengekspor data terbaru dari result store ke CSV/Excel/DOCX.
+    
+    Args:
+        store (ResultStore): Database hasil scraping
+        base_path (str): Path output tanpa ekstensi (misalnya output/publikasi_dosen_20250101)
+        dosen_names (Optional[List[str]]): Dosen yang diekspor sesuai urutan (default: semua dosen)
+        years (Optional[List[int]]): Tahun untuk kolom <tahun>_cited_by (default: semua tahun)
+        formats (tuple): Kombinasi 'csv', 'excel', 'docx', 'parquet'
+        docx_lecturers_per_file (Optional[int]): Jika diisi, ringkasan DOCX dipecah menjadi beberapa
+                                                 file (dibuat paralel) di folder <base_path>_summary
+        
+    Returns:
+        Dict[str, str]: Path file (atau folder DOCX terpisah) per format (kosong jika tidak ada data)
+    """
+    df = store.query_dataframe(dosen_names, years=years)
+    if df.empty:
+        return {}
+    
+    paths = {}
+    if 'csv' in formats:
+        paths['csv'] = save_to_csv(df, f"{base_path}.csv")
+    if 'excel' in formats:
+        paths['excel'] = save_to_excel(df, f"{base_path}.xlsx")
+    if 'docx' in formats and docx_lecturers_per_file:
+        generate_summary_docx_parts(df, f"{base_path}_summary", lecturers_per_part=docx_lecturers_per_file)
+        paths['docx'] = os.path.abspath(f"{base_path}_summary")
+    elif 'docx' in formats:
+        paths['docx'] = generate_summary_docx(df, f"{base_path}_summary.docx")
+    if 'parquet' in formats:
+        paths['parquet'] = save_to_parquet(df, f"{base_path}.parquet")
+    return paths
+
+
 def ensure_output_directory(directory: str = 'output') -> str:
     """
     Memastikan direktori output ada, jika tidak akan dibuat.
@@ -262,10 +528,21 @@ def transfer_data_to_sheets(
     spreadsheet_url: str,
     sheet_name: str = None,
     web_app_url: str = None,
-    status_callback=None
+    status_callback=None,
+    chunk_rows: int = None,
+    delta: bool = False,
+    manifest_dir: str = "cache/sheets_manifest"
 ) -> dict:
     """
     Transfer data dari file Excel lokal ke Google Spreadsheet melalui Apps Script Web API.
+    Data dikirim per chunk (chunk_rows baris, JSON gzip+base64) dengan aksi init/append/finalize;
+    jika upload terhenti, menjalankan ulang upload file yang sama melanjutkan dari chunk
+    terakhir yang sudah diterima server.
+    
+    Dengan delta=True, hanya baris yang baru, berubah, atau hilang sejak upload terakhir ke sheet
+    yang sama yang dikirim (dibandingkan dengan manifest lokal berisi hash setiap baris).
+    Upload penuh tetap dipakai jika belum ada manifest, header berubah, perubahan lebih dari
+    satu chunk, atau isi sheet tidak lagi cocok dengan manifest.
     
     Args:
         excel_file_path (str): Path ke file Excel yang akan diupload
@@ -274,7 +551,11 @@ def transfer_data_to_sheets(
                                     Jika None, akan menggunakan DEFAULT_SHEET_NAME dari .env
         web_app_url (str, optional): URL Web App dari Apps Script.
                                      Jika None, akan menggunakan APPS_SCRIPT_URL dari .env
-        status_callback (callable, optional): Fungsi callback untuk update status
+        status_callback (callable, optional): Fungsi callback untuk update status (termasuk progres chunk)
+        chunk_rows (int, optional): Baris per chunk. Jika None, memakai UPLOAD_CHUNK_ROWS dari .env (2000)
+        delta (bool): Kirim hanya baris yang berubah sejak upload terakhir (delta sync)
+        manifest_dir (str): Folder manifest upload terakhir per sheet (diperbarui setiap upload,
+                            dipakai oleh delta sync)
         
     Returns:
         dict: Response dari API dengan status dan pesan
@@ -283,8 +564,6 @@ def transfer_data_to_sheets(
         FileNotFoundError: Jika file Excel tidak ditemukan
         ValueError: Jika format file tidak valid atau konfigurasi tidak lengkap
     """
-    import requests
-    import json
     from src.core_logic.utils import extract_spreadsheet_id_from_url
     
     # Gunakan nilai dari .env jika parameter tidak diberikan
@@ -333,61 +612,219 @@ def transfer_data_to_sheets(
     log("📦 Menyiapkan data untuk transfer...")
     
     # Header
-    headers = df.columns.tolist()
+    headers = [str(column) for column in df.columns]
+    total_rows = len(df)
     
-    # Data rows
-    data_rows = df.values.tolist()
+    if chunk_rows is None:
+        chunk_rows = int(get_config('UPLOAD_CHUNK_ROWS', '2000'))
+    chunk_rows = max(1, chunk_rows)
+    total_chunks = (total_rows + chunk_rows - 1) // chunk_rows
+    timeout = int(get_config('HTTP_TIMEOUT', '60'))
     
     # Convert semua nilai ke string untuk menghindari masalah JSON
-    data_rows = [[str(cell) if pd.notna(cell) else "" for cell in row] for row in data_rows]
-    
-    # Gabungkan header dan data
-    all_data = [headers] + data_rows
+    data_rows = [[str(cell) if pd.notna(cell) else "" for cell in row] for row in df.values.tolist()]
     
     log(f"📊 Total kolom: {len(headers)}")
-    log(f"📊 Total baris data: {len(data_rows)}")
+    log(f"📊 Total baris data: {total_rows} ({total_chunks} chunk x {chunk_rows} baris)")
     
-    # Siapkan payload untuk API
-    payload = {
-        "spreadsheetId": spreadsheet_id,
-        "sheetName": sheet_name,
-        "data": all_data
-    }
+    manifest_store = SheetManifest(manifest_dir)
+    if delta:
+        result = _send_delta(manifest_store, web_app_url, spreadsheet_id, sheet_name, headers,
+                             data_rows, chunk_rows, timeout, log)
+        if result is not None:
+            return result
+    
+    # ID upload ditentukan dari isi file dan tujuan: menjalankan ulang upload file yang sama
+    # melanjutkan dari chunk terakhir yang sudah diterima server
+    upload_id = _upload_id(excel_file_path, spreadsheet_id, sheet_name, chunk_rows)
+    
+    # Upload penuh menimpa isi sheet: manifest lama tidak berlaku lagi, juga jika upload terhenti
+    manifest_store.clear(spreadsheet_id, sheet_name)
     
     log("🚀 Mengirim data ke Google Sheets...")
     log(f"   Target: {sheet_name}")
     
-    try:
-        # Kirim POST request ke Apps Script Web App
-        response = requests.post(
-            web_app_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=60
-        )
+    init = _post_upload_action(web_app_url, {
+        "action": "init",
+        "uploadId": upload_id,
+        "spreadsheetId": spreadsheet_id,
+        "sheetName": sheet_name,
+        "header": headers,
+        "totalRows": total_rows,
+        "totalChunks": total_chunks,
+        "chunkRows": chunk_rows,
+    }, timeout, log)
+    
+    next_chunk = int(init.get("nextChunk", 0))
+    if next_chunk > 0:
+        log(f"♻️  Melanjutkan upload sebelumnya dari chunk {next_chunk + 1}/{total_chunks}")
+    
+    for chunk_index in range(next_chunk, total_chunks):
+        offset = chunk_index * chunk_rows
+        rows = data_rows[offset:offset + chunk_rows]
         
-        response.raise_for_status()
-        result = response.json()
+        _post_upload_action(web_app_url, {
+            "action": "append",
+            "uploadId": upload_id,
+            "chunkIndex": chunk_index,
+            "offset": offset,
+            "encoding": "gzip+base64",
+            "payload": _encode_payload(rows),
+        }, timeout, log)
         
-        if result.get("status") == "success":
-            log("✅ SUKSES: Data berhasil ditulis ke Google Sheets!")
-            log(f"   Spreadsheet ID: {spreadsheet_id}")
-            log(f"   Sheet: {sheet_name}")
-            log(f"   Baris ditulis: {len(all_data)}")
-            return result
-        else:
-            error_msg = result.get("message", "Unknown error")
-            log(f"❌ GAGAL: {error_msg}")
-            raise Exception(error_msg)
-            
-    except requests.exceptions.Timeout:
-        log("❌ ERROR: Request timeout (>60 detik)")
-        raise Exception("Request timeout. Coba lagi atau periksa koneksi internet.")
+        done = offset + len(rows)
+        log(f"📤 Chunk {chunk_index + 1}/{total_chunks}: {done}/{total_rows} baris "
+            f"({done * 100 // max(total_rows, 1)}%)")
+    
+    result = _post_upload_action(web_app_url, {
+        "action": "finalize",
+        "uploadId": upload_id,
+        "totalRows": total_rows,
+    }, timeout, log)
+    
+    # Manifest untuk delta sync berikutnya (juga setelah upload tanpa delta):
+    # urutan baris sama dengan file yang diupload
+    full = compute_delta({'header': headers}, headers, data_rows)
+    manifest_store.save(spreadsheet_id, sheet_name, headers, full['keys'], full['hashes'])
+    
+    log("✅ SUKSES: Data berhasil ditulis ke Google Sheets!")
+    log(f"   Spreadsheet ID: {spreadsheet_id}")
+    log(f"   Sheet: {sheet_name}")
+    log(f"   Baris ditulis: {result.get('rowsWritten', total_rows + 1)}")
+    return result
+
+
+def _upload_id(excel_file_path: str, spreadsheet_id: str, sheet_name: str, chunk_rows: int) -> str:
+    """
+    ID upload yang stabil untuk file dan tujuan yang sama (dipakai server untuk resume).
+    """
+    digest = hashlib.sha256()
+    with open(excel_file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    digest.update(f"|{spreadsheet_id}|{sheet_name}|{chunk_rows}".encode('utf-8'))
+    return digest.hexdigest()[:24]
+
+
+def _send_delta(manifest_store: SheetManifest, web_app_url: str, spreadsheet_id: str, sheet_name: str,
+                headers: List[str], data_rows: List[List[str]], chunk_rows: int, timeout: int, log) -> Optional[dict]:
+    """
+    Mengirim hanya baris yang berubah sejak upload terakhir (aksi 'delta' di Apps Script).
+    
+    Returns:
+        Optional[dict]: Response server, atau None jika harus upload penuh
+    """
+    manifest = manifest_store.load(spreadsheet_id, sheet_name)
+    if manifest is None:
+        log("ℹ️  Belum ada manifest upload untuk sheet ini: upload penuh")
+        return None
+    
+    changes = compute_delta(manifest, headers, data_rows)
+    if changes is None:
+        log("ℹ️  Kolom berubah sejak upload terakhir: upload penuh")
+        return None
+    
+    updated = sum(count for _, count, _ in changes['updates'])
+    deleted = sum(count for _, count in changes['deletes'])
+    log(f"🔁 Delta: {updated} berubah, {len(changes['inserts'])} baru, {deleted} dihapus")
+    if changes['changed_rows'] > chunk_rows:
+        log(f"ℹ️  Perubahan lebih dari {chunk_rows} baris: upload penuh")
+        return None
+    
+    if changes['changed_rows'] == 0:
+        log("✅ Tidak ada perubahan sejak upload terakhir, sheet sudah terbaru")
+        return {"status": "success", "rowsWritten": 0, "cellsWritten": 0}
+    
+    body = {key: changes[key] for key in ('updates', 'deletes', 'inserts')}
+    payload = _encode_payload(body)
+    result = _post_upload_action(web_app_url, {
+        "action": "delta",
+        # ID sama untuk delta yang sama: server tidak menerapkannya dua kali jika request diulang
+        "deltaId": hashlib.sha256(f"{manifest.get('updated_at')}|{payload}".encode('utf-8')).hexdigest()[:24],
+        "spreadsheetId": spreadsheet_id,
+        "sheetName": sheet_name,
+        "header": headers,
+        "expectedRows": len(manifest.get('keys', [])) + 1,
+        "encoding": "gzip+base64",
+        "payload": payload,
+    }, timeout, log)
+    
+    if result.get("status") == "conflict":
+        log(f"⚠️ {result.get('message', 'Isi sheet tidak cocok dengan manifest')}: upload penuh")
+        manifest_store.clear(spreadsheet_id, sheet_name)
+        return None
+    
+    manifest_store.save(spreadsheet_id, sheet_name, headers, changes['keys'], changes['hashes'])
+    cells = (updated + len(changes['inserts'])) * len(headers)
+    log("✅ SUKSES: Perubahan berhasil ditulis ke Google Sheets!")
+    log(f"   Sheet: {sheet_name}")
+    log(f"   Baris berubah: {changes['changed_rows']} (±{cells} cell, bukan {(len(data_rows) + 1) * len(headers)})")
+    result.setdefault("cellsWritten", cells)
+    return result
+
+
+def _encode_payload(data) -> str:
+    """
+    Mengompres data (JSON) dengan gzip lalu base64, sesuai Utilities.ungzip di Apps Script.
+    """
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.b64encode(gzip.compress(raw)).decode('ascii')
+
+
+def _post_upload_action(web_app_url: str, payload: dict, timeout: int, log,
+                        max_attempts: int = 4) -> dict:
+    """
+    Mengirim satu aksi upload (init/append/finalize) ke Apps Script Web App, diulang dengan
+    jeda bertambah jika gagal. Append menulis di offset tetap, jadi aman dikirim ulang.
     
-    except requests.exceptions.RequestException as e:
-        log(f"❌ ERROR: Gagal menghubungi server - {e}")
-        raise Exception(f"Gagal menghubungi server: {e}")
+    Args:
+        web_app_url (str): URL Web App
+        payload (dict): Isi request (harus berisi 'action')
+        timeout (int): Timeout per request (detik)
+        log (callable): Fungsi log status
+        max_attempts (int): Jumlah percobaan maksimal
+        
+    Returns:
+        dict: Response JSON dengan status 'success'
+    """
+    import requests
     
-    except json.JSONDecodeError:
-        log("❌ ERROR: Response dari server tidak valid")
-        raise Exception("Response dari server tidak valid (bukan JSON)")
+    last_error = None
+    for attempt in range(1, max_attempts + 1):
+        try:
+            response = requests.post(
+                web_app_url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            result = response.json()
+            # 'conflict' (isi sheet tidak cocok dengan manifest delta) tidak perlu diulang
+            if result.get("status") in ("success", "conflict"):
+                return result
+            last_error = result.get("message", "Unknown error")
+        except requests.exceptions.Timeout:
+            last_error = f"Request timeout (>{timeout} detik)"
+        except requests.exceptions.HTTPError as e:
+            last_error = f"Gagal menghubungi server - {e}"
+            if e.response is not None and e.response.status_code < 500:
+                # 4xx (mis. 403 akses Web App) tidak akan berhasil jika diulang
+                log(f"❌ ERROR: {last_error}")
+                raise Exception(last_error)
+        except requests.exceptions.RequestException as e:
+            last_error = f"Gagal menghubungi server - {e}"
+        except ValueError:
+            last_error = "Response dari server tidak valid (bukan JSON)"
+        
+        if attempt < max_attempts:
+            delay = 2 ** attempt
+            log(f"⚠️ {payload['action']} gagal (percobaan {attempt}/{max_attempts}): {last_error}. "
+                f"Coba lagi dalam {delay} detik...")
+            time.sleep(delay)
+    
+    log(f"❌ GAGAL: {last_error}")
+    if payload['action'] == 'append':
+        raise Exception(f"{last_error}\nUpload terhenti di chunk {payload['chunkIndex'] + 1}; "
+                        f"jalankan upload file yang sama lagi untuk melanjutkan.")
+    raise Exception(last_error)
@@ -0,0 +1,158 @@
+"""
+HTTP fetch module for Google Scholar scraper.
+Mengambil HTML mentah halaman Google Scholar melalui requests.Session (connection pool)
+tanpa membuka browser, untuk kemudian di-parse oleh lapisan parser (parsers.py: lxml atau BeautifulSoup).
+"""
+
+from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+
+SCHOLAR_BASE_URL = "https://scholar.google.com"
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+
+class CaptchaDetectedError(Exception):
+    """
+    Dilempar ketika Google Scholar mengembalikan halaman CAPTCHA / unusual traffic.
+    """
+    pass
+
+
+class FetchTimeoutError(Exception):
+    """
+    Dilempar ketika request HTTP melebihi batas timeout.
+    """
+    pass
+
+
+def detect_captcha_signal(html: str, url: str = "", status_code: int = 200) -> Optional[str]:
+    """
+    Mendeteksi sinyal CAPTCHA pada response HTTP.
+
+    Args:
+        html (str): Isi HTML response
+        url (str): URL akhir setelah redirect
+        status_code (int): HTTP status code
+
+    Returns:
+        Optional[str]: Nama sinyal yang terdeteksi, None jika bukan halaman CAPTCHA
+    """
+    if status_code == 429:
+        return 'http_429'
+    if '/sorry/' in url:
+        return 'sorry_redirect'
+
+    if not html:
+        return None
+
+    if 'id="gs_captcha_ccl"' in html:
+        return 'gs_captcha_ccl'
+    if 'id="captcha-form"' in html:
+        return 'captcha_form'
+    if 'google.com/recaptcha' in html:
+        return 'recaptcha_iframe'
+    return None
+
+
+def is_captcha_response(html: str, url: str = "", status_code: int = 200) -> bool:
+    """
+    Memeriksa apakah response HTTP merupakan halaman CAPTCHA.
+
+    Args:
+        html (str): Isi HTML response
+        url (str): URL akhir setelah redirect
+        status_code (int): HTTP status code
+
+    Returns:
+        bool: True jika response adalah halaman CAPTCHA
+    """
+    return detect_captcha_signal(html, url, status_code) is not None
+
+
+class HttpFetcher:
+    """
+    Backend fetch ringan berbasis HTTP dengan session yang di-pool.
+    Satu instance aman dipakai bersama oleh beberapa worker thread.
+    """
+
+    def __init__(self, timeout: int = 10, pool_size: int = 10, user_agent: Optional[str] = None):
+        """
+        Inisialisasi HTTP session.
+
+        Args:
+            timeout (int): Timeout request dalam detik
+            pool_size (int): Jumlah koneksi maksimal yang disimpan di pool
+            user_agent (Optional[str]): User agent, default sama dengan Chrome di Selenium
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.session.headers.update({
+            'User-Agent': user_agent or DEFAULT_USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'id,en-US;q=0.7,en;q=0.3',
+        })
+
+    def fetch(self, url: str) -> Optional[str]:
+        """
+        Mengambil HTML mentah dari URL.
+
+        Args:
+            url (str): URL halaman Google Scholar
+
+        Returns:
+            Optional[str]: HTML halaman, atau None jika request gagal
+
+        Raises:
+            CaptchaDetectedError: Jika Google Scholar meminta CAPTCHA
+            FetchTimeoutError: Jika request melebihi batas timeout
+        """
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.exceptions.Timeout as e:
+            raise FetchTimeoutError(f"Timeout saat HTTP fetch {url}: {e}")
+        except requests.exceptions.RequestException as e:
+            print(f"Error saat HTTP fetch {url}: {e}")
+            return None
+
+        signal = detect_captcha_signal(response.text, response.url, response.status_code)
+        if signal:
+            raise CaptchaDetectedError(f"CAPTCHA terdeteksi pada HTTP fetch ({signal}): {url}")
+
+        if response.status_code != 200:
+            print(f"HTTP {response.status_code} untuk {url}")
+            return None
+
+        return response.text
+
+    def import_cookies(self, cookies: List[Dict]):
+        """
+        Menyalin cookies dari Selenium WebDriver ke HTTP session.
+        Dipakai setelah CAPTCHA diselesaikan di browser agar request HTTP berikutnya ikut lolos.
+
+        Args:
+            cookies (List[Dict]): Hasil driver.get_cookies()
+        """
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+
+    def close(self):
+        """
+        Menutup HTTP session dan semua koneksi di pool.
+        """
+        self.session.close()
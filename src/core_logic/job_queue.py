@@ -0,0 +1,389 @@
+"""
+Job queue module for Google Scholar scraper.
+Antrian tugas berbasis SQLite untuk mode coordinator/worker: coordinator membuat satu job
+berisi satu tugas per dosen, lalu worker (di mesin yang sama atau di beberapa mesin yang
+membuka file database yang sama lewat folder bersama) mengklaim tugas dengan lease,
+memperpanjang lease lewat heartbeat selama scraping, dan mengirim hasilnya kembali.
+Tugas yang lease-nya habis (worker crash atau mesin mati) otomatis dikembalikan ke antrian.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+
+# Status tugas
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    total INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    job_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    nama TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    updated_at REAL,
+    PRIMARY KEY (job_id, nama)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (job_id, status, position);
+"""
+
+
+class JobQueue:
+    """
+    Antrian tugas per dosen di satu file SQLite.
+    Setiap operasi membuka koneksi sendiri dan menulis di dalam transaksi BEGIN IMMEDIATE,
+    sehingga aman dipakai bersamaan oleh beberapa thread, proses, maupun mesin.
+    Journal mode default (bukan WAL) dipakai agar file tetap bisa dibuka lewat folder jaringan.
+    """
+
+    def __init__(self, db_path: str, lease_seconds: float = 300.0, max_attempts: int = 3,
+                 clock: Callable[[], float] = time.time):
+        """
+        Inisialisasi job queue (database dan tabel dibuat jika belum ada).
+
+        Args:
+            db_path (str): Path file SQLite
+            lease_seconds (float): Lama lease tugas sebelum dianggap ditinggalkan worker
+            max_attempts (int): Jumlah klaim maksimal per tugas sebelum ditandai gagal
+            clock (Callable[[], float]): Sumber waktu epoch (bisa diganti untuk test)
+        """
+        self.db_path = db_path
+        self.lease_seconds = float(lease_seconds)
+        self.max_attempts = max(1, int(max_attempts))
+        self._clock = clock
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Membuka koneksi baru (autocommit; transaksi diatur manual).
+        """
+        conn = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _transaction(self):
+        """
+        Membuka koneksi dengan transaksi tulis yang langsung mengunci database.
+
+        Returns:
+            _Transaction: Context manager yang commit saat sukses dan rollback saat error
+        """
+        return _Transaction(self._connect())
+
+    def _expire_leases(self, conn: sqlite3.Connection, job_id: str):
+        """
+        Mengembalikan tugas yang lease-nya habis ke antrian, atau menandainya gagal jika
+        sudah mencapai max_attempts (dipanggil di dalam transaksi).
+        """
+        now = self._clock()
+        conn.execute(
+            "UPDATE tasks SET status = ?, worker_id = NULL, lease_expires = NULL, updated_at = ?, "
+            "error = 'Lease habis setelah ' || attempts || ' percobaan' "
+            "WHERE job_id = ? AND status = ? AND lease_expires < ? AND attempts >= ?",
+            (FAILED, now, job_id, LEASED, now, self.max_attempts)
+        )
+        conn.execute(
+            "UPDATE tasks SET status = ?, worker_id = NULL, lease_expires = NULL, updated_at = ? "
+            "WHERE job_id = ? AND status = ? AND lease_expires < ?",
+            (PENDING, now, job_id, LEASED, now)
+        )
+
+    def create_job(self, dosen_names: List[str], job_id: Optional[str] = None) -> str:
+        """
+        Membuat job baru dengan satu tugas per nama dosen (nama duplikat hanya dibuat sekali).
+        Jika job_id sudah ada, job tersebut dipakai apa adanya.
+
+        Args:
+            dosen_names (List[str]): Nama dosen yang sudah dibersihkan, sesuai urutan input
+            job_id (Optional[str]): ID job (default: timestamp)
+
+        Returns:
+            str: ID job
+        """
+        job_id = job_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        names = list(dict.fromkeys(dosen_names))
+        now = self._clock()
+
+        with self._transaction() as conn:
+            exists = conn.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if exists:
+                return job_id
+            conn.execute("INSERT INTO jobs (job_id, created_at, total) VALUES (?, ?, ?)",
+                         (job_id, now, len(names)))
+            conn.executemany(
+                "INSERT INTO tasks (job_id, position, nama, status, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(job_id, position, nama, PENDING, now) for position, nama in enumerate(names)]
+            )
+        return job_id
+
+    def latest_job(self) -> Optional[str]:
+        """
+        Returns:
+            Optional[str]: ID job terbaru, None jika belum ada job
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT job_id FROM jobs ORDER BY created_at DESC LIMIT 1").fetchone()
+        return row['job_id'] if row else None
+
+    def claim(self, job_id: str, worker_id: str) -> Optional[Dict]:
+        """
+        Mengklaim tugas pending berikutnya (sesuai urutan input) dengan lease baru.
+
+        Args:
+            job_id (str): ID job
+            worker_id (str): ID worker yang mengklaim
+
+        Returns:
+            Optional[Dict]: nama, position, attempts; None jika tidak ada tugas yang bisa diklaim
+        """
+        now = self._clock()
+        with self._transaction() as conn:
+            self._expire_leases(conn, job_id)
+            row = conn.execute(
+                "SELECT nama, position, attempts FROM tasks WHERE job_id = ? AND status = ? "
+                "ORDER BY position LIMIT 1",
+                (job_id, PENDING)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = ?, worker_id = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE job_id = ? AND nama = ?",
+                (LEASED, worker_id, now + self.lease_seconds, now, job_id, row['nama'])
+            )
+        return {'nama': row['nama'], 'position': row['position'], 'attempts': row['attempts'] + 1}
+
+    def heartbeat(self, job_id: str, nama_dosen: str, worker_id: str) -> bool:
+        """
+        Memperpanjang lease tugas yang sedang dikerjakan.
+
+        Returns:
+            bool: False jika lease sudah tidak dimiliki worker ini (diambil alih worker lain)
+        """
+        now = self._clock()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? "
+                "WHERE job_id = ? AND nama = ? AND status = ? AND worker_id = ?",
+                (now + self.lease_seconds, now, job_id, nama_dosen, LEASED, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, nama_dosen: str, worker_id: str, publications: List[Dict]) -> bool:
+        """
+        Menyimpan hasil tugas dan menandainya selesai.
+
+        Args:
+            job_id (str): ID job
+            nama_dosen (str): Nama dosen
+            worker_id (str): ID worker pemilik lease
+            publications (List[Dict]): Publikasi hasil scraping
+
+        Returns:
+            bool: False jika tugas sudah diambil alih worker lain (hasil ini dibuang)
+        """
+        result = json.dumps(publications, ensure_ascii=False, default=str)
+        now = self._clock()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = ?, result = ?, error = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE job_id = ? AND nama = ? AND status = ? AND worker_id = ?",
+                (DONE, result, now, job_id, nama_dosen, LEASED, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: str, nama_dosen: str, worker_id: str, error: str, retry: bool = True) -> Optional[str]:
+        """
+        Melaporkan tugas yang gagal. Tugas dikembalikan ke antrian (bisa diambil worker lain)
+        selama retry=True dan percobaan belum mencapai max_attempts.
+
+        Args:
+            job_id (str): ID job
+            nama_dosen (str): Nama dosen
+            worker_id (str): ID worker pemilik lease
+            error (str): Pesan error
+            retry (bool): False untuk kegagalan permanen (misalnya profil tidak ditemukan)
+
+        Returns:
+            Optional[str]: Status baru ('pending' atau 'failed'), None jika lease tidak dimiliki
+        """
+        now = self._clock()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts FROM tasks WHERE job_id = ? AND nama = ? AND status = ? AND worker_id = ?",
+                (job_id, nama_dosen, LEASED, worker_id)
+            ).fetchone()
+            if row is None:
+                return None
+            status = PENDING if retry and row['attempts'] < self.max_attempts else FAILED
+            conn.execute(
+                "UPDATE tasks SET status = ?, error = ?, worker_id = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE job_id = ? AND nama = ?",
+                (status, error, now, job_id, nama_dosen)
+            )
+        return status
+
+    def release(self, job_id: str, nama_dosen: str, worker_id: str):
+        """
+        Mengembalikan tugas ke antrian tanpa dihitung sebagai percobaan (misalnya worker dihentikan).
+        """
+        now = self._clock()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE tasks SET status = ?, attempts = MAX(attempts - 1, 0), worker_id = NULL, "
+                "lease_expires = NULL, updated_at = ? "
+                "WHERE job_id = ? AND nama = ? AND status = ? AND worker_id = ?",
+                (PENDING, now, job_id, nama_dosen, LEASED, worker_id)
+            )
+
+    def progress(self, job_id: str) -> Dict[str, int]:
+        """
+        Jumlah tugas per status (lease yang habis dikembalikan ke antrian terlebih dahulu).
+
+        Returns:
+            Dict[str, int]: total, pending, leased, done, failed
+        """
+        with self._transaction() as conn:
+            self._expire_leases(conn, job_id)
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS count FROM tasks WHERE job_id = ? GROUP BY status",
+                (job_id,)
+            ).fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update({row['status']: row['count'] for row in rows})
+        counts['total'] = sum(counts.values())
+        return counts
+
+    def is_finished(self, job_id: str) -> bool:
+        """
+        Returns:
+            bool: True jika semua tugas sudah selesai atau gagal permanen
+        """
+        counts = self.progress(job_id)
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    def results(self, job_id: str) -> List[Dict]:
+        """
+        Semua publikasi dari tugas yang selesai, urut sesuai input.
+
+        Returns:
+            List[Dict]: Publikasi (key tahun Cited_By_Per_Year dikembalikan ke int)
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT result FROM tasks WHERE job_id = ? AND status = ? ORDER BY position",
+                (job_id, DONE)
+            ).fetchall()
+
+        publications = []
+        for row in rows:
+            for pub in json.loads(row['result'] or '[]'):
+                # JSON menyimpan key tahun sebagai string; kembalikan ke int
+                per_year = pub.get('Cited_By_Per_Year')
+                if isinstance(per_year, dict):
+                    pub['Cited_By_Per_Year'] = {int(year): count for year, count in per_year.items()}
+                publications.append(pub)
+        return publications
+
+    def failures(self, job_id: str) -> List[Dict]:
+        """
+        Tugas yang gagal permanen.
+
+        Returns:
+            List[Dict]: nama, attempts, error
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT nama, attempts, error FROM tasks WHERE job_id = ? AND status = ? ORDER BY position",
+                (job_id, FAILED)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
+class _Transaction:
+    """
+    Context manager transaksi BEGIN IMMEDIATE untuk satu koneksi.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.conn.close()
+        return False
+
+
+class LeaseHeartbeat:
+    """
+    Thread latar yang memperpanjang lease satu tugas secara berkala selama tugas dikerjakan.
+    Dipakai sebagai context manager di sekitar scraping satu dosen.
+    """
+
+    def __init__(self, job_queue: JobQueue, job_id: str, nama_dosen: str, worker_id: str,
+                 interval: Optional[float] = None):
+        """
+        Args:
+            job_queue (JobQueue): Antrian tugas
+            job_id (str): ID job
+            nama_dosen (str): Nama dosen yang sedang dikerjakan
+            worker_id (str): ID worker pemilik lease
+            interval (Optional[float]): Jeda antar heartbeat (default: sepertiga lease)
+        """
+        self.job_queue = job_queue
+        self.job_id = job_id
+        self.nama_dosen = nama_dosen
+        self.worker_id = worker_id
+        self.interval = interval or job_queue.lease_seconds / 3
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="job-heartbeat", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if not self.job_queue.heartbeat(self.job_id, self.nama_dosen, self.worker_id):
+                    self.lost = True
+                    print(f"⚠️ Lease {self.nama_dosen} diambil alih worker lain")
+                    return
+            except sqlite3.Error as e:
+                print(f"⚠️ Heartbeat gagal: {e}")
+
+    def __enter__(self) -> 'LeaseHeartbeat':
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        return False
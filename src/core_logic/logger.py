@@ -4,9 +4,11 @@ Mencatat semua aktivitas scraping termasuk success, failure, dan CAPTCHA errors.
 """
 
 import os
+import re
 import json
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import pandas as pd
 
 
@@ -15,15 +17,18 @@ class ScraperLogger:
     Logger untuk mencatat proses scraping dengan detail lengkap.
     """
     
-    def __init__(self, log_dir: str = "logging"):
+    def __init__(self, log_dir: str = "logging", session_id: Optional[str] = None, resume: bool = False):
         """
         Initialize logger.
         
         Args:
             log_dir: Base directory untuk menyimpan log files
+            session_id: Session ID yang dipakai (session yang dilanjutkan atau shard); None untuk ID baru
+            resume: True jika run ini melanjutkan session_id; file log ditulis dengan
+                    akhiran _resume<N> agar log run sebelumnya tidak tertimpa
         """
         self.base_log_dir = log_dir
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.start_time = None
         self.end_time = None
         
@@ -36,10 +41,28 @@ class ScraperLogger:
         self.failed_list = []
         self.captcha_list = []
         self.details = []
+        self.timings = []
+        self.fetch_counts = {}
+        self.fetch_events = []  # Event fetch CAPTCHA/TIMEOUT (bukan per dosen, terpisah dari details)
+        self.rate_changes = []
+        
+        # Listener event fetch (misalnya AdaptiveRateLimiter.handle_event)
+        self._listeners: List[Callable[[str], None]] = []
+        
+        # Lock agar event dari beberapa worker thread tidak saling menimpa
+        self._lock = threading.Lock()
         
         # Ensure session log directory exists
         os.makedirs(self.log_dir, exist_ok=True)
         
+        # ID untuk nama file log: run lanjutan memakai <session_id>_resume<N> berikutnya
+        self.file_id = self.session_id
+        if resume:
+            run_number = 1
+            while os.path.exists(os.path.join(self.log_dir, f"summary_{self.session_id}_resume{run_number}.json")):
+                run_number += 1
+            self.file_id = f"{self.session_id}_resume{run_number}"
+        
     def start_session(self, dosen_names: List[str]):
         """
         Memulai session logging.
@@ -59,6 +82,18 @@ class ScraperLogger:
         print(f"Log Directory: {self.log_dir}")
         print(f"{'='*60}\n")
         
+    def register_dosen(self, nama_dosen: str):
+        """
+        Menambahkan dosen ke session yang sudah berjalan (misalnya worker job queue yang
+        baru mengetahui nama dosen saat mengambil tugas).
+        
+        Args:
+            nama_dosen: Nama dosen yang akan di-scrape
+        """
+        with self._lock:
+            if nama_dosen not in self.dosen_list:
+                self.dosen_list.append(nama_dosen)
+        
     def log_success(self, nama_dosen: str, publications_count: int, detail_msg: str = ""):
         """
         Log scraping yang berhasil.
@@ -68,15 +103,16 @@ class ScraperLogger:
             publications_count: Jumlah publikasi yang berhasil di-scrape
             detail_msg: Pesan detail tambahan
         """
-        self.success_list.append(nama_dosen)
-        self.details.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'nama_dosen': nama_dosen,
-            'status': 'SUCCESS',
-            'publications_count': publications_count,
-            'detail': detail_msg
-        })
-        print(f"✅ SUCCESS: {nama_dosen} ({publications_count} publikasi)")
+        with self._lock:
+            self.success_list.append(nama_dosen)
+            self.details.append({
+                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'nama_dosen': nama_dosen,
+                'status': 'SUCCESS',
+                'publications_count': publications_count,
+                'detail': detail_msg
+            })
+            print(f"✅ SUCCESS: {nama_dosen} ({publications_count} publikasi)")
         
     def log_failure(self, nama_dosen: str, error_msg: str, error_type: str = "GENERAL_ERROR"):
         """
@@ -87,22 +123,127 @@ class ScraperLogger:
             error_msg: Pesan error
             error_type: Tipe error (CAPTCHA, TIMEOUT, NOT_FOUND, etc.)
         """
-        self.failed_list.append(nama_dosen)
+        with self._lock:
+            self.failed_list.append(nama_dosen)
+            
+            if error_type == "CAPTCHA":
+                self.captcha_list.append(nama_dosen)
+                
+            self.details.append({
+                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'nama_dosen': nama_dosen,
+                'status': 'FAILED',
+                'error_type': error_type,
+                'error_message': error_msg,
+                'publications_count': 0
+            })
+            
+            icon = "🤖" if error_type == "CAPTCHA" else "❌"
+            print(f"{icon} {error_type}: {nama_dosen} - {error_msg}")
+        
+    def last_failure(self, nama_dosen: str) -> Optional[Dict]:
+        """
+        Mencari kegagalan terakhir untuk satu dosen.
         
-        if error_type == "CAPTCHA":
-            self.captcha_list.append(nama_dosen)
+        Args:
+            nama_dosen: Nama dosen
             
-        self.details.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'nama_dosen': nama_dosen,
-            'status': 'FAILED',
-            'error_type': error_type,
-            'error_message': error_msg,
-            'publications_count': 0
-        })
-        
-        icon = "🤖" if error_type == "CAPTCHA" else "❌"
-        print(f"{icon} {error_type}: {nama_dosen} - {error_msg}")
+        Returns:
+            Entry detail (error_type, error_message, ...) atau None jika dosen tidak gagal
+        """
+        with self._lock:
+            for entry in reversed(self.details):
+                if entry['nama_dosen'] == nama_dosen and entry['status'] in ('SUCCESS', 'FAILED'):
+                    return entry if entry['status'] == 'FAILED' else None
+        return None
+        
+    def add_listener(self, callback: Callable[[str], None]):
+        """
+        Mendaftarkan callback yang dipanggil untuk setiap event fetch (lihat log_fetch_event).
+        
+        Args:
+            callback: Fungsi dengan satu argumen event_type
+        """
+        self._listeners.append(callback)
+        
+    def log_fetch_event(self, event_type: str, url: str = ""):
+        """
+        Log hasil satu fetch halaman dan teruskan ke listener.
+        
+        Args:
+            event_type: 'OK', 'CAPTCHA', atau 'TIMEOUT'
+            url: URL halaman yang diambil
+        """
+        with self._lock:
+            self.fetch_counts[event_type] = self.fetch_counts.get(event_type, 0) + 1
+            if event_type != 'OK':
+                self.fetch_events.append({
+                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'event_type': event_type,
+                    'url': url
+                })
+        
+        # Di luar lock: listener boleh memanggil record_rate_change
+        for callback in self._listeners:
+            callback(event_type)
+        
+    def record_rate_change(self, rate_per_minute: float, reason: str):
+        """
+        Mencatat perubahan laju rate limiter.
+        
+        Args:
+            rate_per_minute: Laju baru (halaman per menit)
+            reason: Penyebab perubahan (SUCCESS, CAPTCHA, TIMEOUT)
+        """
+        with self._lock:
+            self.rate_changes.append({
+                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'rate_per_minute': round(rate_per_minute, 2),
+                'reason': reason
+            })
+        
+        icon = "🐇" if reason == 'SUCCESS' else "🐢"
+        print(f"{icon} Rate limit: {rate_per_minute:.1f} halaman/menit ({reason})")
+        
+    def record_timing(self, step: str, seconds: float, nama_dosen: str = ""):
+        """
+        Mencatat durasi satu langkah scraping (search, profile, detail, dll).
+        
+        Args:
+            step: Nama langkah
+            seconds: Durasi wall-clock dalam detik
+            nama_dosen: Nama dosen yang sedang diproses (opsional)
+        """
+        with self._lock:
+            self.timings.append({
+                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'nama_dosen': nama_dosen,
+                'step': step,
+                'seconds': round(seconds, 4)
+            })
+    
+    def get_timing_profile(self) -> Dict:
+        """
+        Merangkum catatan durasi per langkah.
+        
+        Returns:
+            Dictionary {step: {count, total_seconds, mean_seconds, max_seconds}}
+        """
+        with self._lock:
+            timings = list(self.timings)
+        
+        profile = {}
+        for record in timings:
+            stats = profile.setdefault(record['step'], {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+            stats['count'] += 1
+            stats['total_seconds'] += record['seconds']
+            stats['max_seconds'] = max(stats['max_seconds'], record['seconds'])
+        
+        for stats in profile.values():
+            stats['total_seconds'] = round(stats['total_seconds'], 3)
+            stats['mean_seconds'] = round(stats['total_seconds'] / stats['count'], 3)
+        
+        return dict(sorted(profile.items(), key=lambda item: item[1]['total_seconds'], reverse=True))
         
     def end_session(self):
         """
@@ -118,9 +259,14 @@ class ScraperLogger:
         print(f"Duration: {duration}")
         print(f"{'='*60}\n")
         
+        self._print_timing_profile()
+        
         # Save all logs
         self._save_summary()
         self._save_detailed_log()
+        self._save_timings()
+        self._save_fetch_events()
+        self._save_rate_changes()
         self._save_failed_names()
         self._save_captcha_names()
         
@@ -157,10 +303,14 @@ class ScraperLogger:
             'dosen_processed': self.dosen_list,
             'success_list': self.success_list,
             'failed_list': self.failed_list,
-            'captcha_list': self.captcha_list
+            'captcha_list': self.captcha_list,
+            'timing': self.get_timing_profile(),
+            'fetch_events': dict(self.fetch_counts),
+            'rate_changes': len(self.rate_changes),
+            'final_rate_per_minute': self.rate_changes[-1]['rate_per_minute'] if self.rate_changes else None
         }
         
-        filename = os.path.join(self.log_dir, f"summary_{self.session_id}.json")
+        filename = os.path.join(self.log_dir, f"summary_{self.file_id}.json")
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2, ensure_ascii=False)
         
@@ -174,11 +324,70 @@ class ScraperLogger:
             return
             
         df = pd.DataFrame(self.details)
-        filename = os.path.join(self.log_dir, f"detailed_log_{self.session_id}.csv")
+        filename = os.path.join(self.log_dir, f"detailed_log_{self.file_id}.csv")
         df.to_csv(filename, index=False, encoding='utf-8-sig')
         
         print(f"📋 Detailed log saved: {filename}")
         
+    def _save_timings(self):
+        """
+        Menyimpan catatan durasi per langkah dalam format CSV.
+        """
+        if not self.timings:
+            return
+        
+        df = pd.DataFrame(self.timings)
+        filename = os.path.join(self.log_dir, f"timings_{self.file_id}.csv")
+        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        
+        print(f"⏱️  Timings saved: {filename}")
+    
+    def _save_fetch_events(self):
+        """
+        Menyimpan event fetch CAPTCHA/TIMEOUT dalam format CSV.
+        """
+        if not self.fetch_events:
+            return
+        
+        df = pd.DataFrame(self.fetch_events)
+        filename = os.path.join(self.log_dir, f"fetch_events_{self.file_id}.csv")
+        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        
+        print(f"🌐 Fetch events saved: {filename}")
+    
+    def _save_rate_changes(self):
+        """
+        Menyimpan riwayat perubahan laju rate limiter dalam format CSV.
+        """
+        if not self.rate_changes:
+            return
+        
+        df = pd.DataFrame(self.rate_changes)
+        filename = os.path.join(self.log_dir, f"rate_{self.file_id}.csv")
+        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        
+        print(f"🚦 Rate history saved: {filename}")
+    
+    def _print_timing_profile(self):
+        """
+        Menampilkan ringkasan waktu per langkah (urut dari yang paling lama).
+        """
+        profile = self.get_timing_profile()
+        if not profile:
+            return
+        
+        # dosen_total dan throttle tumpang tindih dengan langkah lain, tidak dihitung dalam persentase
+        nested = ('dosen_total', 'throttle')
+        grand_total = sum(stats['total_seconds'] for step, stats in profile.items() if step not in nested)
+        
+        print("LATENCY PROFILE")
+        print(f"{'-'*60}")
+        for step, stats in profile.items():
+            share = f"{stats['total_seconds'] / grand_total * 100:5.1f}%" if grand_total and step not in nested else "   -  "
+            print(f"{step:<16} {stats['count']:>6}x  total {stats['total_seconds']:>9.2f}s  "
+                  f"mean {stats['mean_seconds']:>7.3f}s  {share}")
+        print(f"{'-'*60}\n")
+        
     def _save_failed_names(self):
         """
         Menyimpan daftar nama yang gagal di-scrape.
@@ -187,7 +396,7 @@ class ScraperLogger:
             print("✅ No failed names to save")
             return
             
-        filename = os.path.join(self.log_dir, f"failed_names_{self.session_id}.txt")
+        filename = os.path.join(self.log_dir, f"failed_names_{self.file_id}.txt")
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(f"FAILED SCRAPING - Session: {self.session_id}\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -214,7 +423,7 @@ class ScraperLogger:
             print("✅ No CAPTCHA blocks encountered")
             return
             
-        filename = os.path.join(self.log_dir, f"captcha_blocked_{self.session_id}.txt")
+        filename = os.path.join(self.log_dir, f"captcha_blocked_{self.file_id}.txt")
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(f"CAPTCHA BLOCKED - Session: {self.session_id}\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -247,6 +456,33 @@ class ScraperLogger:
         }
 
 
+def latest_log_file(folder: str, prefix: str, extension: str) -> Optional[str]:
+    """
+    Mencari file log terbaru dengan prefix tertentu di folder session.
+    
+    Session yang dilanjutkan menulis <prefix><id>_resume<N><extension>; run lanjutan
+    terakhir mencakup semua dosen session (yang sudah selesai dicatat ulang dari journal),
+    sehingga file dengan N terbesar yang dipakai.
+    
+    Args:
+        folder: Folder session (logging/session_<id>)
+        prefix: Prefix nama file, misalnya "summary_"
+        extension: Ekstensi file, misalnya ".json"
+        
+    Returns:
+        Path file terbaru, atau None jika tidak ada
+    """
+    candidates = [f for f in os.listdir(folder) if f.startswith(prefix) and f.endswith(extension)]
+    if not candidates:
+        return None
+    
+    def run_number(filename: str) -> int:
+        match = re.search(r'_resume(\d+)' + re.escape(extension) + '$', filename)
+        return int(match.group(1)) if match else 0
+    
+    return os.path.join(folder, max(candidates, key=run_number))
+
+
 def get_all_sessions(log_dir: str = "logging") -> List[Dict]:
     """
     Mendapatkan semua session log yang tersedia.
@@ -270,12 +506,8 @@ def get_all_sessions(log_dir: str = "logging") -> List[Dict]:
         if not os.path.isdir(item_path) or not item.startswith("session_"):
             continue
         
-        # Cari file summary
-        summary_file = None
-        for file in os.listdir(item_path):
-            if file.startswith("summary_") and file.endswith(".json"):
-                summary_file = os.path.join(item_path, file)
-                break
+        # Cari file summary (run lanjutan terakhir jika session pernah di-resume)
+        summary_file = latest_log_file(item_path, "summary_", ".json")
         
         if summary_file and os.path.exists(summary_file):
             try:
@@ -290,3 +522,101 @@ def get_all_sessions(log_dir: str = "logging") -> List[Dict]:
     sessions.sort(key=lambda x: x.get('session_info', {}).get('start_time', ''), reverse=True)
     
     return sessions
+
+
+def merge_session_summaries(session_dirs: List[str], session_id: str, log_dir: str = "logging") -> Dict:
+    """
+    Menggabungkan summary dan detailed log beberapa session (misalnya shard dari satu run
+    multi-proses) menjadi satu session gabungan.
+    
+    Args:
+        session_dirs: Folder session yang digabung (logging/session_<id>)
+        session_id: Session ID untuk hasil gabungan
+        log_dir: Base directory logging
+        
+    Returns:
+        Summary gabungan (format sama dengan summary_<id>.json, ditambah key 'shards')
+    """
+    summaries = []
+    detailed_logs = []
+    for folder in session_dirs:
+        if not os.path.isdir(folder):
+            continue
+        # Shard yang pernah di-resume: hanya run terakhir (mencakup semua dosen shard)
+        summary_file = latest_log_file(folder, "summary_", ".json")
+        if summary_file:
+            with open(summary_file, 'r', encoding='utf-8') as f:
+                summaries.append(json.load(f))
+        detailed_file = latest_log_file(folder, "detailed_log_", ".csv")
+        if detailed_file:
+            detailed_logs.append(pd.read_csv(detailed_file, encoding='utf-8-sig'))
+    
+    merged_dir = os.path.join(log_dir, f"session_{session_id}")
+    os.makedirs(merged_dir, exist_ok=True)
+    
+    lists = {key: [] for key in ('dosen_processed', 'success_list', 'failed_list', 'captcha_list')}
+    timing = {}
+    fetch_events = {}
+    for summary in summaries:
+        for key in lists:
+            lists[key].extend(summary.get(key, []))
+        for step, stats in summary.get('timing', {}).items():
+            merged = timing.setdefault(step, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+            merged['count'] += stats['count']
+            merged['total_seconds'] = round(merged['total_seconds'] + stats['total_seconds'], 3)
+            merged['max_seconds'] = max(merged['max_seconds'], stats['max_seconds'])
+        for event_type, count in summary.get('fetch_events', {}).items():
+            fetch_events[event_type] = fetch_events.get(event_type, 0) + count
+    
+    for stats in timing.values():
+        stats['mean_seconds'] = round(stats['total_seconds'] / stats['count'], 3) if stats['count'] else 0.0
+    
+    start_times = [s['session_info']['start_time'] for s in summaries]
+    end_times = [s['session_info']['end_time'] for s in summaries]
+    start_time = min(start_times) if start_times else ''
+    end_time = max(end_times) if end_times else ''
+    duration = 0.0
+    if start_time and end_time:
+        fmt = '%Y-%m-%d %H:%M:%S'
+        duration = (datetime.strptime(end_time, fmt) - datetime.strptime(start_time, fmt)).total_seconds()
+    
+    total = len(lists['dosen_processed'])
+    merged_summary = {
+        'session_info': {
+            'session_id': session_id,
+            'start_time': start_time,
+            'end_time': end_time,
+            'duration_seconds': duration
+        },
+        'statistics': {
+            'total_dosen': total,
+            'success_count': len(lists['success_list']),
+            'failed_count': len(lists['failed_list']),
+            'captcha_count': len(lists['captcha_list']),
+            'success_rate': f"{(len(lists['success_list']) / total * 100):.2f}%" if total else "0%"
+        },
+        **lists,
+        'timing': dict(sorted(timing.items(), key=lambda item: item[1]['total_seconds'], reverse=True)),
+        'fetch_events': fetch_events,
+        'shards': [
+            {
+                'session_id': s['session_info']['session_id'],
+                'total_dosen': s['statistics']['total_dosen'],
+                'success_count': s['statistics']['success_count'],
+                'failed_count': s['statistics']['failed_count']
+            }
+            for s in summaries
+        ]
+    }
+    
+    filename = os.path.join(merged_dir, f"summary_{session_id}.json")
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(merged_summary, f, indent=2, ensure_ascii=False)
+    print(f"📊 Merged summary saved: {filename}")
+    
+    if detailed_logs:
+        filename = os.path.join(merged_dir, f"detailed_log_{session_id}.csv")
+        pd.concat(detailed_logs, ignore_index=True).to_csv(filename, index=False, encoding='utf-8-sig')
+        print(f"📋 Merged detailed log saved: {filename}")
+    
+    return merged_summary
@@ -0,0 +1,239 @@
+"""
+Page cache module for Google Scholar scraper.
+Menyimpan HTML halaman yang sudah diambil ke disk (terkompresi gzip) dengan key URL
+yang dinormalisasi, sehingga run berikutnya tidak perlu mengunduh ulang halaman
+yang belum kedaluwarsa dan parser bisa dijalankan ulang secara offline.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# Masa berlaku default per jenis halaman (detik)
+DEFAULT_TTL = {
+    'search': 7 * 24 * 3600,    # Hasil pencarian nama -> profil jarang berubah
+    'profile': 24 * 3600,       # Daftar publikasi & jumlah sitasi berubah harian
+    'detail': 7 * 24 * 3600,    # Halaman detail publikasi
+    'other': 24 * 3600,
+}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Menormalisasi URL agar URL yang ekuivalen menghasilkan key cache yang sama.
+    Scheme dan host diubah ke huruf kecil, fragment dibuang, dan parameter query diurutkan.
+
+    Args:
+        url (str): URL halaman
+
+    Returns:
+        str: URL yang sudah dinormalisasi
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+
+def classify_url(url: str) -> str:
+    """
+    Menentukan jenis halaman Google Scholar dari URL.
+
+    Args:
+        url (str): URL halaman
+
+    Returns:
+        str: 'search', 'profile', 'detail', atau 'other'
+    """
+    parts = urlsplit(url)
+    if parts.path.startswith('/scholar'):
+        return 'search'
+    if parts.path.startswith('/citations'):
+        if 'view_op=view_citation' in parts.query:
+            return 'detail'
+        if 'user=' in parts.query:
+            return 'profile'
+    return 'other'
+
+
+class PageCache:
+    """
+    Cache HTML di disk dengan TTL per jenis halaman dan eviction LRU berbasis ukuran.
+    Setiap halaman disimpan sebagai satu file .html.gz yang namanya adalah SHA-256 dari
+    URL ternormalisasi. Waktu akses terakhir dicatat lewat mtime file.
+    Satu instance aman dipakai bersama oleh beberapa worker thread.
+    """
+
+    def __init__(self, cache_dir: str = "cache/pages", max_size_mb: int = 500,
+                 ttl: Optional[Dict[str, int]] = None):
+        """
+        Inisialisasi cache.
+
+        Args:
+            cache_dir (str): Folder penyimpanan file cache
+            max_size_mb (int): Ukuran total maksimal cache (MB) sebelum eviction LRU
+            ttl (Optional[Dict[str, int]]): Override TTL per jenis halaman (detik)
+        """
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max(1, int(max_size_mb)) * 1024 * 1024
+        self.ttl = dict(DEFAULT_TTL)
+        if ttl:
+            self.ttl.update(ttl)
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_size = None
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path_for(self, url: str) -> str:
+        """
+        Path file cache untuk URL.
+
+        Args:
+            url (str): URL halaman
+
+        Returns:
+            str: Path file .html.gz
+        """
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.html.gz")
+
+    def get(self, url: str, ignore_ttl: bool = False) -> Optional[str]:
+        """
+        Mengambil HTML dari cache.
+
+        Args:
+            url (str): URL halaman
+            ignore_ttl (bool): Jika True, entry kedaluwarsa tetap dikembalikan (mode replay)
+
+        Returns:
+            Optional[str]: HTML halaman, atau None jika tidak ada / kedaluwarsa
+        """
+        path = self._path_for(url)
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                meta = json.loads(f.readline())
+                if not ignore_ttl:
+                    max_age = self.ttl.get(classify_url(url), self.ttl['other'])
+                    if time.time() - meta.get('fetched_at', 0) > max_age:
+                        with self._lock:
+                            self.misses += 1
+                        return None
+                html = f.read()
+        except (OSError, ValueError, EOFError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Tandai sebagai baru diakses untuk keperluan LRU
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+        return html
+
+    def put(self, url: str, html: str):
+        """
+        Menyimpan HTML halaman ke cache, lalu menjalankan eviction jika melebihi batas ukuran.
+
+        Args:
+            url (str): URL halaman
+            html (str): HTML halaman
+        """
+        if not html:
+            return
+
+        path = self._path_for(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        meta = {'url': normalize_url(url), 'type': classify_url(url), 'fetched_at': time.time()}
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                f.write(json.dumps(meta) + "\n")
+                f.write(html)
+            os.replace(tmp_path, path)
+            new_size = os.path.getsize(path)
+        except OSError as e:
+            print(f"⚠️  Gagal menyimpan cache {url}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            if self._total_size is not None:
+                self._total_size += new_size - old_size
+            self._evict_if_needed()
+
+    def _scan(self):
+        """
+        Mengumpulkan (mtime, size, path) semua file cache.
+
+        Returns:
+            list: Daftar entry cache
+        """
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.html.gz'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict_if_needed(self):
+        """
+        Menghapus entry yang paling lama tidak diakses sampai ukuran cache di bawah batas.
+        Dipanggil dengan self._lock sudah dipegang.
+        """
+        if self._total_size is None:
+            self._total_size = sum(size for _, size, _ in self._scan())
+
+        if self._total_size <= self.max_size_bytes:
+            return
+
+        entries = sorted(self._scan())
+        self._total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if self._total_size <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+                self._total_size -= size
+            except OSError:
+                continue
+
+    def get_stats(self) -> Dict:
+        """
+        Statistik pemakaian cache.
+
+        Returns:
+            Dict: hits, misses, hit_rate, entries, size_mb
+        """
+        entries = self._scan()
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total * 100) if total > 0 else 0,
+            'entries': len(entries),
+            'size_mb': sum(size for _, size, _ in entries) / (1024 * 1024),
+        }
@@ -0,0 +1,368 @@
+"""
+HTML parser module for Google Scholar scraper.
+Menyediakan lapisan parser yang bisa diganti: SoupParser (BeautifulSoup, implementasi
+referensi) dan LxmlParser (lxml dengan XPath yang sudah dikompilasi, jauh lebih cepat).
+Keduanya menghasilkan output yang sama untuk halaman profil, detail, dan pencarian.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html as lxml_html
+
+from .http_fetcher import SCHOLAR_BASE_URL
+
+
+# Nama field (Indonesia) di tabel detail -> key yang digunakan
+FIELD_MAPPING = {
+    'Pengarang': 'Authors',
+    'Penulis': 'Authors',
+    'Tanggal terbit': 'Publication_Date',
+    'Jurnal': 'Journal',
+    'Jilid': 'Volume',
+    'Terbitan': 'Issue',
+    'Halaman': 'Pages',
+    'Penerbit': 'Publisher',
+    'Deskripsi': 'Description',
+    'Total kutipan': 'Total_Citations'
+}
+
+
+def parse_count(text: str) -> int:
+    """
+    Mengubah teks angka sitasi (misalnya '1.234' atau '1,234') menjadi integer.
+
+    Args:
+        text (str): Teks angka
+
+    Returns:
+        int: Angka, 0 jika tidak ada digit
+    """
+    try:
+        return int(text.replace('\xa0', '').replace(',', '').replace('.', ''))
+    except ValueError:
+        return int(re.sub(r'[^0-9]', '', text) or '0')
+
+
+def build_row(title: str, href: str, authors: str, venue_info: str, year: str, citations: str) -> Dict:
+    """
+    Menyusun data satu baris publikasi dari nilai yang sudah diekstrak parser.
+
+    Returns:
+        Dict: Data publikasi (Judul kosong jika baris tidak punya judul)
+    """
+    return {
+        'Judul': title,
+        'Penulis': authors,
+        'Venue_Raw': venue_info,  # Simpan venue mentah
+        'Tahun': year,
+        'Sitasi': citations,
+        'Detail_Link': SCHOLAR_BASE_URL + href if href else '',
+        'Is_Incomplete': venue_info.endswith('...')  # Info terpotong (diakhiri ...)
+    }
+
+
+def pair_years_with_counts(years: List[str], counts: List[int]) -> Dict[int, int]:
+    """
+    Memasangkan label tahun grafik sitasi dengan jumlah sitasinya.
+
+    Args:
+        years (List[str]): Label tahun (gsc_oci_g_t)
+        counts (List[int]): Jumlah sitasi per batang (gsc_oci_g_al)
+
+    Returns:
+        Dict[int, int]: Sitasi per tahun
+    """
+    cited_by_per_year = {}
+    for i, year_str in enumerate(years):
+        try:
+            cited_by_per_year[int(year_str)] = counts[i] if i < len(counts) else 0
+        except ValueError:
+            # Skip jika tahun tidak valid
+            continue
+    return cited_by_per_year
+
+
+class ScholarParser(ABC):
+    """
+    Interface parser halaman Google Scholar.
+    """
+
+    name = 'base'
+
+    @abstractmethod
+    def parse_profile_rows(self, html: str, skip_rows: int = 0) -> List[Dict]:
+        """
+        Parse baris publikasi (gsc_a_tr) dari HTML halaman profil.
+
+        Args:
+            html (str): HTML halaman profil
+            skip_rows (int): Jumlah baris pertama yang dilewati (sudah diproses sebelumnya)
+
+        Returns:
+            List[Dict]: Satu dict per baris setelah skip_rows, urut sesuai tampilan
+        """
+
+    @abstractmethod
+    def parse_detail(self, html: str) -> Dict:
+        """
+        Parse HTML halaman detail artikel (view_op=view_citation).
+
+        Args:
+            html (str): HTML halaman detail
+
+        Returns:
+            Dict: Detail publikasi termasuk Cited_By_Per_Year, kosong jika tabel tidak ditemukan
+        """
+
+    @abstractmethod
+    def parse_search_profile_url(self, html: str) -> Optional[str]:
+        """
+        Mengambil URL profil pertama dari HTML hasil pencarian (h4.gs_rt2 a).
+
+        Args:
+            html (str): HTML halaman hasil pencarian
+
+        Returns:
+            Optional[str]: URL profil absolut, atau None jika tidak ada
+        """
+
+    @abstractmethod
+    def has_more_publications(self, html: str) -> bool:
+        """
+        Memeriksa apakah tombol 'Tampilkan lainnya' (gsc_bpf_more) masih aktif.
+
+        Args:
+            html (str): HTML halaman profil
+
+        Returns:
+            bool: True jika masih ada publikasi yang belum dimuat
+        """
+
+
+class SoupParser(ScholarParser):
+    """
+    Parser referensi berbasis BeautifulSoup ('html.parser').
+    """
+
+    name = 'bs4'
+
+    def parse_profile_rows(self, html: str, skip_rows: int = 0) -> List[Dict]:
+        soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('tr', class_='gsc_a_tr'))
+        rows = []
+        for row in soup.find_all('tr', class_='gsc_a_tr')[skip_rows:]:
+            title_elem = row.find('a', class_='gsc_a_at')
+            gray = row.find_all('div', class_='gs_gray')
+            year_elem = row.find('span', class_='gsc_a_h')
+            cited_elem = row.find('a', class_='gsc_a_ac')
+
+            rows.append(build_row(
+                title=title_elem.get_text(strip=True) if title_elem else '',
+                href=title_elem.get('href', '') if title_elem else '',
+                authors=gray[0].get_text(strip=True) if gray else '',
+                venue_info=gray[1].get_text(strip=True) if len(gray) > 1 else '',
+                year=year_elem.get_text(strip=True) if year_elem else '',
+                citations=cited_elem.get_text(strip=True) if cited_elem else '0'
+            ))
+        return rows
+
+    def parse_detail(self, html: str) -> Dict:
+        soup = BeautifulSoup(html, 'html.parser')
+        detail_table = soup.find('div', {'id': 'gsc_oci_table'})
+
+        if not detail_table:
+            return {}
+
+        details = {}
+        for row in detail_table.find_all('div', class_='gs_scl'):
+            field = row.find('div', class_='gsc_oci_field')
+            value = row.find('div', class_='gsc_oci_value')
+
+            if field and value:
+                field_text = field.get_text(strip=True)
+                # Gunakan mapped key jika ada, otherwise gunakan original
+                details[FIELD_MAPPING.get(field_text, field_text)] = value.get_text(strip=True)
+
+        # Grafik sitasi: <span class="gsc_oci_g_t">tahun</span> dan
+        # <a class="gsc_oci_g_a"><span class="gsc_oci_g_al">angka</span></a>
+        years, counts = [], []
+        graph_bars = soup.find('div', id='gsc_oci_graph_bars')
+        if graph_bars:
+            years = [span.get_text(strip=True) for span in graph_bars.find_all('span', class_='gsc_oci_g_t')]
+            for anchor in graph_bars.find_all('a', class_='gsc_oci_g_a'):
+                count_span = anchor.find('span', class_='gsc_oci_g_al')
+                if count_span:
+                    counts.append(parse_count(count_span.get_text(strip=True)))
+
+        details['Cited_By_Per_Year'] = pair_years_with_counts(years, counts)
+        return details
+
+    def parse_search_profile_url(self, html: str) -> Optional[str]:
+        soup = BeautifulSoup(html, 'html.parser')
+        profile_link = soup.select_one('h4.gs_rt2 a')
+        if not profile_link or not profile_link.get('href'):
+            return None
+        return urljoin(SCHOLAR_BASE_URL, profile_link['href'])
+
+    def has_more_publications(self, html: str) -> bool:
+        soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('button', id='gsc_bpf_more'))
+        button = soup.find('button', id='gsc_bpf_more')
+        return bool(button) and not button.has_attr('disabled')
+
+
+def _has_class(cls: str) -> str:
+    """
+    Predikat XPath yang setara dengan selector CSS .cls (token class, bukan substring).
+    """
+    return f'contains(concat(" ", normalize-space(@class), " "), " {cls} ")'
+
+
+class LxmlParser(ScholarParser):
+    """
+    Parser cepat berbasis lxml (C) dengan XPath yang dikompilasi sekali saat import.
+    """
+
+    name = 'lxml'
+
+    _ROWS = etree.XPath(f'//tr[{_has_class("gsc_a_tr")}]')
+    _ROW_TITLE = etree.XPath(f'(.//a[{_has_class("gsc_a_at")}])[1]')
+    _ROW_GRAY = etree.XPath(f'.//div[{_has_class("gs_gray")}]')
+    _ROW_YEAR = etree.XPath(f'(.//span[{_has_class("gsc_a_h")}])[1]')
+    _ROW_CITED = etree.XPath(f'(.//a[{_has_class("gsc_a_ac")}])[1]')
+
+    _DETAIL_TABLE = etree.XPath('(//div[@id="gsc_oci_table"])[1]')
+    _DETAIL_ROWS = etree.XPath(f'.//div[{_has_class("gs_scl")}]')
+    _DETAIL_FIELD = etree.XPath(f'(.//div[{_has_class("gsc_oci_field")}])[1]')
+    _DETAIL_VALUE = etree.XPath(f'(.//div[{_has_class("gsc_oci_value")}])[1]')
+
+    _GRAPH = etree.XPath('(//div[@id="gsc_oci_graph_bars"])[1]')
+    _GRAPH_YEARS = etree.XPath(f'.//span[{_has_class("gsc_oci_g_t")}]')
+    _GRAPH_BARS = etree.XPath(f'.//a[{_has_class("gsc_oci_g_a")}]')
+    _GRAPH_COUNT = etree.XPath(f'(.//span[{_has_class("gsc_oci_g_al")}])[1]')
+
+    _SEARCH_PROFILE = etree.XPath(f'(//h4[{_has_class("gs_rt2")}]//a)[1]')
+    _MORE_BUTTON = etree.XPath('(//button[@id="gsc_bpf_more"])[1]')
+
+    _TEXT = etree.XPath('.//text()')
+
+    @classmethod
+    def _text(cls, element) -> str:
+        """
+        Setara dengan BeautifulSoup get_text(strip=True): setiap node teks di-strip lalu digabung.
+        """
+        if element is None:
+            return ''
+        return ''.join(text.strip() for text in cls._TEXT(element))
+
+    @staticmethod
+    def _first(xpath, element):
+        """
+        Hasil pertama XPath, atau None.
+        """
+        result = xpath(element)
+        return result[0] if result else None
+
+    @staticmethod
+    def _document(html: str):
+        """
+        Parse HTML menjadi tree lxml. None jika HTML kosong.
+        """
+        if not html or not html.strip():
+            return None
+        return lxml_html.fromstring(html)
+
+    def parse_profile_rows(self, html: str, skip_rows: int = 0) -> List[Dict]:
+        doc = self._document(html)
+        if doc is None:
+            return []
+
+        rows = []
+        for row in self._ROWS(doc)[skip_rows:]:
+            title_elem = self._first(self._ROW_TITLE, row)
+            gray = self._ROW_GRAY(row)
+            cited_elem = self._first(self._ROW_CITED, row)
+
+            rows.append(build_row(
+                title=self._text(title_elem),
+                href=title_elem.get('href', '') if title_elem is not None else '',
+                authors=self._text(gray[0]) if gray else '',
+                venue_info=self._text(gray[1]) if len(gray) > 1 else '',
+                year=self._text(self._first(self._ROW_YEAR, row)),
+                citations=self._text(cited_elem) if cited_elem is not None else '0'
+            ))
+        return rows
+
+    def parse_detail(self, html: str) -> Dict:
+        doc = self._document(html)
+        if doc is None:
+            return {}
+
+        detail_table = self._first(self._DETAIL_TABLE, doc)
+        if detail_table is None:
+            return {}
+
+        details = {}
+        for row in self._DETAIL_ROWS(detail_table):
+            field = self._first(self._DETAIL_FIELD, row)
+            value = self._first(self._DETAIL_VALUE, row)
+
+            if field is not None and value is not None:
+                field_text = self._text(field)
+                details[FIELD_MAPPING.get(field_text, field_text)] = self._text(value)
+
+        years, counts = [], []
+        graph_bars = self._first(self._GRAPH, doc)
+        if graph_bars is not None:
+            years = [self._text(span) for span in self._GRAPH_YEARS(graph_bars)]
+            for anchor in self._GRAPH_BARS(graph_bars):
+                count_span = self._first(self._GRAPH_COUNT, anchor)
+                if count_span is not None:
+                    counts.append(parse_count(self._text(count_span)))
+
+        details['Cited_By_Per_Year'] = pair_years_with_counts(years, counts)
+        return details
+
+    def parse_search_profile_url(self, html: str) -> Optional[str]:
+        doc = self._document(html)
+        if doc is None:
+            return None
+
+        profile_link = self._first(self._SEARCH_PROFILE, doc)
+        if profile_link is None or not profile_link.get('href'):
+            return None
+        return urljoin(SCHOLAR_BASE_URL, profile_link.get('href'))
+
+    def has_more_publications(self, html: str) -> bool:
+        doc = self._document(html)
+        if doc is None:
+            return False
+
+        button = self._first(self._MORE_BUTTON, doc)
+        return button is not None and button.get('disabled') is None
+
+
+PARSERS = {
+    SoupParser.name: SoupParser,
+    LxmlParser.name: LxmlParser,
+}
+
+
+def get_parser(name: str = 'lxml') -> ScholarParser:
+    """
+    Membuat parser berdasarkan nama.
+
+    Args:
+        name (str): 'lxml' (default, cepat) atau 'bs4' (implementasi referensi)
+
+    Returns:
+        ScholarParser: Instance parser
+
+    Raises:
+        ValueError: Jika nama parser tidak dikenal
+    """
+    if name not in PARSERS:
+        raise ValueError(f"parser tidak valid: {name}. Gunakan {' atau '.join(repr(n) for n in PARSERS)}")
+    return PARSERS[name]()
@@ -0,0 +1,190 @@
+"""
+Profile ID cache module for Google Scholar scraper.
+Menyimpan pemetaan nama dosen (hasil clean_dosen_name) ke URL profil dan ID user
+Google Scholar, sehingga run berikutnya bisa langsung membuka profil tanpa
+melewati halaman pencarian. Mendukung override manual dari file CSV.
+"""
+
+import csv
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from .utils import extract_scholar_user_id, build_profile_url
+
+
+def normalize_name_key(nama_dosen: str) -> str:
+    """
+    Membuat key pencarian dari nama dosen (huruf kecil, spasi dirapikan).
+
+    Args:
+        nama_dosen (str): Nama dosen yang sudah dibersihkan
+
+    Returns:
+        str: Key nama
+    """
+    return " ".join(nama_dosen.lower().split())
+
+
+class ProfileIdCache:
+    """
+    Cache persisten nama dosen -> profil Google Scholar (disimpan sebagai JSON).
+    Override manual selalu diprioritaskan dan tidak pernah ditimpa hasil pencarian.
+    Satu instance aman dipakai bersama oleh beberapa worker thread.
+    """
+
+    def __init__(self, cache_path: str = "cache/profile_ids.json", overrides_path: Optional[str] = None):
+        """
+        Inisialisasi cache dan memuat data dari disk.
+
+        Args:
+            cache_path (str): Path file JSON cache hasil pencarian
+            overrides_path (Optional[str]): Path file CSV override manual dengan kolom
+                                            'Nama' dan 'Profil' (URL profil atau ID user)
+        """
+        self.cache_path = cache_path
+        self.overrides_path = overrides_path
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = self._load_cache()
+        # Perubahan dari proses ini (None = dihapus), diterapkan ulang di atas isi file saat menyimpan
+        self._changes: Dict[str, Optional[Dict]] = {}
+        self.overrides: Dict[str, Dict] = self._load_overrides()
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        """
+        Memuat file JSON cache.
+
+        Returns:
+            Dict[str, Dict]: Entry per key nama
+        """
+        if not os.path.exists(self.cache_path):
+            return {}
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Gagal membaca cache profil {self.cache_path}: {e}")
+            return {}
+
+    def _load_overrides(self) -> Dict[str, Dict]:
+        """
+        Memuat override manual dari CSV. Kolom 'Profil' boleh berisi URL profil
+        atau hanya ID user.
+
+        Returns:
+            Dict[str, Dict]: Entry override per key nama
+        """
+        if not self.overrides_path or not os.path.exists(self.overrides_path):
+            return {}
+
+        overrides = {}
+        try:
+            with open(self.overrides_path, 'r', encoding='utf-8-sig', newline='') as f:
+                for row in csv.DictReader(f):
+                    nama = (row.get('Nama') or "").strip()
+                    profil = (row.get('Profil') or "").strip()
+                    if not nama or not profil:
+                        continue
+
+                    if profil.startswith('http'):
+                        user_id = extract_scholar_user_id(profil)
+                        profile_url = profil
+                    else:
+                        user_id = profil
+                        profile_url = build_profile_url(profil)
+
+                    overrides[normalize_name_key(nama)] = {
+                        'nama': nama,
+                        'profile_url': profile_url,
+                        'user_id': user_id,
+                        'source': 'override'
+                    }
+        except (OSError, csv.Error) as e:
+            print(f"⚠️  Gagal membaca override profil {self.overrides_path}: {e}")
+            return {}
+
+        print(f"📌 {len(overrides)} override profil dimuat dari {self.overrides_path}")
+        return overrides
+
+    def get(self, nama_dosen: str) -> Optional[str]:
+        """
+        Mengambil URL profil untuk nama dosen.
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+
+        Returns:
+            Optional[str]: URL profil, atau None jika belum pernah di-resolve
+        """
+        key = normalize_name_key(nama_dosen)
+        entry = self.overrides.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self.entries.get(key)
+        return entry['profile_url'] if entry else None
+
+    def set(self, nama_dosen: str, profile_url: str):
+        """
+        Menyimpan hasil resolve nama -> profil dan langsung menulisnya ke disk.
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            profile_url (str): URL profil hasil pencarian
+        """
+        key = normalize_name_key(nama_dosen)
+        if not profile_url or key in self.overrides:
+            return
+
+        with self._lock:
+            self.entries[key] = {
+                'nama': nama_dosen,
+                'profile_url': profile_url,
+                'user_id': extract_scholar_user_id(profile_url),
+                'resolved_at': datetime.now().isoformat()
+            }
+            self._changes[key] = self.entries[key]
+            self._save()
+
+    def invalidate(self, nama_dosen: str):
+        """
+        Menghapus entry hasil pencarian (misalnya profil sudah tidak valid).
+        Override manual tidak ikut dihapus.
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+        """
+        key = normalize_name_key(nama_dosen)
+        with self._lock:
+            if self.entries.pop(key, None) is not None:
+                self._changes[key] = None
+                self._save()
+
+    def _save(self):
+        """
+        Menulis cache ke disk secara atomik. Dipanggil dengan self._lock sudah dipegang.
+        Isi file dibaca ulang lebih dulu agar entry yang ditulis proses lain (mode shard)
+        tidak hilang.
+        """
+        folder = os.path.dirname(self.cache_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        entries = self._load_cache()
+        for key, entry in self._changes.items():
+            if entry is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = entry
+        self.entries = entries
+
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️  Gagal menyimpan cache profil {self.cache_path}: {e}")
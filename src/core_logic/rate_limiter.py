@@ -0,0 +1,184 @@
+"""
+Adaptive rate limiter module for Google Scholar scraper.
+Token bucket yang mengatur jumlah halaman per menit untuk semua fetch jaringan.
+Laju disesuaikan dengan pola AIMD (additive increase, multiplicative decrease):
+naik sedikit demi sedikit selama fetch berhasil, turun tajam saat CAPTCHA atau timeout,
+sehingga scraper berjalan secepat mungkin di bawah ambang CAPTCHA Google Scholar.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket dengan laju adaptif (halaman per menit).
+    Satu instance dipakai bersama oleh semua worker karena batas Google Scholar
+    berlaku per alamat IP, bukan per browser.
+    """
+
+    def __init__(self, rate_per_minute: float = 30.0, min_rate: float = 4.0, max_rate: float = 120.0,
+                 burst: int = 4, increase_step: float = 1.0, increase_every: int = 10,
+                 captcha_factor: float = 0.5, timeout_factor: float = 0.8,
+                 decrease_holdoff: float = 30.0,
+                 on_change: Optional[Callable[[float, str], None]] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Inisialisasi rate limiter.
+
+        Args:
+            rate_per_minute (float): Laju awal (halaman per menit)
+            min_rate (float): Laju minimal setelah penurunan
+            max_rate (float): Laju maksimal setelah kenaikan
+            burst (int): Jumlah token maksimal yang bisa terkumpul (fetch beruntun tanpa jeda)
+            increase_step (float): Kenaikan laju (halaman/menit) setiap increase_every fetch berhasil
+            increase_every (int): Jumlah fetch berhasil berturut-turut sebelum laju dinaikkan
+            captcha_factor (float): Pengali laju saat CAPTCHA terdeteksi
+            timeout_factor (float): Pengali laju saat timeout
+            decrease_holdoff (float): Jeda minimal (detik) antar penurunan, agar satu CAPTCHA yang
+                                      dilihat beberapa thread sekaligus hanya menurunkan laju sekali
+            on_change (Optional[Callable[[float, str], None]]): Callback (laju_baru, alasan) setiap laju berubah
+            clock (Callable[[], float]): Sumber waktu (bisa diganti untuk test)
+            sleep (Callable[[float], None]): Fungsi tidur (bisa diganti untuk test)
+        """
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max(max_rate, min_rate))
+        self.rate = min(max(float(rate_per_minute), self.min_rate), self.max_rate)
+        self.burst = max(1, int(burst))
+        self.increase_step = float(increase_step)
+        self.increase_every = max(1, int(increase_every))
+        self.captcha_factor = float(captcha_factor)
+        self.timeout_factor = float(timeout_factor)
+        self.decrease_holdoff = float(decrease_holdoff)
+        self.on_change = on_change
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        self._tokens = 1.0
+        self._last_refill = clock()
+        self._last_decrease = None
+        self._successes = 0
+
+        self.stats = {
+            'acquired': 0,
+            'waited_seconds': 0.0,
+            'captcha_events': 0,
+            'timeout_events': 0,
+            'increases': 0,
+            'decreases': 0,
+            'lowest_rate': self.rate,
+            'highest_rate': self.rate,
+        }
+
+    def _refill(self, now: float):
+        """
+        Menambah token sesuai waktu yang berlalu sejak refill terakhir (dipanggil di dalam lock).
+        """
+        elapsed = max(0.0, now - self._last_refill)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate / 60.0)
+        self._last_refill = now
+
+    def acquire(self) -> float:
+        """
+        Mengambil satu token; menunggu jika bucket kosong. Token dipesan di dalam lock
+        lalu waktu tunggu dijalankan di luar lock, sehingga thread lain tetap bisa memesan.
+
+        Returns:
+            float: Lama menunggu dalam detik
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens * 60.0 / self.rate
+            self.stats['acquired'] += 1
+            self.stats['waited_seconds'] += wait
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def _set_rate(self, new_rate: float, reason: str):
+        """
+        Mengubah laju dan memanggil on_change (dipanggil di dalam lock).
+        """
+        self._refill(self._clock())
+        self.rate = min(max(new_rate, self.min_rate), self.max_rate)
+        self.stats['lowest_rate'] = min(self.stats['lowest_rate'], self.rate)
+        self.stats['highest_rate'] = max(self.stats['highest_rate'], self.rate)
+        if self.on_change:
+            self.on_change(self.rate, reason)
+
+    def on_success(self):
+        """
+        Fetch berhasil: laju dinaikkan increase_step setiap increase_every keberhasilan berturut-turut.
+        """
+        with self._lock:
+            self._successes += 1
+            if self._successes < self.increase_every or self.rate >= self.max_rate:
+                return
+            self._successes = 0
+            self.stats['increases'] += 1
+            self._set_rate(self.rate + self.increase_step, 'SUCCESS')
+
+    def _decrease(self, factor: float, reason: str):
+        """
+        Menurunkan laju secara multiplikatif dan mengosongkan bucket (dipanggil di dalam lock).
+        Penurunan diabaikan jika masih dalam decrease_holdoff sejak penurunan terakhir.
+        """
+        self._successes = 0
+        now = self._clock()
+        if self._last_decrease is not None and now - self._last_decrease < self.decrease_holdoff:
+            return
+        self._last_decrease = now
+        self.stats['decreases'] += 1
+        self._set_rate(self.rate * factor, reason)
+        self._tokens = min(self._tokens, 0.0)
+
+    def on_captcha(self):
+        """
+        CAPTCHA terdeteksi: laju dikali captcha_factor.
+        """
+        with self._lock:
+            self.stats['captcha_events'] += 1
+            self._decrease(self.captcha_factor, 'CAPTCHA')
+
+    def on_timeout(self):
+        """
+        Timeout saat memuat halaman: laju dikali timeout_factor.
+        """
+        with self._lock:
+            self.stats['timeout_events'] += 1
+            self._decrease(self.timeout_factor, 'TIMEOUT')
+
+    def handle_event(self, event_type: str):
+        """
+        Listener event fetch dari ScraperLogger ('OK', 'CAPTCHA', 'TIMEOUT').
+
+        Args:
+            event_type (str): Jenis event fetch
+        """
+        if event_type == 'OK':
+            self.on_success()
+        elif event_type == 'CAPTCHA':
+            self.on_captcha()
+        elif event_type == 'TIMEOUT':
+            self.on_timeout()
+
+    def get_stats(self) -> Dict:
+        """
+        Statistik rate limiter.
+
+        Returns:
+            Dict: rate_per_minute (laju saat ini), acquired, waited_seconds, captcha_events,
+                  timeout_events, increases, decreases, lowest_rate, highest_rate
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats['rate_per_minute'] = round(self.rate, 2)
+        stats['waited_seconds'] = round(stats['waited_seconds'], 2)
+        return stats
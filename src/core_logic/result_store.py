@@ -0,0 +1,308 @@
+"""
+Result store module for Google Scholar scraper.
+Menyimpan semua hasil scraping di satu database SQLite: tabel dosen, publikasi (key: ID
+citation_for_view Google Scholar), dan sitasi per tahun. Setiap dosen yang selesai di-upsert,
+perubahan sitasi/judul/tahun dicatat di tabel riwayat, dan file CSV/XLSX/DOCX diekspor dari
+query ke database ini alih-alih dari file per run.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .snapshot_store import publication_key
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lecturers (
+    nama TEXT PRIMARY KEY,
+    profile_url TEXT,
+    publications_count INTEGER NOT NULL DEFAULT 0,
+    first_seen TEXT NOT NULL,
+    last_scraped TEXT NOT NULL,
+    last_session TEXT
+);
+CREATE TABLE IF NOT EXISTS publications (
+    nama TEXT NOT NULL,
+    pub_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    judul TEXT,
+    penulis TEXT,
+    jurnal TEXT,
+    tahun TEXT,
+    sitasi TEXT,
+    link TEXT,
+    data TEXT NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    PRIMARY KEY (nama, pub_key)
+);
+CREATE TABLE IF NOT EXISTS citations_per_year (
+    nama TEXT NOT NULL,
+    pub_key TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    cited_by INTEGER NOT NULL,
+    PRIMARY KEY (nama, pub_key, year)
+);
+CREATE TABLE IF NOT EXISTS changes (
+    nama TEXT NOT NULL,
+    pub_key TEXT NOT NULL,
+    field TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT,
+    session_id TEXT,
+    changed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_publications_active ON publications (nama, active, position);
+CREATE INDEX IF NOT EXISTS idx_citations_year ON citations_per_year (year);
+CREATE INDEX IF NOT EXISTS idx_changes_nama ON changes (nama, changed_at);
+"""
+
+# Kolom publikasi yang disimpan sebagai kolom tabel (untuk query dan riwayat perubahan)
+INDEXED_FIELDS = {
+    'judul': 'Judul',
+    'penulis': 'Penulis',
+    'jurnal': 'Journal_Name',
+    'tahun': 'Tahun',
+    'sitasi': 'Sitasi',
+    'link': 'Link',
+}
+
+# Field yang perubahannya dicatat di tabel changes
+TRACKED_FIELDS = ('judul', 'tahun', 'sitasi')
+
+
+def result_key(pub: Dict) -> str:
+    """
+    Key publikasi hasil akhir scraping (ID citation_for_view dari kolom Link, atau judul).
+
+    Args:
+        pub (Dict): Publikasi hasil scraping
+
+    Returns:
+        str: Key publikasi
+    """
+    return publication_key({'Detail_Link': pub.get('Link'), 'Judul': pub.get('Judul')})
+
+
+class ResultStore:
+    """
+    Database hasil scraping (SQLite). Setiap operasi membuka koneksi sendiri,
+    sehingga satu file bisa dipakai bersama oleh worker thread dan proses shard.
+    """
+
+    def __init__(self, db_path: str = "output/results.db"):
+        """
+        Inisialisasi store (database dan tabel dibuat jika belum ada).
+
+        Args:
+            db_path (str): Path file SQLite
+        """
+        self.db_path = db_path
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Membuka koneksi baru (autocommit; transaksi diatur manual).
+        """
+        conn = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def upsert_lecturer(self, nama_dosen: str, publications: List[Dict],
+                        profile_url: Optional[str] = None, session_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        Menyimpan hasil satu dosen dalam satu transaksi: publikasi baru ditambahkan, yang sudah
+        ada diperbarui (perubahan judul/tahun/sitasi dicatat), dan publikasi yang tidak lagi
+        muncul di profil ditandai tidak aktif.
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            publications (List[Dict]): Publikasi hasil scraping dosen tersebut
+            profile_url (Optional[str]): URL profil Google Scholar
+            session_id (Optional[str]): Session ID run yang menghasilkan data
+
+        Returns:
+            Dict[str, int]: Jumlah publikasi 'added', 'updated', 'removed'
+        """
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        stats = {'added': 0, 'updated': 0, 'removed': 0}
+
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT INTO lecturers (nama, profile_url, publications_count, first_seen, last_scraped, last_session) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (nama) DO UPDATE SET profile_url = COALESCE(excluded.profile_url, profile_url), "
+                    "publications_count = excluded.publications_count, last_scraped = excluded.last_scraped, "
+                    "last_session = excluded.last_session",
+                    (nama_dosen, profile_url, len(publications), now, now, session_id)
+                )
+
+                existing = {
+                    row['pub_key']: row
+                    for row in conn.execute("SELECT * FROM publications WHERE nama = ?", (nama_dosen,))
+                }
+                seen = set()
+
+                for position, pub in enumerate(publications):
+                    key = result_key(pub)
+                    if not key or key in seen:
+                        continue
+                    seen.add(key)
+
+                    values = {column: str(pub.get(field) or '') for column, field in INDEXED_FIELDS.items()}
+                    # Sitasi per tahun disimpan di citations_per_year; key tetap ada agar urutan kolom sama
+                    data = {k: (None if k == 'Cited_By_Per_Year' else v) for k, v in pub.items()}
+                    old = existing.get(key)
+
+                    if old is None:
+                        stats['added'] += 1
+                    else:
+                        changed = [column for column in TRACKED_FIELDS if (old[column] or '') != values[column]]
+                        if changed or not old['active']:
+                            stats['updated'] += 1
+                        conn.executemany(
+                            "INSERT INTO changes (nama, pub_key, field, old_value, new_value, session_id, changed_at) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            [(nama_dosen, key, column, old[column], values[column], session_id, now) for column in changed]
+                        )
+
+                    conn.execute(
+                        "INSERT INTO publications (nama, pub_key, position, judul, penulis, jurnal, tahun, sitasi, link, "
+                        "data, active, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?) "
+                        "ON CONFLICT (nama, pub_key) DO UPDATE SET position = excluded.position, "
+                        "judul = excluded.judul, penulis = excluded.penulis, jurnal = excluded.jurnal, "
+                        "tahun = excluded.tahun, sitasi = excluded.sitasi, link = excluded.link, "
+                        "data = excluded.data, active = 1, last_seen = excluded.last_seen",
+                        (nama_dosen, key, position, values['judul'], values['penulis'], values['jurnal'],
+                         values['tahun'], values['sitasi'], values['link'],
+                         json.dumps(data, ensure_ascii=False, default=str), now, now)
+                    )
+
+                    per_year = pub.get('Cited_By_Per_Year')
+                    if isinstance(per_year, dict):
+                        conn.execute("DELETE FROM citations_per_year WHERE nama = ? AND pub_key = ?",
+                                     (nama_dosen, key))
+                        conn.executemany(
+                            "INSERT INTO citations_per_year (nama, pub_key, year, cited_by) VALUES (?, ?, ?, ?)",
+                            [(nama_dosen, key, int(year), int(count)) for year, count in per_year.items()]
+                        )
+
+                removed = [key for key, row in existing.items() if key not in seen and row['active']]
+                conn.executemany(
+                    "UPDATE publications SET active = 0 WHERE nama = ? AND pub_key = ?",
+                    [(nama_dosen, key) for key in removed]
+                )
+                conn.executemany(
+                    "INSERT INTO changes (nama, pub_key, field, old_value, new_value, session_id, changed_at) "
+                    "VALUES (?, ?, 'removed', ?, NULL, ?, ?)",
+                    [(nama_dosen, key, existing[key]['judul'], session_id, now) for key in removed]
+                )
+                stats['removed'] = len(removed)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return stats
+
+    def query_dataframe(self, dosen_names: Optional[List[str]] = None,
+                        years: Optional[List[int]] = None) -> pd.DataFrame:
+        """
+        Membangun DataFrame hasil (format sama dengan run_scraper) dari publikasi aktif,
+        dengan kolom <tahun>_cited_by dari tabel sitasi per tahun.
+
+        Args:
+            dosen_names (Optional[List[str]]): Dosen yang diekspor, sesuai urutan
+                                               (default: semua dosen, urut nama)
+            years (Optional[List[int]]): Tahun yang dijadikan kolom <tahun>_cited_by
+                                         (default: semua tahun yang ada)
+
+        Returns:
+            pd.DataFrame: Publikasi dosen yang diminta
+        """
+        names = list(dict.fromkeys(dosen_names)) if dosen_names is not None else None
+
+        with closing(self._connect()) as conn:
+            conn.execute("CREATE TEMP TABLE wanted (nama TEXT PRIMARY KEY, urutan INTEGER)")
+            if names is None:
+                conn.execute("INSERT INTO wanted SELECT nama, ROW_NUMBER() OVER (ORDER BY nama) FROM lecturers")
+            else:
+                conn.executemany("INSERT INTO wanted VALUES (?, ?)", [(n, i) for i, n in enumerate(names)])
+
+            publications = pd.read_sql_query(
+                "SELECT p.nama, p.pub_key, p.data FROM publications p JOIN wanted w ON w.nama = p.nama "
+                "WHERE p.active = 1 ORDER BY w.urutan, p.position",
+                conn
+            )
+            citations = pd.read_sql_query(
+                "SELECT c.nama, c.pub_key, c.year, c.cited_by FROM citations_per_year c "
+                "JOIN publications p ON p.nama = c.nama AND p.pub_key = c.pub_key AND p.active = 1 "
+                "JOIN wanted w ON w.nama = c.nama",
+                conn
+            )
+
+        if publications.empty:
+            return pd.DataFrame()
+
+        df = pd.DataFrame([json.loads(data) for data in publications['data']])
+        keys = pd.MultiIndex.from_frame(publications[['nama', 'pub_key']])
+
+        per_year = {}
+        for (nama, pub_key), group in citations.groupby(['nama', 'pub_key']):
+            per_year[(nama, pub_key)] = dict(zip(group['year'].astype(int), group['cited_by'].astype(int)))
+        df['Cited_By_Per_Year'] = [per_year.get(key, {}) for key in keys]
+
+        years_out = sorted(years) if years else sorted(citations['year'].unique().tolist())
+        if years_out:
+            table = (citations.pivot_table(index=['nama', 'pub_key'], columns='year',
+                                           values='cited_by', aggfunc='sum')
+                     .reindex(index=keys, columns=years_out).fillna(0).astype(int))
+            for year in years_out:
+                df[f"{year}_cited_by"] = table[year].to_numpy()
+
+        return df
+
+    def lecturer_history(self, nama_dosen: str) -> List[Dict]:
+        """
+        Riwayat perubahan publikasi satu dosen (terbaru dulu).
+
+        Args:
+            nama_dosen (str): Nama dosen
+
+        Returns:
+            List[Dict]: changed_at, session_id, pub_key, field, old_value, new_value
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT changed_at, session_id, pub_key, field, old_value, new_value FROM changes "
+                "WHERE nama = ? ORDER BY changed_at DESC, rowid DESC",
+                (nama_dosen,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Jumlah lecturers, publications (aktif), dan changes
+        """
+        with closing(self._connect()) as conn:
+            return {
+                'lecturers': conn.execute("SELECT COUNT(*) FROM lecturers").fetchone()[0],
+                'publications': conn.execute("SELECT COUNT(*) FROM publications WHERE active = 1").fetchone()[0],
+                'changes': conn.execute("SELECT COUNT(*) FROM changes").fetchone()[0],
+            }
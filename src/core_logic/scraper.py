@@ -1,11 +1,16 @@
 """
 Google Scholar scraper module.
-Berisi logika utama untuk scraping publikasi menggunakan Selenium dan BeautifulSoup4.
+Berisi logika utama untuk scraping publikasi menggunakan Selenium; parsing HTML ada di parsers.py.
 """
 
+import os
 import time
-import re
+import queue
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Set, Optional
+from urllib.parse import quote_plus
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -13,14 +18,46 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, 
-    NoSuchElementException, 
-    StaleElementReferenceException,
     ElementClickInterceptedException
 )
-from bs4 import BeautifulSoup
 import pandas as pd
-from .utils import parse_publication_info, parse_venue_from_detail
+from .utils import parse_publication_info, parse_venue_from_detail, build_profile_page_url
 from .logger import ScraperLogger
+from .http_fetcher import HttpFetcher, CaptchaDetectedError, FetchTimeoutError, SCHOLAR_BASE_URL
+from .page_cache import PageCache
+from .profile_cache import ProfileIdCache
+from .snapshot_store import SnapshotStore, publication_key, row_signature
+from .checkpoint import CheckpointJournal
+from .parsers import get_parser
+from .rate_limiter import AdaptiveRateLimiter
+from .driver_manager import DriverManager
+from .async_pipeline import AsyncScrapePipeline
+from .job_queue import JobQueue, LeaseHeartbeat
+from .result_store import ResultStore
+from .sinks import ResultSink, publications_to_dataframe
+
+
+# Jumlah baris publikasi per halaman profil (batas maksimal Google Scholar)
+PROFILE_PAGE_SIZE = 100
+
+# Deteksi CAPTCHA dalam satu panggilan JS; mengembalikan nama sinyal pertama yang cocok atau null.
+# Sinyal sama dengan http_fetcher.detect_captcha_signal.
+CAPTCHA_DETECT_JS = """
+if (window.location.href.indexOf('/sorry/') !== -1) { return 'sorry_redirect'; }
+if (document.getElementById('gs_captcha_ccl')) { return 'gs_captcha_ccl'; }
+if (document.getElementById('captcha-form')) { return 'captcha_form'; }
+if (document.querySelector("iframe[src*='recaptcha']")) { return 'recaptcha_iframe'; }
+return null;
+"""
+
+# Resource yang diblokir pada mode lean driver (scraper hanya membaca HTML).
+# Diblokir lewat CDP agar bisa dimatikan sementara saat CAPTCHA harus diselesaikan manual.
+# Pemblokiran CDP berlaku per tab, sehingga dipasang ulang di setiap tab detail (_open_tab).
+LEAN_BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.css', '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*view_op=medium_photo*', '*view_op=view_photo*',
+]
 
 
 class GoogleScholarScraper:
@@ -28,7 +65,20 @@ class GoogleScholarScraper:
     Kelas untuk melakukan scraping publikasi dari Google Scholar.
     """
     
-    def __init__(self, headless: bool = False, wait_time: int = 10, captcha_wait_minutes: int = 5):
+    def __init__(self, headless: bool = False, wait_time: int = 10, captcha_wait_minutes: int = 5,
+                 num_workers: int = 1, fetch_mode: str = 'selenium', pagination: str = 'url',
+                 detail_concurrency: int = 4, cache_dir: Optional[str] = None,
+                 cache_max_mb: int = 500, cache_only: bool = False,
+                 profile_cache_path: Optional[str] = None,
+                 profile_overrides_path: Optional[str] = None,
+                 snapshot_dir: Optional[str] = None, incremental: bool = False,
+                 parser: str = 'lxml', rate_per_minute: Optional[float] = 30.0,
+                 min_rate_per_minute: float = 4.0, max_rate_per_minute: float = 120.0,
+                 lean_driver: bool = False, user_data_dir: Optional[str] = None,
+                 driver_manager: Optional[DriverManager] = None, max_pages_per_driver: int = 500,
+                 max_driver_memory_mb: int = 1500, pipeline: str = 'sync',
+                 pipeline_concurrency: int = 8, per_host_limit: int = 4,
+                 result_store_path: Optional[str] = None):
         """
         Inisialisasi scraper dengan konfigurasi Selenium.
         
@@ -36,17 +86,133 @@ class GoogleScholarScraper:
             headless (bool): Jika True, browser akan berjalan tanpa GUI
             wait_time (int): Waktu maksimal tunggu dalam detik untuk WebDriverWait
             captcha_wait_minutes (int): Waktu maksimal tunggu untuk manual CAPTCHA solving (menit)
+            num_workers (int): Jumlah worker Chrome yang berjalan paralel di run_scraper
+            fetch_mode (str): 'selenium' (semua halaman lewat Chrome) atau 'http'
+                              (HTML diambil lewat HTTP, Chrome hanya dipakai saat CAPTCHA)
+            pagination (str): 'url' (daftar publikasi diminta per 100 baris lewat parameter
+                              cstart/pagesize) atau 'click' (klik tombol 'Tampilkan lainnya').
+                              Mode HTTP selalu memakai 'url'.
+            detail_concurrency (int): Jumlah halaman detail yang diambil bersamaan
+                                      (thread HTTP atau tab browser)
+            cache_dir (Optional[str]): Folder cache HTML di disk; None untuk menonaktifkan cache
+            cache_max_mb (int): Ukuran maksimal cache (MB) sebelum entry lama dihapus (LRU)
+            cache_only (bool): Mode replay: hanya membaca cache (termasuk entry kedaluwarsa)
+                               tanpa akses jaringan, untuk menjalankan ulang parser secara offline
+            profile_cache_path (Optional[str]): File JSON cache nama dosen -> profil; jika diisi,
+                                                dosen yang sudah pernah ditemukan langsung dibuka
+                                                profilnya tanpa pencarian
+            profile_overrides_path (Optional[str]): File CSV override manual (kolom 'Nama', 'Profil')
+            snapshot_dir (Optional[str]): Folder snapshot publikasi per dosen (judul, sitasi, tahun,
+                                          dan detail) yang diperbarui setiap run
+            incremental (bool): Jika True, halaman detail hanya diambil untuk publikasi yang baru
+                                atau berubah dibanding snapshot; sisanya memakai detail tersimpan
+            parser (str): Backend parser HTML: 'lxml' (cepat) atau 'bs4' (implementasi referensi)
+            rate_per_minute (Optional[float]): Laju awal fetch jaringan (halaman per menit) untuk
+                                               rate limiter adaptif; None untuk menonaktifkan
+            min_rate_per_minute (float): Laju minimal setelah CAPTCHA/timeout
+            max_rate_per_minute (float): Laju maksimal yang boleh dicapai
+            lean_driver (bool): Jika True, Chrome tidak memuat gambar, CSS, dan font, dan
+                                memakai pageLoadStrategy 'eager' (tidak menunggu resource selesai)
+            user_data_dir (Optional[str]): Folder profil Chrome persisten (satu subfolder per
+                                           worker) agar cookies bertahan antar run; None untuk
+                                           profil sementara
+            driver_manager (Optional[DriverManager]): Manager driver dari luar (misalnya GUI) agar
+                                                      Chrome tetap hidup antar run; None untuk
+                                                      manager sendiri yang menutup Chrome di akhir run
+            max_pages_per_driver (int): Jumlah halaman sebelum Chrome didaur ulang (manager sendiri)
+            max_driver_memory_mb (int): Batas memori Chrome sebelum didaur ulang (manager sendiri,
+                                        butuh psutil)
+            pipeline (str): 'sync' (loop per dosen) atau 'async' (pipeline asyncio bertahap:
+                            pencarian -> daftar profil -> detail -> hasil, lihat async_pipeline.py)
+            pipeline_concurrency (int): Jumlah fetch bersamaan total pada pipeline 'async'
+            per_host_limit (int): Jumlah fetch bersamaan maksimal per host pada pipeline 'async'
+            result_store_path (Optional[str]): Database SQLite hasil (lihat result_store.py); setiap
+                                               dosen yang selesai di-upsert; None untuk menonaktifkan
         """
         self.wait_time = wait_time
         self.headless = headless
         self.captcha_wait_minutes = captcha_wait_minutes
+        self.num_workers = max(1, int(num_workers))
+        if fetch_mode not in ('selenium', 'http'):
+            raise ValueError(f"fetch_mode tidak valid: {fetch_mode}. Gunakan 'selenium' atau 'http'")
+        self.fetch_mode = fetch_mode
+        if pagination not in ('url', 'click'):
+            raise ValueError(f"pagination tidak valid: {pagination}. Gunakan 'url' atau 'click'")
+        self.pagination = pagination
+        self.detail_concurrency = max(1, int(detail_concurrency))
+        if pipeline not in ('sync', 'async'):
+            raise ValueError(f"pipeline tidak valid: {pipeline}. Gunakan 'sync' atau 'async'")
+        self.pipeline = pipeline
+        self.pipeline_concurrency = max(1, int(pipeline_concurrency))
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.parser = get_parser(parser)
+        self.http_fetcher = HttpFetcher(
+            timeout=wait_time,
+            pool_size=max(10, self.detail_concurrency * self.num_workers, self.pipeline_concurrency)
+        ) if fetch_mode == 'http' else None
+        if cache_only and not cache_dir:
+            raise ValueError("cache_only membutuhkan cache_dir")
+        self.cache_only = cache_only
+        self.page_cache = PageCache(cache_dir, max_size_mb=cache_max_mb) if cache_dir else None
+        self.profile_cache = ProfileIdCache(
+            profile_cache_path, profile_overrides_path
+        ) if profile_cache_path else None
+        if incremental and not snapshot_dir:
+            raise ValueError("incremental membutuhkan snapshot_dir")
+        self.incremental = incremental
+        self.snapshot_store = SnapshotStore(snapshot_dir) if snapshot_dir else None
+        self.result_store = ResultStore(result_store_path) if result_store_path else None
+        # Sink streaming untuk run_scraper yang sedang berjalan (lihat sinks.py)
+        self.result_sink: Optional[ResultSink] = None
+        self._keep_results = True
+        # Satu token per halaman yang diambil dari jaringan; laju disesuaikan dari event CAPTCHA/timeout
+        self.rate_limiter = AdaptiveRateLimiter(
+            rate_per_minute=rate_per_minute,
+            min_rate=min_rate_per_minute,
+            max_rate=max_rate_per_minute,
+            burst=self.detail_concurrency
+        ) if rate_per_minute else None
+        self.lean_driver = lean_driver
+        self.user_data_dir = user_data_dir
+        self.driver_profile = "main"  # Subfolder profil Chrome; worker memakai worker_<id>
+        # Manager dari luar tidak ditutup di akhir run sehingga Chrome bisa dipakai ulang
+        self._owns_driver_manager = driver_manager is None
+        self.driver_manager = driver_manager or DriverManager(
+            max_pages=max_pages_per_driver,
+            max_memory_mb=max_driver_memory_mb
+        )
         self.driver = None
+        # WebDriver tidak thread-safe; fallback Selenium dari thread detail harus bergantian
+        self._driver_lock = threading.RLock()
         self.results = []
+        self.last_captcha_signal = None  # Sinyal CAPTCHA terakhir yang terdeteksi
         self.logger = None  # Will be initialized in run_scraper
+        self.journal = None  # Will be initialized in run_scraper
+        # Diset oleh request_stop (misalnya tombol Stop di GUI); dicek di antara dosen
+        self._stop_event = threading.Event()
         
     def _init_driver(self):
         """
-        Inisialisasi Selenium WebDriver dengan konfigurasi yang optimal.
+        Mengambil WebDriver dari driver manager: driver yang masih sehat dipakai ulang,
+        selain itu dibuat baru lewat _create_driver.
+        """
+        self.driver = self.driver_manager.get_driver(self._create_driver, self._driver_config())
+    
+    def _driver_config(self) -> tuple:
+        """
+        Konfigurasi browser yang menentukan apakah driver lama boleh dipakai ulang.
+        
+        Returns:
+            tuple: (headless, lean_driver, user_data_dir, driver_profile)
+        """
+        return (self.headless, self.lean_driver, self.user_data_dir, self.driver_profile)
+    
+    def _create_driver(self):
+        """
+        Membuat Selenium WebDriver baru dengan konfigurasi yang optimal.
+        
+        Returns:
+            WebDriver: Chrome WebDriver
         """
         options = webdriver.ChromeOptions()
         
@@ -63,54 +229,221 @@ class GoogleScholarScraper:
         # User agent
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
-        self.driver = webdriver.Chrome(options=options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.lean_driver:
+            # driver.get kembali setelah DOMContentLoaded; elemen ditunggu lewat WebDriverWait
+            options.page_load_strategy = 'eager'
+            options.add_argument('--disable-extensions')
+            options.add_argument('--disable-background-networking')
+            options.add_argument('--disable-default-apps')
+            options.add_argument('--no-first-run')
+            options.add_argument('--mute-audio')
         
-    def _check_for_captcha(self) -> bool:
+        if self.user_data_dir:
+            # Chrome mengunci folder profil, sehingga setiap worker memakai subfolder sendiri
+            profile_dir = os.path.abspath(os.path.join(self.user_data_dir, self.driver_profile))
+            os.makedirs(profile_dir, exist_ok=True)
+            options.add_argument(f'--user-data-dir={profile_dir}')
+        
+        driver = webdriver.Chrome(options=options)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        
+        if self.lean_driver:
+            self._set_resource_blocking(True, driver)
+        return driver
+    
+    def _set_resource_blocking(self, enabled: bool, driver=None):
         """
-        Memeriksa apakah halaman meminta CAPTCHA verification.
+        Mengaktifkan/menonaktifkan pemblokiran gambar, CSS, dan font lewat CDP (Network.setBlockedURLs).
+        
+        Args:
+            enabled (bool): True untuk memblokir LEAN_BLOCKED_URLS, False untuk memuat semua resource
+            driver: WebDriver yang diatur (default: self.driver)
+        """
+        driver = driver or self.driver
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': LEAN_BLOCKED_URLS if enabled else []})
+        except Exception as e:
+            print(f"⚠️ Gagal mengatur pemblokiran resource: {e}")
+    
+    def _ensure_driver(self):
+        """
+        Inisialisasi WebDriver hanya jika belum ada (dipakai mode HTTP saat fallback ke Selenium).
+        """
+        if self.driver is None:
+            self._init_driver()
+    
+    def _refresh_driver(self):
+        """
+        Dipanggil di antara dosen: driver yang tidak sehat, sudah memuat terlalu banyak halaman,
+        atau memakai terlalu banyak memori dibuat ulang oleh driver manager.
+        """
+        if self.driver is not None:
+            self._init_driver()
+    
+    def _release_driver(self):
+        """
+        Melepas driver di akhir run. Manager milik scraper menutup Chrome; manager dari luar
+        (GUI) menyimpannya untuk run berikutnya.
+        """
+        if self._owns_driver_manager:
+            self.driver_manager.close()
+        self.driver = None
+    
+    def request_stop(self):
+        """
+        Meminta scraping berhenti setelah dosen yang sedang diproses selesai.
+        Aman dipanggil dari thread lain (misalnya GUI). Hasil yang sudah selesai tetap
+        tersimpan di journal dan bisa dilanjutkan dengan resume_session_id.
+        """
+        self._stop_event.set()
+    
+    @contextmanager
+    def _timed(self, step: str, nama_dosen: str = ""):
+        """
+        Context manager untuk mencatat durasi satu langkah ke ScraperLogger.
+        
+        Args:
+            step (str): Nama langkah (search, profile, detail_stage, dll)
+            nama_dosen (str): Nama dosen yang sedang diproses
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.logger:
+                self.logger.record_timing(step, time.perf_counter() - start, nama_dosen)
+    
+    def _throttle(self, via_driver: bool = True):
+        """
+        Menunggu token dari rate limiter sebelum satu fetch jaringan (halaman, klik, atau tab).
+        
+        Args:
+            via_driver (bool): True jika halaman dimuat oleh Chrome (dihitung untuk daur ulang driver)
+        """
+        if via_driver:
+            self.driver_manager.record_pages()
+        
+        if not self.rate_limiter:
+            return
+        
+        waited = self.rate_limiter.acquire()
+        if waited > 0 and self.logger:
+            self.logger.record_timing('throttle', waited)
+    
+    def _report_fetch(self, event_type: str, url: str = ""):
+        """
+        Melaporkan hasil fetch ('OK', 'CAPTCHA', 'TIMEOUT') ke logger, yang meneruskannya
+        ke rate limiter. Tanpa logger, event langsung diteruskan ke rate limiter.
+        
+        Args:
+            event_type (str): Jenis event fetch
+            url (str): URL halaman
+        """
+        if self.logger:
+            self.logger.log_fetch_event(event_type, url)
+        elif self.rate_limiter:
+            self.rate_limiter.handle_event(event_type)
+    
+    def _rate_label(self) -> str:
+        """
+        Label laju rate limiter saat ini untuk baris progres.
         
         Returns:
-            bool: True jika CAPTCHA terdeteksi, False jika tidak
+            str: Misalnya ' (rate 30.0 halaman/menit)', kosong jika rate limiter nonaktif
+        """
+        if not self.rate_limiter:
+            return ""
+        return f" (rate {self.rate_limiter.rate:.1f} halaman/menit)"
+    
+    def _captcha_conditions(self) -> list:
+        """
+        Kondisi WebDriverWait yang menandakan halaman CAPTCHA sudah tampil.
+        
+        Returns:
+            list: Daftar expected condition
+        """
+        return [
+            EC.presence_of_element_located((By.ID, "gs_captcha_ccl")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "iframe[src*='recaptcha']")),
+            EC.url_contains("/sorry/"),
+        ]
+    
+    def _wait_for_any(self, *conditions) -> bool:
+        """
+        Menunggu sampai salah satu kondisi terpenuhi (maksimal wait_time detik).
+        
+        Returns:
+            bool: True jika salah satu kondisi terpenuhi, False jika timeout
         """
         try:
-            # Check untuk berbagai indikator CAPTCHA
-            page_source = self.driver.page_source.lower()
-            
-            # Indikator umum CAPTCHA
-            captcha_indicators = [
-                'recaptcha',
-                'captcha',
-                'unusual traffic',
-                'automated requests',
-                'robot',
-                'verify you are human',
-                'security check'
-            ]
-            
-            for indicator in captcha_indicators:
-                if indicator in page_source:
-                    return True
-            
-            # Check for reCAPTCHA iframe
-            try:
-                self.driver.find_element(By.CSS_SELECTOR, "iframe[src*='recaptcha']")
-                return True
-            except NoSuchElementException:
-                pass
-            
-            # Check untuk gs_captcha_ccl (Google Scholar specific)
-            try:
-                self.driver.find_element(By.ID, "gs_captcha_ccl")
-                return True
-            except NoSuchElementException:
-                pass
-                
+            WebDriverWait(self.driver, self.wait_time).until(EC.any_of(*conditions))
+            return True
+        except TimeoutException:
             return False
+    
+    def _count_publication_rows(self) -> int:
+        """
+        Menghitung baris publikasi (gsc_a_tr) di halaman profil dalam satu panggilan JS.
+        
+        Returns:
+            int: Jumlah baris publikasi yang sedang dimuat
+        """
+        return self.driver.execute_script("return document.querySelectorAll('tr.gsc_a_tr').length;")
+    
+    def _click_show_more(self, show_more_button) -> bool:
+        """
+        Mengklik tombol 'Tampilkan lainnya' dan menunggu sampai baris baru muncul.
+        
+        Args:
+            show_more_button: Element Selenium tombol gsc_bpf_more
             
+        Returns:
+            bool: True jika baris baru berhasil dimuat, False jika timeout
+        """
+        rows_before = self._count_publication_rows()
+        
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", show_more_button)
+        self._throttle()
+        show_more_button.click()
+        
+        try:
+            WebDriverWait(self.driver, self.wait_time).until(
+                lambda driver: self._count_publication_rows() > rows_before
+            )
+            self._report_fetch('OK', self.driver.current_url)
+            return True
+        except TimeoutException:
+            self._report_fetch('TIMEOUT', self.driver.current_url)
+            return False
+        
+    def _detect_captcha(self) -> Optional[str]:
+        """
+        Mendeteksi halaman CAPTCHA dengan satu panggilan JS yang hanya memeriksa
+        URL dan beberapa elemen DOM spesifik (tanpa menyalin page_source).
+        
+        Returns:
+            Optional[str]: Nama sinyal yang terdeteksi (misalnya 'sorry_redirect',
+                           'gs_captcha_ccl', 'recaptcha_iframe'), None jika halaman normal
+        """
+        try:
+            return self.driver.execute_script(CAPTCHA_DETECT_JS)
         except Exception as e:
             print(f"Error saat mengecek CAPTCHA: {e}")
-            return False
+            return None
+    
+    def _check_for_captcha(self) -> bool:
+        """
+        Memeriksa apakah halaman meminta CAPTCHA verification.
+        Sinyal yang terdeteksi disimpan di self.last_captcha_signal.
+        
+        Returns:
+            bool: True jika CAPTCHA terdeteksi, False jika tidak
+        """
+        signal = self._detect_captcha()
+        if signal:
+            self.last_captcha_signal = signal
+        return signal is not None
     
     def _wait_for_captcha_solve(self, max_wait_minutes: Optional[int] = None) -> bool:
         """
@@ -124,10 +457,13 @@ class GoogleScholarScraper:
         """
         if max_wait_minutes is None:
             max_wait_minutes = self.captcha_wait_minutes
+        
+        self._report_fetch('CAPTCHA', self.driver.current_url)
             
         print(f"\n{'='*60}")
         print(f"⚠️  CAPTCHA TERDETEKSI!")
         print(f"{'='*60}")
+        print(f"Sinyal: {self.last_captcha_signal}")
         print(f"Silakan selesaikan CAPTCHA secara manual di browser.")
         print(f"Waktu tunggu maksimal: {max_wait_minutes} menit")
         print(f"Script akan otomatis melanjutkan setelah CAPTCHA terselesaikan.")
@@ -135,25 +471,184 @@ class GoogleScholarScraper:
         
         max_attempts = max_wait_minutes * 12  # Check setiap 5 detik
         
-        for attempt in range(max_attempts):
-            # Check apakah CAPTCHA masih ada
-            if not self._check_for_captcha():
-                print(f"\n✅ CAPTCHA berhasil diselesaikan! Melanjutkan scraping...")
-                time.sleep(2)  # Beri waktu halaman untuk stabilize
-                return True
-            
-            # Display countdown
-            remaining_seconds = (max_attempts - attempt) * 5
-            remaining_minutes = remaining_seconds // 60
-            remaining_secs = remaining_seconds % 60
-            print(f"\r⏳ Menunggu CAPTCHA diselesaikan... ({remaining_minutes:02d}:{remaining_secs:02d}) ", end="", flush=True)
+        if self.lean_driver:
+            # Widget CAPTCHA butuh gambar dan CSS: muat ulang halaman tanpa pemblokiran
+            self._set_resource_blocking(False)
+            self.driver.refresh()
+        
+        try:
+            return self._poll_captcha_solved(max_attempts, max_wait_minutes)
+        finally:
+            if self.lean_driver:
+                self._set_resource_blocking(True)
+    
+    def _poll_captcha_solved(self, max_attempts: int, max_wait_minutes: int) -> bool:
+        """
+        Memeriksa setiap 5 detik apakah CAPTCHA sudah diselesaikan.
+        
+        Args:
+            max_attempts (int): Jumlah pemeriksaan maksimal
+            max_wait_minutes (int): Waktu maksimal tunggu (untuk pesan timeout)
             
-            time.sleep(5)  # Check setiap 5 detik
+        Returns:
+            bool: True jika CAPTCHA terselesaikan, False jika timeout
+        """
+        with self._timed('captcha_wait'):
+            for attempt in range(max_attempts):
+                # Check apakah CAPTCHA masih ada
+                if not self._check_for_captcha():
+                    print("\n✅ CAPTCHA berhasil diselesaikan! Melanjutkan scraping...")
+                    # Tunggu halaman tujuan selesai dimuat setelah redirect
+                    try:
+                        WebDriverWait(self.driver, self.wait_time).until(
+                            lambda driver: driver.execute_script("return document.readyState") == "complete"
+                        )
+                    except TimeoutException:
+                        pass
+                    return True
+                
+                # Display countdown
+                remaining_seconds = (max_attempts - attempt) * 5
+                remaining_minutes = remaining_seconds // 60
+                remaining_secs = remaining_seconds % 60
+                print(f"\r⏳ Menunggu CAPTCHA diselesaikan... ({remaining_minutes:02d}:{remaining_secs:02d}) ", end="", flush=True)
+                
+                time.sleep(5)  # Check setiap 5 detik
         
         print(f"\n\n❌ Timeout! CAPTCHA tidak diselesaikan dalam {max_wait_minutes} menit.")
         print(f"   Melewati nama dosen ini dan melanjutkan ke berikutnya.\n")
         return False
     
+    def _build_search_url(self, nama_dosen: str) -> str:
+        """
+        Membuat URL hasil pencarian Google Scholar untuk nama dosen.
+        
+        Args:
+            nama_dosen (str): Nama dosen yang akan dicari
+            
+        Returns:
+            str: URL halaman hasil pencarian
+        """
+        return f"{SCHOLAR_BASE_URL}/scholar?hl=id&q={quote_plus(nama_dosen)}"
+    
+    def _load_page_with_driver(self, url: str) -> str:
+        """
+        Membuka URL lewat Selenium (mode Selenium, atau fallback mode HTTP).
+        Jika CAPTCHA muncul, user diberi kesempatan menyelesaikannya secara manual,
+        lalu cookies browser disalin ke HTTP session.
+        
+        Args:
+            url (str): URL yang akan dibuka
+            
+        Returns:
+            str: page_source halaman setelah dimuat
+            
+        Raises:
+            CaptchaDetectedError: Jika CAPTCHA tidak terselesaikan dalam batas waktu
+        """
+        with self._driver_lock:
+            self._ensure_driver()
+            self._throttle()
+            try:
+                self.driver.get(url)
+            except TimeoutException:
+                self._report_fetch('TIMEOUT', url)
+                raise
+            
+            if self._check_for_captcha():
+                if not self._wait_for_captcha_solve():
+                    raise CaptchaDetectedError(
+                        f"CAPTCHA not solved within timeout ({self.last_captcha_signal}): {url}"
+                    )
+            else:
+                self._report_fetch('OK', url)
+            
+            if self.http_fetcher:
+                self.http_fetcher.import_cookies(self.driver.get_cookies())
+            
+            return self.driver.page_source
+    
+    def _fetch_page_html(self, url: str) -> Optional[str]:
+        """
+        Mengambil HTML halaman lewat HTTP, beralih ke Selenium jika CAPTCHA terdeteksi.
+        
+        Args:
+            url (str): URL halaman Google Scholar
+            
+        Returns:
+            Optional[str]: HTML halaman, atau None jika request gagal
+        """
+        self._throttle(via_driver=False)
+        try:
+            html = self.http_fetcher.fetch(url)
+        except FetchTimeoutError as e:
+            print(f"⚠️ {e}")
+            self._report_fetch('TIMEOUT', url)
+            return None
+        except CaptchaDetectedError:
+            print(f"⚠️ CAPTCHA pada HTTP fetch, beralih ke Selenium: {url}")
+            self._report_fetch('CAPTCHA', url)
+            return self._load_page_with_driver(url)
+        
+        if html is not None:
+            self._report_fetch('OK', url)
+        return html
+    
+    def _get_cached_html(self, url: str) -> Optional[str]:
+        """
+        Mengambil HTML dari cache disk (jika cache aktif).
+        Pada mode cache_only, entry yang sudah kedaluwarsa tetap dipakai.
+        
+        Args:
+            url (str): URL halaman Google Scholar
+            
+        Returns:
+            Optional[str]: HTML dari cache, atau None jika tidak ada
+        """
+        if not self.page_cache:
+            return None
+        return self.page_cache.get(url, ignore_ttl=self.cache_only)
+    
+    def _store_cached_html(self, url: str, html: Optional[str]):
+        """
+        Menyimpan HTML hasil fetch ke cache disk (jika cache aktif).
+        
+        Args:
+            url (str): URL halaman Google Scholar
+            html (Optional[str]): HTML halaman
+        """
+        if self.page_cache and html:
+            self.page_cache.put(url, html)
+    
+    def _load_html(self, url: str, refresh: bool = False) -> Optional[str]:
+        """
+        Mengambil HTML halaman: dari cache jika tersedia, selain itu sesuai fetch_mode
+        (HTTP atau Selenium). Pada mode cache_only tidak ada akses jaringan sama sekali.
+        
+        Args:
+            url (str): URL halaman Google Scholar
+            refresh (bool): Jika True, cache dilewati dan halaman diambil ulang
+                            (kecuali pada mode cache_only)
+            
+        Returns:
+            Optional[str]: HTML halaman, atau None jika gagal dimuat
+        """
+        html = None if refresh and not self.cache_only else self._get_cached_html(url)
+        if html is not None:
+            return html
+        
+        if self.cache_only:
+            print(f"  ℹ️  Tidak ada di cache (mode cache-only): {url}")
+            return None
+        
+        if self.fetch_mode == 'http':
+            html = self._fetch_page_html(url)
+        else:
+            html = self._load_page_with_driver(url)
+        
+        self._store_cached_html(url, html)
+        return html
+    
     def _search_dosen(self, nama_dosen: str) -> bool:
         """
         Melakukan pencarian nama dosen di Google Scholar.
@@ -166,6 +661,7 @@ class GoogleScholarScraper:
         """
         try:
             # Navigasi ke halaman utama Google Scholar
+            self._throttle()
             self.driver.get("https://scholar.google.com/schhp?hl=id")
             
             # Tunggu input field muncul
@@ -180,10 +676,17 @@ class GoogleScholarScraper:
             
             # Klik tombol search
             search_button = self.driver.find_element(By.ID, "gs_hdr_tsb")
+            self._throttle()
             search_button.click()
             
-            # Tunggu hasil pencarian muncul
-            time.sleep(2)
+            # Tunggu hasil pencarian (atau halaman CAPTCHA) muncul.
+            # Timeout tidak dianggap gagal: CAPTCHA check dan pencarian profil menangani sisanya.
+            wait.until(EC.staleness_of(search_box))
+            loaded = self._wait_for_any(
+                EC.presence_of_element_located((By.ID, "gs_res_ccl")),
+                *self._captcha_conditions()
+            )
+            self._report_fetch('OK' if loaded else 'TIMEOUT', self.driver.current_url)
             return True
             
         except Exception as e:
@@ -208,10 +711,15 @@ class GoogleScholarScraper:
             profile_url = profile_link.get_attribute("href")
             
             # Klik link profil
+            self._throttle()
             profile_link.click()
             
-            # Tunggu halaman profil dimuat
-            time.sleep(2)
+            # Tunggu tabel publikasi (atau halaman CAPTCHA) muncul
+            loaded = self._wait_for_any(
+                EC.presence_of_element_located((By.ID, "gsc_a_b")),
+                *self._captcha_conditions()
+            )
+            self._report_fetch('OK' if loaded else 'TIMEOUT', profile_url)
             
             return profile_url
             
@@ -222,6 +730,51 @@ class GoogleScholarScraper:
             print(f"Error saat mencari profil: {e}")
             return None
     
+    def _get_cached_profile_url(self, nama_dosen: str) -> Optional[str]:
+        """
+        Mengambil URL profil dari cache nama -> profil (termasuk override manual).
+        
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            
+        Returns:
+            Optional[str]: URL profil, atau None jika belum diketahui
+        """
+        if not self.profile_cache:
+            return None
+        
+        profile_url = self.profile_cache.get(nama_dosen)
+        if profile_url:
+            print(f"📌 Profil dari cache, pencarian dilewati: {profile_url}")
+        return profile_url
+    
+    def _remember_profile_url(self, nama_dosen: str, profile_url: str):
+        """
+        Menyimpan hasil pencarian profil ke cache nama -> profil.
+        
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            profile_url (str): URL profil hasil pencarian
+        """
+        if self.profile_cache:
+            self.profile_cache.set(nama_dosen, profile_url)
+    
+    def _open_profile(self, profile_url: str):
+        """
+        Membuka halaman profil langsung lewat URL (tanpa pencarian) dan menunggu
+        tabel publikasi atau halaman CAPTCHA muncul.
+        
+        Args:
+            profile_url (str): URL profil Google Scholar
+        """
+        self._throttle()
+        self.driver.get(profile_url)
+        loaded = self._wait_for_any(
+            EC.presence_of_element_located((By.ID, "gsc_a_b")),
+            *self._captcha_conditions()
+        )
+        self._report_fetch('OK' if loaded else 'TIMEOUT', profile_url)
+    
     def _load_all_publications(self):
         """
         Mengklik tombol 'Tampilkan lainnya' hingga semua publikasi dimuat.
@@ -237,13 +790,9 @@ class GoogleScholarScraper:
                 if show_more_button.get_attribute("disabled"):
                     break
                 
-                # Scroll ke tombol
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", show_more_button)
-                time.sleep(0.5)
-                
-                # Klik tombol
-                show_more_button.click()
-                time.sleep(1.5)
+                # Klik tombol dan tunggu baris baru muncul
+                if not self._click_show_more(show_more_button):
+                    break
                 
             except TimeoutException:
                 # Tidak ada tombol lagi, semua publikasi sudah dimuat
@@ -267,8 +816,8 @@ class GoogleScholarScraper:
         try:
             # NOTE: Sebaiknya menggunakan klik pada elemen, bukan navigasi langsung
             # Tapi karena kita sudah kembali ke profil, kita perlu navigasi ulang
+            self._throttle()
             self.driver.get(detail_url)
-            time.sleep(1.5)
             
             return self._scrape_publication_detail_from_current_page()
             
@@ -292,333 +841,583 @@ class GoogleScholarScraper:
                 EC.presence_of_element_located((By.ID, "gsc_oci_table"))
             )
             
-            # Parse dengan BeautifulSoup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            detail_table = soup.find('div', {'id': 'gsc_oci_table'})
-            
-            details = {}
-            if detail_table:
-                rows = detail_table.find_all('div', class_='gs_scl')
-                for row in rows:
-                    field = row.find('div', class_='gsc_oci_field')
-                    value = row.find('div', class_='gsc_oci_value')
-                    
-                    if field and value:
-                        field_text = field.get_text(strip=True)
-                        value_text = value.get_text(strip=True)
-                        
-                        # Map field names (Indonesian) ke key yang digunakan
-                        field_mapping = {
-                            'Pengarang': 'Authors',
-                            'Penulis': 'Authors',
-                            'Tanggal terbit': 'Publication_Date',
-                            'Jurnal': 'Journal',
-                            'Jilid': 'Volume',
-                            'Terbitan': 'Issue',
-                            'Halaman': 'Pages',
-                            'Penerbit': 'Publisher',
-                            'Deskripsi': 'Description',
-                            'Total kutipan': 'Total_Citations'
-                        }
-                        
-                        # Gunakan mapped key jika ada, otherwise gunakan original
-                        key = field_mapping.get(field_text, field_text)
-                        details[key] = value_text
-
-            # Parse cited-by per year dari grafik
-            # Ambil dari <div id="gsc_oci_graph_bars">
-            # Struktur: <span class="gsc_oci_g_t">tahun</span> untuk label tahun
-            #           <span class="gsc_oci_g_al">angka</span> untuk jumlah sitasi
-            cited_by_per_year = {}
-            graph_bars = soup.find('div', id='gsc_oci_graph_bars')
-            if graph_bars:
-                # Ambil semua tahun
-                year_spans = graph_bars.find_all('span', class_='gsc_oci_g_t')
-                years = [span.get_text(strip=True) for span in year_spans]
-                
-                # Ambil semua anchor dengan class gsc_oci_g_a yang berisi angka sitasi
-                citation_anchors = graph_bars.find_all('a', class_='gsc_oci_g_a')
-                counts = []
-                for anchor in citation_anchors:
-                    count_span = anchor.find('span', class_='gsc_oci_g_al')
-                    if count_span:
-                        txt = count_span.get_text(strip=True)
-                        try:
-                            # Clean dan convert ke integer
-                            count_value = int(txt.replace('\xa0', '').replace(',', '').replace('.', ''))
-                            counts.append(count_value)
-                        except Exception:
-                            # Fallback: extract hanya angka
-                            try:
-                                count_value = int(re.sub(r'[^0-9]', '', txt) or '0')
-                                counts.append(count_value)
-                            except Exception:
-                                counts.append(0)
-                
-                # Pasangkan tahun dengan jumlah sitasi
-                # Asumsi: jumlah tahun = jumlah counts (seharusnya selalu sama)
-                for i, year_str in enumerate(years):
-                    try:
-                        year_int = int(year_str)
-                        count = counts[i] if i < len(counts) else 0
-                        cited_by_per_year[year_int] = count
-                    except (ValueError, IndexError):
-                        # Skip jika tahun tidak valid atau index out of range
-                        continue
-
-            details['Cited_By_Per_Year'] = cited_by_per_year
-            
-            return details
+            return self._parse_detail_html(self.driver.page_source)
             
         except Exception as e:
             print(f"Error saat scraping detail: {e}")
             return {}
     
-    def _parse_publication_row(self, row_element, scraped_titles: Set[str]) -> Optional[Dict[str, str]]:
+    def _parse_detail_html(self, html: str) -> Dict[str, str]:
         """
-        Parse satu baris publikasi dari halaman profil.
+        Parse HTML halaman detail artikel (view_op=view_citation).
+        Dipakai bersama oleh mode Selenium dan mode HTTP.
         
         Args:
-            row_element: Element Selenium dari baris publikasi
-            scraped_titles (Set[str]): Set judul yang sudah di-scrape
+            html (str): HTML halaman detail artikel
             
         Returns:
-            Optional[Dict[str, str]]: Data publikasi atau None jika sudah di-scrape
+            Dict[str, str]: Dictionary berisi detail publikasi, kosong jika tabel tidak ditemukan
         """
-        try:
-            soup = BeautifulSoup(row_element.get_attribute('innerHTML'), 'html.parser')
-            
-            # Ekstrak judul
-            title_elem = soup.find('a', class_='gsc_a_at')
-            if not title_elem:
-                return None
-            
-            title = title_elem.get_text(strip=True)
-            
-            # Skip jika sudah di-scrape
-            if title in scraped_titles:
-                return None
-            
-            # Ekstrak link detail
-            detail_link = title_elem.get('href', '')
-            if detail_link:
-                detail_link = "https://scholar.google.com" + detail_link
-            
-            # Ekstrak informasi publikasi
-            pub_info_elem = soup.find('div', class_='gs_gray')
-            authors = pub_info_elem.get_text(strip=True) if pub_info_elem else ''
-            
-            # Ekstrak venue dan tahun
-            venue_elem = soup.find_all('div', class_='gs_gray')
-            venue_info = venue_elem[1].get_text(strip=True) if len(venue_elem) > 1 else ''
-            
-            # Ekstrak tahun dan kutipan
-            year_elem = soup.find('span', class_='gsc_a_h')
-            year = year_elem.get_text(strip=True) if year_elem else ''
-            
-            cited_elem = soup.find('a', class_='gsc_a_ac')
-            citations = cited_elem.get_text(strip=True) if cited_elem else '0'
-            
-            # Periksa apakah info lengkap (diakhiri dengan ...)
-            is_incomplete = venue_info.endswith('...')
-            
-            publication_data = {
-                'Judul': title,
-                'Penulis': authors,
-                'Venue_Raw': venue_info,  # Simpan venue mentah
-                'Tahun': year,
-                'Sitasi': citations,
-                'Detail_Link': detail_link,
-                'Is_Incomplete': is_incomplete
-            }
-            
-            return publication_data
-            
-        except Exception as e:
-            print(f"Error parsing row: {e}")
-            return None
+        return self.parser.parse_detail(html)
     
-    def scrape_dosen_publications(self, nama_dosen: str) -> List[Dict[str, str]]:
+    def _filter_new_rows(self, rows: List[Dict], scraped_titles: Set[str]) -> List[Dict[str, str]]:
         """
-        Scrape semua publikasi untuk satu dosen.
-        Strategi: Scrape artikel yang sudah dimuat di layar, baru tekan tombol "Tampilkan lainnya".
+        Menyaring baris publikasi tanpa judul atau yang judulnya sudah pernah di-scrape.
+        Judul baris yang dikembalikan ditambahkan ke scraped_titles.
         
         Args:
-            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            rows (List[Dict]): Hasil parser.parse_profile_rows
+            scraped_titles (Set[str]): Set judul yang sudah di-scrape (diubah in-place)
             
         Returns:
-            List[Dict[str, str]]: List berisi data publikasi
+            List[Dict[str, str]]: Data publikasi yang belum pernah di-scrape
         """
-        publications = []
-        scraped_titles: Set[str] = set()
+        new_rows = []
+        for pub_data in rows:
+            if not pub_data['Judul'] or pub_data['Judul'] in scraped_titles:
+                continue
+            new_rows.append(pub_data)
+            scraped_titles.add(pub_data['Judul'])
+        return new_rows
+    
+    def _parse_search_profile_url(self, html: str) -> Optional[str]:
+        """
+        Mengambil URL profil pertama dari HTML hasil pencarian (h4.gs_rt2 a).
         
-        try:
-            # Cari dosen
-            if not self._search_dosen(nama_dosen):
-                print(f"Gagal mencari: {nama_dosen}")
-                if self.logger:
-                    self.logger.log_failure(nama_dosen, "Gagal melakukan pencarian", "SEARCH_FAILED")
-                return publications
-            
-            # Check for CAPTCHA after search
-            if self._check_for_captcha():
-                print(f"⚠️ CAPTCHA terdeteksi setelah pencarian: {nama_dosen}")
-                # Beri kesempatan user untuk solve CAPTCHA manual
-                if not self._wait_for_captcha_solve():
-                    # Jika timeout atau gagal solve, log dan skip
-                    if self.logger:
-                        self.logger.log_failure(nama_dosen, "CAPTCHA not solved within timeout", "CAPTCHA")
-                    return publications
-                # CAPTCHA berhasil diselesaikan, lanjutkan
+        Args:
+            html (str): HTML halaman hasil pencarian
             
-            # Klik profil
-            profile_url = self._find_and_click_profile()
-            if not profile_url:
-                print(f"Profil tidak ditemukan untuk: {nama_dosen}")
-                if self.logger:
-                    self.logger.log_failure(nama_dosen, "Profil tidak ditemukan", "PROFILE_NOT_FOUND")
-                return publications
+        Returns:
+            Optional[str]: URL profil absolut, atau None jika tidak ada
+        """
+        return self.parser.parse_search_profile_url(html)
+    
+    def _has_more_publications_html(self, html: str) -> bool:
+        """
+        Memeriksa apakah tombol 'Tampilkan lainnya' (gsc_bpf_more) masih aktif.
+        
+        Args:
+            html (str): HTML halaman profil
             
-            # Check for CAPTCHA after clicking profile
-            if self._check_for_captcha():
-                print(f"⚠️ CAPTCHA terdeteksi setelah klik profil: {nama_dosen}")
-                # Beri kesempatan user untuk solve CAPTCHA manual
-                if not self._wait_for_captcha_solve():
-                    # Jika timeout atau gagal solve, log dan skip
-                    if self.logger:
-                        self.logger.log_failure(nama_dosen, "CAPTCHA not solved within timeout on profile page", "CAPTCHA")
-                    return publications
-                # CAPTCHA berhasil diselesaikan, lanjutkan
+        Returns:
+            bool: True jika masih ada publikasi yang belum dimuat
+        """
+        return self.parser.has_more_publications(html)
+    
+    def _apply_publication_details(self, pub_data: Dict, details: Dict):
+        """
+        Menggabungkan hasil parsing halaman detail ke data publikasi.
+        Jika detail kosong, venue di-parse dari Venue_Raw sebagai fallback.
+        
+        Args:
+            pub_data (Dict): Data publikasi dari baris profil (diubah in-place)
+            details (Dict): Hasil _parse_detail_html / _scrape_publication_detail_from_current_page
+        """
+        if not details:
+            self._apply_venue_fallback(pub_data)
+            return
+        
+        # Ambil data dari field yang sudah di-map
+        pub_data['Journal_Name'] = details.get('Journal', '')
+        pub_data['Volume'] = details.get('Volume', '')
+        pub_data['Issue'] = details.get('Issue', '')
+        pub_data['Pages'] = details.get('Pages', '')
+        pub_data['Publisher'] = details.get('Publisher', '')
+        
+        # Update penulis dari field Authors jika ada
+        if details.get('Authors'):
+            pub_data['Penulis'] = details.get('Authors')
+        
+        # Extract tahun dari Publication_Date jika ada (format: 2014/7/1)
+        if details.get('Publication_Date'):
+            try:
+                pub_date = details.get('Publication_Date')
+                year_from_date = pub_date.split('/')[0] if '/' in pub_date else pub_date.split('-')[0]
+                if year_from_date.isdigit():
+                    pub_data['Tahun'] = year_from_date
+            except Exception:
+                pass
+        
+        # Simpan cited_by per year (PRIORITAS UTAMA)
+        pub_data['Cited_By_Per_Year'] = details.get('Cited_By_Per_Year', {})
+    
+    def _apply_venue_fallback(self, pub_data: Dict):
+        """
+        Mengisi field venue dari Venue_Raw jika halaman detail gagal di-scrape.
+        
+        Args:
+            pub_data (Dict): Data publikasi (diubah in-place)
+        """
+        venue_parsed = parse_publication_info(pub_data['Venue_Raw'])
+        pub_data['Journal_Name'] = venue_parsed['journal_name']
+        pub_data['Volume'] = venue_parsed['volume']
+        pub_data['Issue'] = venue_parsed['issue']
+        pub_data['Pages'] = venue_parsed['pages']
+        pub_data['Publisher'] = venue_parsed['publisher']
+        pub_data['Cited_By_Per_Year'] = {}
+    
+    def _finalize_publication(self, pub_data: Dict, nama_dosen: str) -> Dict:
+        """
+        Menambahkan nama dosen dan link, lalu menghapus field sementara.
+        
+        Args:
+            pub_data (Dict): Data publikasi (diubah in-place)
+            nama_dosen (str): Nama dosen pemilik profil
+            
+        Returns:
+            Dict: Data publikasi yang siap dimasukkan ke hasil
+        """
+        # Tambahkan nama dosen
+        pub_data['Nama Dosen'] = nama_dosen
+        
+        # Simpan link detail sebagai kolom Link
+        pub_data['Link'] = pub_data['Detail_Link']
+        
+        # Hapus flag is_incomplete dan data sementara
+        del pub_data['Is_Incomplete']
+        del pub_data['Detail_Link']
+        del pub_data['Venue_Raw']
+        
+        return pub_data
+    
+    def _load_snapshot(self, nama_dosen: str) -> Dict[str, Dict]:
+        """
+        Memuat snapshot publikasi dosen dari run sebelumnya (hanya pada mode incremental).
+        
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            
+        Returns:
+            Dict[str, Dict]: Entry snapshot per key publikasi
+        """
+        if not self.incremental or not self.snapshot_store:
+            return {}
+        return self.snapshot_store.load(nama_dosen)
+    
+    def _save_snapshot(self, nama_dosen: str, new_snapshot: Dict[str, Dict]):
+        """
+        Menyimpan snapshot publikasi dosen setelah scraping berhasil.
+        Mode cache_only tidak mengubah snapshot.
+        
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            new_snapshot (Dict[str, Dict]): Entry snapshot per key publikasi
+        """
+        if self.snapshot_store and not self.cache_only and new_snapshot:
+            self.snapshot_store.save(nama_dosen, new_snapshot)
+    
+    def _store_results(self, nama_dosen: str, publications: List[Dict], profile_url: Optional[str]):
+        """
+        Meneruskan hasil satu dosen ke result store (upsert) dan result sink (streaming), jika aktif.
+        Kegagalan database/file hanya dicatat agar hasil run tetap tersimpan di journal.
+        
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            publications (List[Dict]): Publikasi dosen tersebut
+            profile_url (Optional[str]): URL profil Google Scholar
+        """
+        if self.result_sink:
+            try:
+                self.result_sink.write(nama_dosen, publications)
+            except Exception as e:
+                print(f"⚠️ Gagal menulis {nama_dosen} ke {self.result_sink.path}: {e}")
+        
+        if not self.result_store:
+            return
+        try:
+            stats = self.result_store.upsert_lecturer(
+                nama_dosen, publications, profile_url=profile_url,
+                session_id=self.logger.session_id if self.logger else None
+            )
+            if stats['added'] or stats['updated'] or stats['removed']:
+                print(f"🗄️  {nama_dosen}: {stats['added']} baru, {stats['updated']} berubah, "
+                      f"{stats['removed']} hilang dari profil")
+        except Exception as e:
+            print(f"⚠️ Gagal menyimpan {nama_dosen} ke result store: {e}")
+    
+    def _fetch_row_details(self, rows: List[Dict], snapshot: Dict[str, Dict],
+                           new_snapshot: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Mengambil detail untuk baris publikasi. Pada mode incremental, baris yang judul,
+        sitasi, dan tahunnya sama dengan snapshot memakai detail tersimpan; hanya baris
+        baru atau berubah yang halaman detailnya diambil.
+        
+        Args:
+            rows (List[Dict]): Baris publikasi dari halaman profil (sebelum detail digabung)
+            snapshot (Dict[str, Dict]): Snapshot run sebelumnya (lihat _load_snapshot)
+            new_snapshot (Dict[str, Dict]): Snapshot run ini (diisi in-place)
+            
+        Returns:
+            Dict[str, Dict]: Hasil parsing detail per URL
+        """
+        reused, fetch_urls, changed_urls = self._plan_row_details(rows, snapshot)
+        
+        # Halaman detail publikasi yang berubah tidak boleh diambil dari cache halaman
+        details_by_url = self._fetch_publication_details(fetch_urls, refresh_urls=changed_urls)
+        details_by_url.update(reused)
+        
+        self._update_snapshot(rows, details_by_url, new_snapshot)
+        return details_by_url
+    
+    def _plan_row_details(self, rows: List[Dict], snapshot: Dict[str, Dict]):
+        """
+        Membandingkan baris publikasi dengan snapshot: detail baris yang tidak berubah dipakai
+        ulang, sisanya harus diambil.
+        
+        Args:
+            rows (List[Dict]): Baris publikasi dari halaman profil
+            snapshot (Dict[str, Dict]): Snapshot run sebelumnya (lihat _load_snapshot)
+            
+        Returns:
+            tuple: (detail yang dipakai ulang per URL, URL yang harus diambil,
+                    set URL publikasi yang berubah sehingga cache halamannya harus dilewati)
+        """
+        reused = {}
+        fetch_urls = []
+        changed_urls = set()
+        
+        for row in rows:
+            previous = snapshot.get(publication_key(row))
+            if previous and previous['details'] and previous['signature'] == row_signature(row):
+                reused[row['Detail_Link']] = previous['details']
+            else:
+                fetch_urls.append(row['Detail_Link'])
+                if previous:
+                    changed_urls.add(row['Detail_Link'])
+        
+        if snapshot:
+            print(f"  ♻️  Incremental: {len(reused)} publikasi tidak berubah, "
+                  f"{len(fetch_urls) - len(changed_urls)} baru, {len(changed_urls)} berubah")
+        
+        return reused, fetch_urls, changed_urls
+    
+    def _update_snapshot(self, rows: List[Dict], details_by_url: Dict[str, Dict],
+                         new_snapshot: Dict[str, Dict]):
+        """
+        Mengisi snapshot run ini dengan tanda tangan dan detail setiap baris.
+        
+        Args:
+            rows (List[Dict]): Baris publikasi dari halaman profil
+            details_by_url (Dict[str, Dict]): Detail per URL
+            new_snapshot (Dict[str, Dict]): Snapshot run ini (diisi in-place)
+        """
+        for row in rows:
+            new_snapshot[publication_key(row)] = {
+                'signature': row_signature(row),
+                'details': details_by_url.get(row['Detail_Link'], {})
+            }
+    
+    def _fetch_publication_details(self, detail_urls: List[str],
+                                   refresh_urls: Optional[Set[str]] = None) -> Dict[str, Dict]:
+        """
+        Mengambil dan mem-parse banyak halaman detail sekaligus dengan konkurensi terbatas.
+        Mode HTTP memakai thread pool, mode Selenium memakai beberapa tab browser.
+        
+        Args:
+            detail_urls (List[str]): URL halaman detail (view_op=view_citation)
+            refresh_urls (Optional[Set[str]]): URL yang harus diambil ulang tanpa melihat cache halaman
+            
+        Returns:
+            Dict[str, Dict]: Hasil parsing detail per URL (dict kosong jika gagal)
+        """
+        urls = [url for url in dict.fromkeys(detail_urls) if url]
+        if not urls:
+            return {}
+        
+        # Halaman detail yang ada di cache di-parse langsung tanpa request
+        results = {}
+        if self.page_cache:
+            for url in urls:
+                if refresh_urls and url in refresh_urls and not self.cache_only:
+                    continue
+                html = self._get_cached_html(url)
+                if html is not None:
+                    results[url] = self._parse_detail_html(html)
+            if results:
+                print(f"  💾 {len(results)} halaman detail diambil dari cache")
+        
+        urls = [url for url in urls if url not in results]
+        if not urls:
+            return results
+        
+        if self.cache_only:
+            print(f"  ℹ️  {len(urls)} halaman detail tidak ada di cache (mode cache-only)")
+            results.update({url: {} for url in urls})
+            return results
+        
+        print(f"  📄 Mengambil {len(urls)} halaman detail (konkurensi {self.detail_concurrency})...")
+        
+        if self.fetch_mode == 'http':
+            results.update(self._fetch_details_http(urls))
+        else:
+            results.update(self._fetch_details_tabs(urls))
+        return results
+    
+    def _fetch_detail_http(self, url: str) -> Dict[str, str]:
+        """
+        Mengambil dan mem-parse satu halaman detail lewat HTTP.
+        
+        Args:
+            url (str): URL halaman detail
+            
+        Returns:
+            Dict[str, str]: Detail publikasi, kosong jika gagal
+        """
+        html = self._fetch_page_html(url)
+        if not html:
+            return {}
+        
+        details = self._parse_detail_html(html)
+        if details:
+            self._store_cached_html(url, html)
+        return details
+    
+    def _fetch_details_http(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Mengambil halaman detail lewat HTTP dengan thread pool sebesar detail_concurrency.
+        
+        Args:
+            urls (List[str]): URL halaman detail
+            
+        Returns:
+            Dict[str, Dict]: Hasil parsing detail per URL
+            
+        Raises:
+            CaptchaDetectedError: Jika CAPTCHA tidak terselesaikan lewat fallback Selenium
+        """
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=self.detail_concurrency)
+        
+        try:
+            future_to_url = {executor.submit(self._fetch_detail_http, url): url for url in urls}
+            for done, future in enumerate(as_completed(future_to_url), 1):
+                url = future_to_url[future]
+                try:
+                    results[url] = future.result()
+                except CaptchaDetectedError:
+                    raise
+                except Exception as e:
+                    print(f"    ⚠️  Gagal mengambil detail {url}: {e}")
+                    results[url] = {}
+                
+                if done % 20 == 0 or done == len(urls):
+                    print(f"  [{done}/{len(urls)}] detail selesai")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        return results
+    
+    def _fetch_details_tabs(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Mengambil halaman detail lewat Selenium dengan membuka beberapa tab sekaligus.
+        Tab dimuat bersamaan oleh browser, lalu dibaca satu per satu dan ditutup;
+        tab utama tidak pernah ditinggalkan sehingga tidak perlu driver.back().
+        
+        Args:
+            urls (List[str]): URL halaman detail
+            
+        Returns:
+            Dict[str, Dict]: Hasil parsing detail per URL
+            
+        Raises:
+            CaptchaDetectedError: Jika CAPTCHA tidak terselesaikan dalam batas waktu
+        """
+        results = {}
+        
+        with self._driver_lock:
+            main_handle = self.driver.current_window_handle
+            
+            for start in range(0, len(urls), self.detail_concurrency):
+                chunk = urls[start:start + self.detail_concurrency]
+                tabs = []
+                
+                # Buka semua tab di chunk ini agar dimuat paralel oleh browser
+                for url in chunk:
+                    self._throttle()
+                    tabs.append((url, self._open_tab(url)))
+                
+                try:
+                    for url, handle in tabs:
+                        if handle is None:
+                            results[url] = {}
+                            continue
+                        
+                        self.driver.switch_to.window(handle)
+                        details = self._scrape_publication_detail_from_current_page()
+                        
+                        if not details and self._check_for_captcha():
+                            if not self._wait_for_captcha_solve():
+                                raise CaptchaDetectedError(f"CAPTCHA not solved within timeout: {url}")
+                            details = self._scrape_publication_detail_from_current_page()
+                        else:
+                            self._report_fetch('OK' if details else 'TIMEOUT', url)
+                        
+                        if details:
+                            self._store_cached_html(url, self.driver.page_source)
+                        results[url] = details
+                finally:
+                    for _, handle in tabs:
+                        if handle and handle in self.driver.window_handles:
+                            self.driver.switch_to.window(handle)
+                            self.driver.close()
+                    self.driver.switch_to.window(main_handle)
+                
+                print(f"  [{min(start + len(chunk), len(urls))}/{len(urls)}] detail selesai")
+        
+        return results
+    
+    def _open_tab(self, url: str) -> Optional[str]:
+        """
+        Membuka URL di tab baru tanpa menunggu halaman selesai dimuat.
+        Pada lean driver tab dibuka kosong dulu: Network.setBlockedURLs hanya berlaku per tab,
+        sehingga pemblokiran dipasang di tab baru sebelum URL dimuat.
+        
+        Args:
+            url (str): URL yang dibuka
+            
+        Returns:
+            Optional[str]: Handle tab baru, None jika tab tidak terbuka
+        """
+        before = set(self.driver.window_handles)
+        self.driver.execute_script("window.open(arguments[0], '_blank');", 'about:blank' if self.lean_driver else url)
+        new_handles = [h for h in self.driver.window_handles if h not in before]
+        if not new_handles:
+            return None
+        
+        if self.lean_driver:
+            self.driver.switch_to.window(new_handles[0])
+            self._set_resource_blocking(True)
+            self.driver.execute_script("window.location.href = arguments[0];", url)
+        return new_handles[0]
+    
+    def scrape_dosen_publications(self, nama_dosen: str) -> List[Dict[str, str]]:
+        """
+        Scrape semua publikasi untuk satu dosen.
+        Strategi: Scrape artikel yang sudah dimuat di layar (detail diambil lewat tab terpisah),
+        baru tekan tombol "Tampilkan lainnya".
+        Pada fetch_mode 'http', pagination 'url', atau mode cache_only proses didelegasikan ke
+        _scrape_dosen_publications_paged.
+        
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            
+        Returns:
+            List[Dict[str, str]]: List berisi data publikasi
+        """
+        if self.journal:
+            self.journal.start_dosen(nama_dosen)
+        
+        with self._timed('dosen_total', nama_dosen):
+            if self.fetch_mode == 'http' or self.pagination == 'url' or self.cache_only:
+                return self._scrape_dosen_publications_paged(nama_dosen)
+            return self._scrape_dosen_publications_click(nama_dosen)
+    
+    def _scrape_dosen_publications_click(self, nama_dosen: str) -> List[Dict[str, str]]:
+        """
+        Scrape semua publikasi untuk satu dosen dengan alur klik di browser
+        (pencarian -> klik profil -> tombol "Tampilkan lainnya").
+        
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            
+        Returns:
+            List[Dict[str, str]]: List berisi data publikasi
+        """
+        publications = []
+        scraped_titles: Set[str] = set()
+        
+        try:
+            profile_url = self._get_cached_profile_url(nama_dosen)
+            
+            if profile_url:
+                # Profil sudah diketahui dari cache: langsung buka tanpa pencarian
+                with self._timed('profile', nama_dosen):
+                    self._open_profile(profile_url)
+                
+                if self._check_for_captcha():
+                    print(f"⚠️ CAPTCHA terdeteksi saat membuka profil: {nama_dosen}")
+                    if not self._wait_for_captcha_solve():
+                        if self.logger:
+                            self.logger.log_failure(nama_dosen, "CAPTCHA not solved within timeout on profile page", "CAPTCHA")
+                        return publications
+            else:
+                # Cari dosen
+                with self._timed('search', nama_dosen):
+                    searched = self._search_dosen(nama_dosen)
+                if not searched:
+                    print(f"Gagal mencari: {nama_dosen}")
+                    if self.logger:
+                        self.logger.log_failure(nama_dosen, "Gagal melakukan pencarian", "SEARCH_FAILED")
+                    return publications
+                
+                # Check for CAPTCHA after search
+                if self._check_for_captcha():
+                    print(f"⚠️ CAPTCHA terdeteksi setelah pencarian: {nama_dosen}")
+                    # Beri kesempatan user untuk solve CAPTCHA manual
+                    if not self._wait_for_captcha_solve():
+                        # Jika timeout atau gagal solve, log dan skip
+                        if self.logger:
+                            self.logger.log_failure(nama_dosen, "CAPTCHA not solved within timeout", "CAPTCHA")
+                        return publications
+                    # CAPTCHA berhasil diselesaikan, lanjutkan
+                
+                # Klik profil
+                with self._timed('profile', nama_dosen):
+                    profile_url = self._find_and_click_profile()
+                if not profile_url:
+                    print(f"Profil tidak ditemukan untuk: {nama_dosen}")
+                    if self.logger:
+                        self.logger.log_failure(nama_dosen, "Profil tidak ditemukan", "PROFILE_NOT_FOUND")
+                    return publications
+                
+                # Check for CAPTCHA after clicking profile
+                if self._check_for_captcha():
+                    print(f"⚠️ CAPTCHA terdeteksi setelah klik profil: {nama_dosen}")
+                    # Beri kesempatan user untuk solve CAPTCHA manual
+                    if not self._wait_for_captcha_solve():
+                        # Jika timeout atau gagal solve, log dan skip
+                        if self.logger:
+                            self.logger.log_failure(nama_dosen, "CAPTCHA not solved within timeout on profile page", "CAPTCHA")
+                        return publications
+                    # CAPTCHA berhasil diselesaikan, lanjutkan
+                
+                self._remember_profile_url(nama_dosen, profile_url)
             
             print(f"Memproses profil: {nama_dosen}")
             
+            snapshot = self._load_snapshot(nama_dosen)
+            new_snapshot: Dict[str, Dict] = {}
+            
             # Loop untuk scraping batch per batch
             batch_number = 1
             has_more = True
+            rows_seen = 0
             
             while has_more:
                 print(f"\n  === Batch {batch_number} ===")
                 
-                # Dapatkan semua baris publikasi yang saat ini dimuat di layar
-                pub_rows = self.driver.find_elements(By.CLASS_NAME, "gsc_a_tr")
-                current_row_count = len(pub_rows)
+                # Satu snapshot page_source per batch; WebDriver hanya dipakai untuk navigasi.
+                # Hanya baris yang baru muncul setelah klik 'Tampilkan lainnya' yang di-parse.
+                new_rows = self.parser.parse_profile_rows(self.driver.page_source, skip_rows=rows_seen)
+                current_row_count = rows_seen + len(new_rows)
                 print(f"  Total artikel di layar: {current_row_count}")
                 
-                # Scrape semua artikel yang ada di layar
-                for idx, row in enumerate(pub_rows):
-                    try:
-                        pub_data = self._parse_publication_row(row, scraped_titles)
-                        
-                        if not pub_data:
-                            continue
-                        
-                        # SELALU masuk ke halaman detail untuk setiap artikel
-                        # Strategi: Klik link artikel di halaman profil
-                        try:
-                            print(f"  [{idx+1}/{current_row_count}] Mengambil detail: {pub_data['Judul'][:50]}...")
-                            
-                            # Cari link artikel dengan class gsc_a_at di row ini
-                            # Re-find row element untuk menghindari stale reference
-                            current_rows = self.driver.find_elements(By.CLASS_NAME, "gsc_a_tr")
-                            if idx < len(current_rows):
-                                current_row = current_rows[idx]
-                                
-                                # Cari dan klik link judul artikel
-                                article_link = current_row.find_element(By.CLASS_NAME, "gsc_a_at")
-                                
-                                # Scroll ke elemen agar terlihat
-                                self.driver.execute_script("arguments[0].scrollIntoView(true);", article_link)
-                                time.sleep(0.3)
-                                
-                                # Klik link artikel
-                                article_link.click()
-                                time.sleep(1.5)
-                                
-                                # Sekarang kita ada di halaman detail, scrape datanya
-                                details = self._scrape_publication_detail_from_current_page()
-                                
-                                # Jika ada detail, ambil langsung dari field terstruktur
-                                if details:
-                                    # Ambil data dari field yang sudah di-map
-                                    pub_data['Journal_Name'] = details.get('Journal', '')
-                                    pub_data['Volume'] = details.get('Volume', '')
-                                    pub_data['Issue'] = details.get('Issue', '')
-                                    pub_data['Pages'] = details.get('Pages', '')
-                                    pub_data['Publisher'] = details.get('Publisher', '')
-                                    
-                                    # Update penulis dari field Authors jika ada
-                                    if details.get('Authors'):
-                                        pub_data['Penulis'] = details.get('Authors')
-                                    
-                                    # Extract tahun dari Publication_Date jika ada (format: 2014/7/1)
-                                    if details.get('Publication_Date'):
-                                        try:
-                                            pub_date = details.get('Publication_Date')
-                                            year_from_date = pub_date.split('/')[0] if '/' in pub_date else pub_date.split('-')[0]
-                                            if year_from_date.isdigit():
-                                                pub_data['Tahun'] = year_from_date
-                                        except Exception:
-                                            pass
-                                    
-                                    # Simpan cited_by per year (PRIORITAS UTAMA)
-                                    cited_map = details.get('Cited_By_Per_Year', {})
-                                    pub_data['Cited_By_Per_Year'] = cited_map
-                                else:
-                                    # Jika gagal scrape detail, parse dari venue_raw
-                                    venue_parsed = parse_publication_info(pub_data['Venue_Raw'])
-                                    pub_data['Journal_Name'] = venue_parsed['journal_name']
-                                    pub_data['Volume'] = venue_parsed['volume']
-                                    pub_data['Issue'] = venue_parsed['issue']
-                                    pub_data['Pages'] = venue_parsed['pages']
-                                    pub_data['Publisher'] = venue_parsed['publisher']
-                                    pub_data['Cited_By_Per_Year'] = {}
-                                
-                                # Kembali ke halaman profil
-                                self.driver.back()
-                                time.sleep(1)
-                            else:
-                                raise Exception("Row index out of range")
-
-                        except Exception as e:
-                            print(f"    ⚠️  Gagal mengambil detail: {e}")
-                            # Fallback: parse dari venue_raw dan set cited_by kosong
-                            venue_parsed = parse_publication_info(pub_data['Venue_Raw'])
-                            pub_data['Journal_Name'] = venue_parsed['journal_name']
-                            pub_data['Volume'] = venue_parsed['volume']
-                            pub_data['Issue'] = venue_parsed['issue']
-                            pub_data['Pages'] = venue_parsed['pages']
-                            pub_data['Publisher'] = venue_parsed['publisher']
-                            pub_data['Cited_By_Per_Year'] = {}
-                            
-                            # Pastikan kembali ke profil jika error terjadi setelah klik
-                            try:
-                                if "citations" in self.driver.current_url and "view_op=view_citation" in self.driver.current_url:
-                                    self.driver.back()
-                                    time.sleep(1)
-                            except Exception:
-                                pass
-                        
-                        # Tambahkan nama dosen
-                        pub_data['Nama Dosen'] = nama_dosen
-                        
-                        # Simpan link detail sebagai kolom Link
-                        pub_data['Link'] = pub_data['Detail_Link']
-                        
-                        # Hapus flag is_incomplete dan data sementara
-                        del pub_data['Is_Incomplete']
-                        del pub_data['Detail_Link']
-                        del pub_data['Venue_Raw']
-                        
-                        # Tambahkan ke hasil
-                        publications.append(pub_data)
-                        scraped_titles.add(pub_data['Judul'])
-                        
-                    except StaleElementReferenceException:
-                        # Element sudah tidak valid, skip
-                        continue
-                    except Exception as e:
-                        print(f"    ⚠️  Error pada publikasi {idx+1}: {e}")
-                        continue
+                batch_rows = self._filter_new_rows(new_rows, scraped_titles)
+                rows_seen = current_row_count
+                
+                # Ambil halaman detail batch ini di tab terpisah; tab profil tetap terbuka
+                with self._timed('detail_stage', nama_dosen):
+                    details_by_url = self._fetch_row_details(batch_rows, snapshot, new_snapshot)
+                
+                batch_publications = []
+                for pub_data in batch_rows:
+                    details = details_by_url.get(pub_data['Detail_Link'], {})
+                    self._apply_publication_details(pub_data, details)
+                    batch_publications.append(self._finalize_publication(pub_data, nama_dosen))
+                
+                publications.extend(batch_publications)
+                if self.journal:
+                    self.journal.record_batch(nama_dosen, batch_publications)
                 
                 print(f"  ✅ Batch {batch_number} selesai: {len(publications)} total publikasi")
                 
@@ -633,13 +1432,14 @@ class GoogleScholarScraper:
                         print(f"  ℹ️  Tidak ada artikel lagi (tombol disabled)")
                         has_more = False
                     else:
-                        # Scroll ke tombol dan klik
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", show_more_button)
-                        time.sleep(0.5)
-                        show_more_button.click()
                         print(f"  ⏬ Memuat batch berikutnya...")
-                        time.sleep(1.5)
-                        batch_number += 1
+                        with self._timed('show_more', nama_dosen):
+                            loaded = self._click_show_more(show_more_button)
+                        if loaded:
+                            batch_number += 1
+                        else:
+                            print("  ℹ️  Tidak ada baris baru setelah klik 'Tampilkan lainnya'")
+                            has_more = False
                         
                 except TimeoutException:
                     # Tidak ada tombol lagi, semua publikasi sudah dimuat
@@ -651,6 +1451,130 @@ class GoogleScholarScraper:
             
             print(f"\n✅ Selesai: {nama_dosen} - {len(publications)} publikasi total")
             
+            self._save_snapshot(nama_dosen, new_snapshot)
+            
+            if self.journal:
+                self.journal.mark_done(nama_dosen, len(publications))
+            self._store_results(nama_dosen, publications, profile_url)
+            
+            # Log success
+            if self.logger:
+                self.logger.log_success(nama_dosen, len(publications), f"Profile: {profile_url}")
+            
+        except Exception as e:
+            print(f"❌ Error saat scraping {nama_dosen}: {e}")
+            if self.logger:
+                # Check if it's a CAPTCHA-related error
+                error_msg = str(e).lower()
+                if 'captcha' in error_msg or 'recaptcha' in error_msg or 'unusual traffic' in error_msg:
+                    self.logger.log_failure(nama_dosen, str(e), "CAPTCHA")
+                else:
+                    self.logger.log_failure(nama_dosen, str(e), "SCRAPING_ERROR")
+        
+        return publications
+    
+    def _scrape_dosen_publications_paged(self, nama_dosen: str) -> List[Dict[str, str]]:
+        """
+        Scrape semua publikasi untuk satu dosen berdasarkan URL.
+        Daftar publikasi diminta per PROFILE_PAGE_SIZE baris lewat parameter cstart/pagesize
+        dan setiap halaman di-parse sekali. Setelah semua baris terkumpul, halaman detail
+        diambil sekaligus lewat _fetch_publication_details. Halaman diambil lewat _load_html
+        sehingga berlaku untuk mode HTTP maupun Selenium.
+        
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            
+        Returns:
+            List[Dict[str, str]]: List berisi data publikasi
+        """
+        publications = []
+        scraped_titles: Set[str] = set()
+        
+        try:
+            profile_url = self._get_cached_profile_url(nama_dosen)
+            from_profile_cache = profile_url is not None
+            
+            if not profile_url:
+                # Cari dosen
+                with self._timed('search', nama_dosen):
+                    search_html = self._load_html(self._build_search_url(nama_dosen))
+                if search_html is None:
+                    print(f"Gagal mencari: {nama_dosen}")
+                    if self.logger:
+                        self.logger.log_failure(nama_dosen, "Gagal melakukan pencarian", "SEARCH_FAILED")
+                    return publications
+                
+                profile_url = self._parse_search_profile_url(search_html)
+                if not profile_url:
+                    print(f"Profil tidak ditemukan untuk: {nama_dosen}")
+                    if self.logger:
+                        self.logger.log_failure(nama_dosen, "Profil tidak ditemukan", "PROFILE_NOT_FOUND")
+                    return publications
+                
+                self._remember_profile_url(nama_dosen, profile_url)
+            
+            print(f"Memproses profil: {nama_dosen}")
+            
+            all_rows: List[Dict] = []
+            page_number = 1
+            cstart = 0
+            
+            # Tahap 1: kumpulkan semua baris publikasi dari halaman profil
+            while True:
+                print(f"\n  === Halaman {page_number} (cstart={cstart}) ===")
+                
+                page_url = build_profile_page_url(profile_url, cstart, PROFILE_PAGE_SIZE)
+                with self._timed('profile_page', nama_dosen):
+                    profile_html = self._load_html(page_url)
+                if profile_html is None:
+                    # Profil dari cache mungkin sudah tidak valid; cari ulang pada run berikutnya
+                    if from_profile_cache and page_number == 1 and self.profile_cache:
+                        self.profile_cache.invalidate(nama_dosen)
+                    raise Exception(f"Gagal memuat halaman profil: {page_url}")
+                
+                page_rows = self.parser.parse_profile_rows(profile_html)
+                pub_rows = self._filter_new_rows(page_rows, scraped_titles)
+                all_rows.extend(pub_rows)
+                print(f"  Artikel baru: {len(pub_rows)} (total {len(all_rows)})")
+                
+                # Berhenti berdasarkan isi halaman, bukan hasil de-duplikasi: halaman yang semua
+                # judulnya duplikat tetap diikuti halaman berikutnya selama tombol masih aktif
+                if not page_rows or not self._has_more_publications_html(profile_html):
+                    print("  ℹ️  Tidak ada artikel lagi")
+                    break
+                
+                cstart += PROFILE_PAGE_SIZE
+                page_number += 1
+            
+            # Tahap 2: ambil semua halaman detail sekaligus, lalu gabungkan ke baris berdasarkan URL
+            new_snapshot: Dict[str, Dict] = {}
+            snapshot = self._load_snapshot(nama_dosen)
+            
+            # Detail diproses per PROFILE_PAGE_SIZE baris agar setiap batch bisa dicatat ke journal
+            for start in range(0, len(all_rows), PROFILE_PAGE_SIZE):
+                batch_rows = all_rows[start:start + PROFILE_PAGE_SIZE]
+                
+                with self._timed('detail_stage', nama_dosen):
+                    details_by_url = self._fetch_row_details(batch_rows, snapshot, new_snapshot)
+                
+                batch_publications = []
+                for pub_data in batch_rows:
+                    details = details_by_url.get(pub_data['Detail_Link'], {})
+                    self._apply_publication_details(pub_data, details)
+                    batch_publications.append(self._finalize_publication(pub_data, nama_dosen))
+                
+                publications.extend(batch_publications)
+                if self.journal:
+                    self.journal.record_batch(nama_dosen, batch_publications)
+            
+            print(f"\n✅ Selesai: {nama_dosen} - {len(publications)} publikasi total")
+            
+            self._save_snapshot(nama_dosen, new_snapshot)
+            
+            if self.journal:
+                self.journal.mark_done(nama_dosen, len(publications))
+            self._store_results(nama_dosen, publications, profile_url)
+            
             # Log success
             if self.logger:
                 self.logger.log_success(nama_dosen, len(publications), f"Profile: {profile_url}")
@@ -667,43 +1591,261 @@ class GoogleScholarScraper:
         
         return publications
     
-    def run_scraper(self, dosen_list: List[str], years: Optional[List[int]] = None) -> pd.DataFrame:
+    def _spawn_worker(self, worker_id: int) -> 'GoogleScholarScraper':
+        """
+        Membuat instance scraper baru untuk satu worker dengan konfigurasi yang sama.
+        Worker memakai logger yang sama sehingga semua event masuk ke satu session log.
+        Worker pertama memakai driver manager dari luar (Chrome yang tetap hidup di GUI);
+        worker lain memakai manager sendiri dengan batas daur ulang yang sama.
+        
+        Args:
+            worker_id (int): Nomor worker (mulai dari 1)
+        
+        Returns:
+            GoogleScholarScraper: Scraper worker dengan driver sendiri (belum diinisialisasi)
+        """
+        use_shared_manager = worker_id == 1 and not self._owns_driver_manager
+        # fetch_mode 'selenium' dan tanpa rate limit agar konstruktor tidak membuat HttpFetcher
+        # dan rate limiter sendiri; keduanya dipakai bersama dari scraper utama di bawah
+        worker = GoogleScholarScraper(
+            headless=self.headless,
+            lean_driver=self.lean_driver,
+            user_data_dir=self.user_data_dir,
+            wait_time=self.wait_time,
+            captcha_wait_minutes=self.captcha_wait_minutes,
+            fetch_mode='selenium',
+            pagination=self.pagination,
+            detail_concurrency=self.detail_concurrency,
+            parser=self.parser.name,
+            rate_per_minute=None,
+            driver_manager=self.driver_manager if use_shared_manager else None,
+            max_pages_per_driver=self.driver_manager.max_pages,
+            max_driver_memory_mb=self.driver_manager.max_memory_mb
+        )
+        # Profil 'main' untuk manager bersama agar konfigurasi sama dan Chrome yang hidup dipakai ulang
+        worker.driver_profile = self.driver_profile if use_shared_manager else f"worker_{worker_id}"
+        # HTTP session (connection pool), cache disk, dan rate limiter dipakai bersama oleh semua worker
+        worker.fetch_mode = self.fetch_mode
+        worker.http_fetcher = self.http_fetcher
+        worker.page_cache = self.page_cache
+        worker.profile_cache = self.profile_cache
+        worker.snapshot_store = self.snapshot_store
+        worker.result_store = self.result_store
+        worker.result_sink = self.result_sink
+        worker.rate_limiter = self.rate_limiter
+        worker.incremental = self.incremental
+        worker.journal = self.journal
+        worker._stop_event = self._stop_event
+        worker.cache_only = self.cache_only
+        worker.logger = self.logger
+        worker.years_to_collect = self.years_to_collect
+        return worker
+    
+    def _run_worker(self, worker_id: int, task_queue: queue.Queue, results: Dict[int, List[Dict]], total: int):
+        """
+        Loop satu worker: ambil nama dari antrian bersama sampai antrian kosong.
+        
+        Args:
+            worker_id (int): Nomor worker (untuk keperluan log)
+            task_queue (queue.Queue): Antrian berisi tuple (index, nama_dosen)
+            results (Dict[int, List[Dict]]): Hasil per index dosen (diisi oleh worker)
+            total (int): Total dosen (untuk keperluan log)
+        """
+        worker = self._spawn_worker(worker_id)
+        
+        try:
+            # Mode HTTP membuat driver hanya saat dibutuhkan (fallback); cache-only tanpa driver
+            if self.fetch_mode == 'selenium' and not self.cache_only:
+                worker._init_driver()
+        except Exception as e:
+            # Nama tetap di antrian sehingga bisa diambil worker lain
+            print(f"❌ [Worker {worker_id}] Gagal inisialisasi driver: {e}")
+            return
+        
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    idx, nama_dosen = task_queue.get_nowait()
+                except queue.Empty:
+                    break
+                
+                print(f"\n[Worker {worker_id}] [{idx + 1}/{total}] Memproses: {nama_dosen}{self._rate_label()}")
+                worker._refresh_driver()
+                publications = worker.scrape_dosen_publications(nama_dosen)
+                results[idx] = publications if self._keep_results else []
+        finally:
+            worker._release_driver()
+    
+    def _run_worker_pool(self, dosen_list: List[str]) -> List[Dict[str, str]]:
+        """
+        Menjalankan scraping dengan beberapa worker Chrome yang mengambil nama
+        dari antrian bersama.
+        
+        Args:
+            dosen_list (List[str]): List nama dosen yang sudah dibersihkan
+            
+        Returns:
+            List[Dict[str, str]]: Semua publikasi, urut sesuai dosen_list
+        """
+        task_queue: queue.Queue = queue.Queue()
+        for idx, nama_dosen in enumerate(dosen_list):
+            task_queue.put((idx, nama_dosen))
+        
+        results: Dict[int, List[Dict]] = {}
+        num_workers = min(self.num_workers, len(dosen_list))
+        print(f"🚀 Menjalankan {num_workers} worker paralel")
+        
+        threads = []
+        for worker_id in range(1, num_workers + 1):
+            thread = threading.Thread(
+                target=self._run_worker,
+                args=(worker_id, task_queue, results, len(dosen_list)),
+                name=f"scraper-worker-{worker_id}",
+                daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        
+        for thread in threads:
+            thread.join()
+        
+        # Nama yang tersisa di antrian berarti semua worker gagal start
+        # (kecuali dihentikan lewat request_stop; nama tersebut dilanjutkan saat resume)
+        while not self._stop_event.is_set():
+            try:
+                _, nama_dosen = task_queue.get_nowait()
+            except queue.Empty:
+                break
+            if self.logger:
+                self.logger.log_failure(nama_dosen, "Tidak ada worker yang aktif", "DRIVER_ERROR")
+        
+        all_publications = []
+        for idx in range(len(dosen_list)):
+            all_publications.extend(results.get(idx, []))
+        return all_publications
+    
+    def run_scraper(self, dosen_list: List[str], years: Optional[List[int]] = None,
+                    resume_session_id: Optional[str] = None,
+                    session_id: Optional[str] = None, sink: Optional[ResultSink] = None,
+                    return_dataframe: bool = True) -> Optional[pd.DataFrame]:
         """
         Menjalankan scraper untuk list nama dosen.
+        Jika num_workers > 1, nama dosen dibagi ke beberapa worker Chrome paralel.
+        Setiap batch dan setiap dosen yang selesai dicatat ke journal session
+        (logging/session_<id>/journal_<id>.jsonl) dan diteruskan ke sink (jika ada).
         
         Args:
             dosen_list (List[str]): List nama dosen yang sudah dibersihkan
             years (Optional[List[int]]): List tahun untuk cited_by tracking
+            resume_session_id (Optional[str]): Session ID yang dilanjutkan; dosen yang sudah
+                                               selesai di session tersebut diambil dari journal,
+                                               dan daftar dosen/tahun dari journal menggantikan
+                                               dosen_list/years (jika tercatat)
+            session_id (Optional[str]): Session ID untuk session baru (default: timestamp),
+                                        misalnya '<run>_shard1' pada mode multi-proses
+            sink (Optional[ResultSink]): Sink yang menerima publikasi setiap dosen selesai
+                                         (tidak ditutup di sini; tutup dengan sink.close())
+            return_dataframe (bool): False = publikasi tidak disimpan di memori dan fungsi
+                                     mengembalikan None; DataFrame bisa dibangun kemudian
+                                     dengan sink.to_dataframe()
             
         Returns:
-            pd.DataFrame: DataFrame berisi semua publikasi
+            Optional[pd.DataFrame]: DataFrame berisi semua publikasi (None jika return_dataframe=False)
         """
         all_publications = []
+        self._stop_event.clear()
+        self.result_sink = sink
+        self._keep_results = return_dataframe
+        
+        # Initialize logger (run lanjutan menulis file log <id>_resume<N> di folder session yang sama)
+        self.logger = ScraperLogger(session_id=resume_session_id or session_id,
+                                    resume=resume_session_id is not None)
+        
+        self.journal = CheckpointJournal(
+            os.path.join(self.logger.log_dir, f"journal_{self.logger.session_id}.jsonl")
+        )
+        if resume_session_id and not os.path.exists(self.journal.journal_path):
+            print(f"⚠️  Journal untuk session {resume_session_id} tidak ditemukan, semua dosen diproses ulang")
+        
+        # Session yang dilanjutkan memakai daftar dosen dan tahun yang tercatat di journal
+        saved_session = self.journal.load_session() if resume_session_id else None
+        if saved_session:
+            dosen_list = saved_session['dosen']
+            years = saved_session['years']
+        else:
+            self.journal.start_session(dosen_list, years)
+        
         # store requested years (set) to filter output columns later
         self.years_to_collect = set(years) if years else None
+        if sink is not None and sink.years is None:
+            sink.years = self.years_to_collect
         
-        # Initialize logger
-        self.logger = ScraperLogger()
         self.logger.start_session(dosen_list)
+        if self.rate_limiter:
+            self.logger.add_listener(self.rate_limiter.handle_event)
+            self.rate_limiter.on_change = self.logger.record_rate_change
+        
+        completed = self.journal.load_completed() if resume_session_id else {}
+        for nama_dosen, publications in completed.items():
+            if nama_dosen in dosen_list:
+                self.logger.log_success(nama_dosen, len(publications), "Dilanjutkan dari journal")
+                if sink is not None:
+                    sink.write(nama_dosen, publications)
+        
+        remaining = [nama for nama in dosen_list if nama not in completed]
+        if resume_session_id:
+            print(f"♻️  Resume session {resume_session_id}: {len(dosen_list) - len(remaining)} dosen sudah selesai, "
+                  f"{len(remaining)} dosen tersisa")
         
         try:
-            # Inisialisasi driver
-            self._init_driver()
-            
-            # Loop untuk setiap dosen
-            for idx, nama_dosen in enumerate(dosen_list, 1):
-                print(f"\n[{idx}/{len(dosen_list)}] Memproses: {nama_dosen}")
-                
-                publications = self.scrape_dosen_publications(nama_dosen)
-                all_publications.extend(publications)
+            if self.pipeline == 'async' and remaining:
+                # Driver (mode Selenium / fallback CAPTCHA) dibuat saat pertama dibutuhkan
+                pipeline = AsyncScrapePipeline(
+                    self,
+                    concurrency=self.pipeline_concurrency,
+                    per_host_limit=self.per_host_limit,
+                    page_size=PROFILE_PAGE_SIZE
+                )
+                all_publications = pipeline.run(remaining)
+            elif self.num_workers > 1 and len(remaining) > 1:
+                all_publications = self._run_worker_pool(remaining)
+            elif remaining:
+                # Inisialisasi driver (mode HTTP membuat driver hanya saat fallback,
+                # mode cache-only tidak membutuhkan driver)
+                if self.fetch_mode == 'selenium' and not self.cache_only:
+                    self._init_driver()
                 
-                # Jeda antar dosen
-                time.sleep(2)
+                # Loop untuk setiap dosen
+                for idx, nama_dosen in enumerate(remaining, 1):
+                    if self._stop_event.is_set():
+                        break
+                    
+                    print(f"\n[{idx}/{len(remaining)}] Memproses: {nama_dosen}{self._rate_label()}")
+                    
+                    # Jeda antar dosen diatur oleh rate limiter di setiap fetch
+                    self._refresh_driver()
+                    publications = self.scrape_dosen_publications(nama_dosen)
+                    if self._keep_results:
+                        all_publications.extend(publications)
         
         finally:
-            # Pastikan driver ditutup
-            if self.driver:
-                self.driver.quit()
+            # Pastikan driver ditutup (atau disimpan oleh driver manager GUI untuk run berikutnya)
+            self._release_driver()
+            
+            if self._stop_event.is_set():
+                print(f"\n⏹️  Scraping dihentikan. Lanjutkan dengan: python main.py --resume {self.logger.session_id}")
+            
+            if self.page_cache:
+                stats = self.page_cache.get_stats()
+                print(f"\n💾 Cache: {stats['hits']} hit, {stats['misses']} miss "
+                      f"({stats['hit_rate']:.1f}%), {stats['entries']} halaman, {stats['size_mb']:.1f} MB")
+            
+            if self.rate_limiter:
+                stats = self.rate_limiter.get_stats()
+                print(f"\n🚦 Rate limit akhir: {stats['rate_per_minute']:.1f} halaman/menit "
+                      f"(rentang {stats['lowest_rate']:.1f}-{stats['highest_rate']:.1f}), "
+                      f"{stats['acquired']} fetch, menunggu {stats['waited_seconds']:.1f}s, "
+                      f"{stats['captcha_events']} CAPTCHA, {stats['timeout_events']} timeout")
             
             # End logging session and save logs
             if self.logger:
@@ -718,25 +1860,87 @@ class GoogleScholarScraper:
                 print(f"Success Rate: {(summary['success']/summary['total']*100):.1f}%" if summary['total'] > 0 else "N/A")
                 print(f"{'='*60}\n")
         
+        self.result_sink = None
+        if not return_dataframe:
+            return None
+        
+        # Gabungkan hasil dari journal dengan hasil run ini, urut sesuai dosen_list
+        if completed:
+            by_dosen: Dict[str, List[Dict]] = {}
+            for pub in all_publications:
+                by_dosen.setdefault(pub['Nama Dosen'], []).append(pub)
+            by_dosen.update({nama: pubs for nama, pubs in completed.items() if nama in dosen_list})
+            all_publications = [pub for nama in dict.fromkeys(dosen_list) for pub in by_dosen.get(nama, [])]
+        
         # Konversi ke DataFrame
-        df = pd.DataFrame(all_publications)
-
-        # Jika ada data Cited_By_Per_Year, expand menjadi kolom terpisah
-        if 'Cited_By_Per_Year' in df.columns:
-            # determine years to output
-            if self.years_to_collect:
-                years_out = sorted(self.years_to_collect)
-            else:
-                # union of all years present
-                years_union = set()
-                for m in df['Cited_By_Per_Year'].dropna().tolist():
-                    if isinstance(m, dict):
-                        years_union.update(m.keys())
-                years_out = sorted(years_union)
-
-            # create columns like 2025_cited_by
-            for y in years_out:
-                col = f"{y}_cited_by"
-                df[col] = df['Cited_By_Per_Year'].apply(lambda m, y=y: int(m.get(y, 0)) if isinstance(m, dict) else 0)
-
-        return df
+        return publications_to_dataframe(all_publications, self.years_to_collect)
+    
+    def run_queue_worker(self, job_queue: JobQueue, job_id: str, worker_id: str,
+                         poll_seconds: float = 10.0) -> int:
+        """
+        Menjalankan scraper sebagai worker job queue: klaim satu dosen, scrape sambil
+        memperpanjang lease, kirim hasil, ulangi sampai semua tugas job selesai.
+        Jika tidak ada tugas pending tetapi masih ada tugas yang di-lease worker lain,
+        worker menunggu (tugas tersebut bisa kembali ke antrian jika lease-nya habis).
+        
+        Args:
+            job_queue (JobQueue): Antrian tugas bersama
+            job_id (str): ID job yang dikerjakan
+            worker_id (str): ID worker (juga dipakai untuk session log '<job_id>_<worker_id>')
+            poll_seconds (float): Jeda pengecekan ulang saat antrian sedang kosong
+            
+        Returns:
+            int: Jumlah dosen yang hasilnya diterima coordinator
+        """
+        self._stop_event.clear()
+        self.journal = None  # Hasil per dosen disimpan di job queue
+        self.logger = ScraperLogger(session_id=f"{job_id}_{worker_id}")
+        self.logger.start_session([])
+        if self.rate_limiter:
+            self.logger.add_listener(self.rate_limiter.handle_event)
+            self.rate_limiter.on_change = self.logger.record_rate_change
+        
+        completed = 0
+        try:
+            if self.fetch_mode == 'selenium' and not self.cache_only:
+                self._init_driver()
+            
+            while not self._stop_event.is_set():
+                task = job_queue.claim(job_id, worker_id)
+                if task is None:
+                    if job_queue.is_finished(job_id):
+                        break
+                    self._stop_event.wait(poll_seconds)
+                    continue
+                
+                nama_dosen = task['nama']
+                self.logger.register_dosen(nama_dosen)
+                progress = job_queue.progress(job_id)
+                print(f"\n[{worker_id}] [{progress['done'] + progress['failed'] + 1}/{progress['total']}] "
+                      f"Memproses: {nama_dosen} (percobaan {task['attempts']}){self._rate_label()}")
+                
+                self._refresh_driver()
+                with LeaseHeartbeat(job_queue, job_id, nama_dosen, worker_id):
+                    publications = self.scrape_dosen_publications(nama_dosen)
+                
+                failure = self.logger.last_failure(nama_dosen)
+                if failure is None:
+                    if job_queue.complete(job_id, nama_dosen, worker_id, publications):
+                        completed += 1
+                    else:
+                        print(f"⚠️ Hasil {nama_dosen} dibuang: tugas sudah diambil alih worker lain")
+                elif self._stop_event.is_set():
+                    job_queue.release(job_id, nama_dosen, worker_id)
+                else:
+                    # Profil yang memang tidak ada tidak perlu dicoba ulang di mesin lain
+                    retry = failure['error_type'] != 'PROFILE_NOT_FOUND'
+                    status = job_queue.fail(job_id, nama_dosen, worker_id,
+                                            f"{failure['error_type']}: {failure['error_message']}", retry=retry)
+                    if status == 'pending':
+                        print(f"🔁 {nama_dosen} dikembalikan ke antrian")
+        finally:
+            self._release_driver()
+            if self.logger:
+                self.logger.end_session()
+        
+        return completed
@@ -0,0 +1,211 @@
+"""
+Sheets manifest module for Google Scholar scraper.
+Menyimpan manifest upload terakhir ke satu sheet Google Sheets: header, urutan key baris di
+sheet, dan hash isi setiap baris. Upload berikutnya dibandingkan dengan manifest ini sehingga
+hanya baris yang baru, berubah, atau hilang yang dikirim (delta sync).
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .snapshot_store import publication_key
+from .utils import sanitize_filename
+
+
+def row_key(header: List[str], row: List[str]) -> str:
+    """
+    Key stabil untuk satu baris publikasi: nama dosen + ID citation_for_view dari kolom Link
+    (atau judul jika link tidak ada). Publikasi yang sama milik dua dosen tetap dua baris.
+
+    Args:
+        header (List[str]): Nama kolom
+        row (List[str]): Nilai baris (string)
+
+    Returns:
+        str: Key baris
+    """
+    values = dict(zip(header, row))
+    key = publication_key({'Detail_Link': values.get('Link'), 'Judul': values.get('Judul')})
+    return f"{values.get('Nama Dosen', '')}|{key}"
+
+
+def row_hash(row: List[str]) -> str:
+    """
+    Hash isi baris (semua kolom) untuk mendeteksi perubahan.
+
+    Args:
+        row (List[str]): Nilai baris (string)
+
+    Returns:
+        str: Hash hex (16 karakter)
+    """
+    raw = json.dumps(row, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha1(raw).hexdigest()[:16]
+
+
+def _runs(numbers: List[int]) -> List[List[int]]:
+    """
+    Mengelompokkan nomor baris terurut menjadi rentang berurutan [awal, jumlah].
+    """
+    runs = []
+    for number in numbers:
+        if runs and runs[-1][0] + runs[-1][1] == number:
+            runs[-1][1] += 1
+        else:
+            runs.append([number, 1])
+    return runs
+
+
+def compute_delta(manifest: Dict, header: List[str], rows: List[List[str]]) -> Optional[Dict]:
+    """
+    Membandingkan baris baru dengan manifest upload terakhir.
+
+    Urutan penerapan di sheet: baris yang berubah ditimpa di posisinya, baris yang hilang
+    dihapus (dari bawah), lalu baris baru ditambahkan di akhir sheet.
+
+    Args:
+        manifest (Dict): Manifest upload terakhir ({'header', 'keys', 'hashes'})
+        header (List[str]): Header baru
+        rows (List[List[str]]): Semua baris baru (string)
+
+    Returns:
+        Optional[Dict]: None jika header berubah (perlu upload penuh), atau
+                        {'updates': [[baris_sheet, jumlah, [[nilai...], ...]], ...],
+                         'deletes': [[baris_sheet, jumlah], ...] (dari bawah),
+                         'inserts': [[nilai...], ...], 'changed_rows': int,
+                         'keys': [...], 'hashes': {...}} (manifest setelah delta diterapkan)
+    """
+    if manifest.get('header') != header:
+        return None
+
+    old_keys = manifest.get('keys', [])
+    old_hashes = manifest.get('hashes', {})
+    position = {key: index for index, key in enumerate(old_keys)}
+
+    new_keys = []
+    new_hashes = {}
+    seen = {}
+    updated = {}
+    inserts = []
+    insert_keys = []
+
+    for row in rows:
+        key = row_key(header, row)
+        # Key ganda (mis. judul sama tanpa link) dibedakan dengan nomor urut kemunculan
+        seen[key] = seen.get(key, 0) + 1
+        if seen[key] > 1:
+            key = f"{key}#{seen[key]}"
+
+        digest = row_hash(row)
+        new_hashes[key] = digest
+        if key in position:
+            if old_hashes.get(key) != digest:
+                updated[position[key]] = row
+        else:
+            inserts.append(row)
+            insert_keys.append(key)
+        new_keys.append(key)
+
+    # Baris sheet = index manifest + 2 (baris 1 header)
+    updates = []
+    update_positions = sorted(updated)
+    for start, count in _runs(update_positions):
+        updates.append([start + 2, count, [updated[index] for index in range(start, start + count)]])
+
+    deleted_positions = [index for index, key in enumerate(old_keys) if key not in new_hashes]
+    deletes = [[start + 2, count] for start, count in reversed(_runs(deleted_positions))]
+
+    deleted = set(deleted_positions)
+    keys = [key for index, key in enumerate(old_keys) if index not in deleted] + insert_keys
+
+    return {
+        'updates': updates,
+        'deletes': deletes,
+        'inserts': inserts,
+        'changed_rows': len(updated) + len(deleted_positions) + len(inserts),
+        'keys': keys,
+        'hashes': new_hashes,
+    }
+
+
+class SheetManifest:
+    """
+    Manifest upload per sheet tujuan, satu file JSON per (spreadsheet, sheet).
+    """
+
+    def __init__(self, manifest_dir: str = "cache/sheets_manifest"):
+        """
+        Inisialisasi manifest store.
+
+        Args:
+            manifest_dir (str): Folder penyimpanan file manifest
+        """
+        self.manifest_dir = manifest_dir
+        os.makedirs(self.manifest_dir, exist_ok=True)
+
+    def _path_for(self, spreadsheet_id: str, sheet_name: str) -> str:
+        filename = sanitize_filename(f"{spreadsheet_id}_{sheet_name}") or "_"
+        return os.path.join(self.manifest_dir, f"{filename}.json")
+
+    def load(self, spreadsheet_id: str, sheet_name: str) -> Optional[Dict]:
+        """
+        Memuat manifest upload terakhir ke sheet.
+
+        Args:
+            spreadsheet_id (str): ID spreadsheet
+            sheet_name (str): Nama sheet
+
+        Returns:
+            Optional[Dict]: {'header', 'keys', 'hashes'}, atau None jika belum pernah upload
+        """
+        path = self._path_for(spreadsheet_id, sheet_name)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Gagal membaca manifest {path}: {e}")
+            return None
+
+    def save(self, spreadsheet_id: str, sheet_name: str, header: List[str],
+             keys: List[str], hashes: Dict[str, str]):
+        """
+        Menyimpan manifest setelah upload berhasil (menimpa manifest sebelumnya).
+
+        Args:
+            spreadsheet_id (str): ID spreadsheet
+            sheet_name (str): Nama sheet
+            header (List[str]): Header di sheet
+            keys (List[str]): Key baris sesuai urutan di sheet
+            hashes (Dict[str, str]): Hash isi per key baris
+        """
+        path = self._path_for(spreadsheet_id, sheet_name)
+        data = {
+            'spreadsheet_id': spreadsheet_id,
+            'sheet_name': sheet_name,
+            'updated_at': datetime.now().isoformat(),
+            'header': header,
+            'keys': keys,
+            'hashes': hashes,
+        }
+
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Gagal menyimpan manifest {path}: {e}")
+
+    def clear(self, spreadsheet_id: str, sheet_name: str):
+        """
+        Menghapus manifest (upload berikutnya menjadi upload penuh).
+        """
+        path = self._path_for(spreadsheet_id, sheet_name)
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,343 @@
+"""
+Result sink module for Google Scholar scraper.
+Sink menerima publikasi setiap kali satu dosen selesai dan langsung menulisnya ke file
+(CSV, JSONL, atau Parquet), sehingga run besar tidak perlu menyimpan semua baris di memori
+dan hasil yang sudah selesai tetap ada di disk jika run terhenti. DataFrame akhir bersifat
+opsional dan dibangun dari file sink hanya saat dibutuhkan (to_dataframe).
+"""
+
+import csv
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Set
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional: hanya dibutuhkan ParquetSink
+    pa = None
+    pq = None
+
+from .file_handler import PARQUET_DICTIONARY_COLUMNS, dataframe_to_arrow
+
+
+def expand_cited_by_years(df: pd.DataFrame, years: Optional[Set[int]] = None) -> pd.DataFrame:
+    """
+    Memecah kolom Cited_By_Per_Year (dict tahun -> sitasi) menjadi kolom <tahun>_cited_by
+    dalam satu langkah (satu DataFrame dari semua dict), bukan satu apply per tahun.
+
+    Args:
+        df (pd.DataFrame): DataFrame publikasi dengan kolom Cited_By_Per_Year
+        years (Optional[Set[int]]): Tahun yang dijadikan kolom (default: semua tahun yang ada)
+
+    Returns:
+        pd.DataFrame: DataFrame dengan kolom <tahun>_cited_by ditambahkan di akhir
+    """
+    if 'Cited_By_Per_Year' not in df.columns:
+        return df
+
+    per_year = pd.DataFrame.from_records(
+        [m if isinstance(m, dict) else {} for m in df['Cited_By_Per_Year']],
+        index=df.index
+    )
+    years_out = sorted(years) if years else sorted(per_year.columns)
+    if not years_out:
+        return df
+
+    per_year = per_year.reindex(columns=years_out).fillna(0).astype(int)
+    per_year.columns = [f"{year}_cited_by" for year in years_out]
+    return pd.concat([df, per_year], axis=1)
+
+
+def publications_to_dataframe(publications: List[Dict], years: Optional[Set[int]] = None) -> pd.DataFrame:
+    """
+    Mengubah list publikasi menjadi DataFrame, dengan Cited_By_Per_Year dipecah menjadi
+    kolom <tahun>_cited_by.
+
+    Args:
+        publications (List[Dict]): Publikasi hasil scraping
+        years (Optional[Set[int]]): Tahun yang dijadikan kolom (default: semua tahun yang ada)
+
+    Returns:
+        pd.DataFrame: DataFrame berisi semua publikasi
+    """
+    return expand_cited_by_years(pd.DataFrame(publications), years)
+
+
+def _restore_year_keys(pub: Dict) -> Dict:
+    """
+    JSON menyimpan key tahun sebagai string; kembalikan ke int.
+    """
+    per_year = pub.get('Cited_By_Per_Year')
+    if isinstance(per_year, dict):
+        pub['Cited_By_Per_Year'] = {int(year): count for year, count in per_year.items()}
+    return pub
+
+
+class ResultSink(ABC):
+    """
+    Dasar semua sink. write() dipanggil sekali per dosen yang selesai (boleh dari beberapa
+    worker thread sekaligus); close() menyelesaikan file. Bisa dipakai sebagai context manager.
+    """
+
+    extension = ""
+
+    def __init__(self, path: str, years: Optional[Set[int]] = None):
+        """
+        Args:
+            path (str): Path file output
+            years (Optional[Set[int]]): Tahun untuk kolom <tahun>_cited_by (default: semua tahun)
+        """
+        self.path = path
+        self.years = set(years) if years else None
+        self.rows = 0
+        self.lecturers = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    def write(self, nama_dosen: str, publications: List[Dict]):
+        """
+        Menulis publikasi satu dosen ke file.
+
+        Args:
+            nama_dosen (str): Nama dosen
+            publications (List[Dict]): Publikasi dosen tersebut
+        """
+        with self._lock:
+            if self.closed:
+                raise ValueError(f"Sink {self.path} sudah ditutup")
+            if publications:
+                self._write(publications)
+            self.rows += len(publications)
+            self.lecturers += 1
+
+    @abstractmethod
+    def _write(self, publications: List[Dict]):
+        """
+        Menulis publikasi ke file (dipanggil dengan lock sudah dipegang).
+        """
+
+    def close(self):
+        """
+        Menyelesaikan dan menutup file (aman dipanggil berkali-kali).
+        """
+        with self._lock:
+            if not self.closed:
+                self._close()
+                self.closed = True
+
+    def _close(self):
+        pass
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Membangun DataFrame dari file sink (sink ditutup terlebih dahulu).
+
+        Returns:
+            pd.DataFrame: Semua publikasi yang sudah ditulis
+        """
+        self.close()
+        if not self.rows:
+            return pd.DataFrame()
+        return self._read()
+
+    @abstractmethod
+    def _read(self) -> pd.DataFrame:
+        """
+        Membaca file sink yang sudah ditutup menjadi DataFrame.
+        """
+
+    def __enter__(self) -> 'ResultSink':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class CsvSink(ResultSink):
+    """
+    CSV dengan kolom <tahun>_cited_by (tanpa kolom dict Cited_By_Per_Year).
+    Jika tahun baru muncul setelah header ditulis, file ditulis ulang sekali saat close()
+    (streaming baris per baris) dengan header lengkap dan kolom tahun terurut.
+    """
+
+    extension = ".csv"
+
+    def __init__(self, path: str, years: Optional[Set[int]] = None):
+        super().__init__(path, years)
+        self._columns: List[str] = []
+        self._header_width = 0
+        self._file = None
+        self._writer = None
+
+    def _flatten(self, pub: Dict) -> Dict:
+        row = {key: value for key, value in pub.items() if key != 'Cited_By_Per_Year'}
+        per_year = pub.get('Cited_By_Per_Year') if isinstance(pub.get('Cited_By_Per_Year'), dict) else {}
+        for year in (self.years or per_year.keys()):
+            row[f"{year}_cited_by"] = int(per_year.get(year, 0))
+        return row
+
+    def _write(self, publications: List[Dict]):
+        rows = [self._flatten(pub) for pub in publications]
+        known = set(self._columns)
+        for row in rows:
+            for column in row:
+                if column not in known:
+                    self._columns.append(column)
+                    known.add(column)
+
+        if self._file is None:
+            self._file = open(self.path, 'w', newline='', encoding='utf-8-sig')
+            self._writer = csv.writer(self._file)
+            if self.years:
+                # Kolom tahun tetap: header langsung final
+                self._columns = self._final_columns()
+            self._writer.writerow(self._columns)
+            self._header_width = len(self._columns)
+
+        for row in rows:
+            self._writer.writerow([self._cell(row, column) for column in self._columns])
+        self._file.flush()
+
+    @staticmethod
+    def _cell(row: Dict, column: str):
+        if column in row:
+            return row[column]
+        return 0 if column.endswith('_cited_by') else ''
+
+    def _final_columns(self) -> List[str]:
+        base = [column for column in self._columns if not column.endswith('_cited_by')]
+        years = sorted(column for column in self._columns if column.endswith('_cited_by'))
+        return base + years
+
+    def _close(self):
+        if self._file is None:
+            return
+        self._file.close()
+
+        final_columns = self._final_columns()
+        if final_columns == self._columns[:self._header_width] and len(self._columns) == self._header_width:
+            return
+
+        # Header berubah: tulis ulang file dengan header final (baris lama diberi nilai default)
+        index = {column: i for i, column in enumerate(self._columns)}
+        tmp_path = f"{self.path}.tmp"
+        with open(self.path, 'r', newline='', encoding='utf-8-sig') as src, \
+                open(tmp_path, 'w', newline='', encoding='utf-8-sig') as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            next(reader, None)
+            writer.writerow(final_columns)
+            for values in reader:
+                values += [None] * (len(self._columns) - len(values))
+                writer.writerow([
+                    values[index[column]] if values[index[column]] is not None
+                    else (0 if column.endswith('_cited_by') else '')
+                    for column in final_columns
+                ])
+        os.replace(tmp_path, self.path)
+
+    def _read(self) -> pd.DataFrame:
+        return pd.read_csv(self.path, encoding='utf-8-sig', dtype=str, keep_default_na=False).astype(
+            {column: int for column in self._final_columns() if column.endswith('_cited_by')}
+        )
+
+
+class JsonlSink(ResultSink):
+    """
+    JSON Lines: satu publikasi per baris, Cited_By_Per_Year tetap sebagai object.
+    """
+
+    extension = ".jsonl"
+
+    def __init__(self, path: str, years: Optional[Set[int]] = None):
+        super().__init__(path, years)
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def _write(self, publications: List[Dict]):
+        for pub in publications:
+            self._file.write(json.dumps(pub, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+    def _read(self) -> pd.DataFrame:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            publications = [_restore_year_keys(json.loads(line)) for line in f if line.strip()]
+        return publications_to_dataframe(publications, self.years)
+
+
+class ParquetSink(ResultSink):
+    """
+    Parquet (pyarrow): satu row group per dosen, dengan skema bertipe yang sama dengan
+    save_to_parquet (Tahun/Sitasi integer, Cited_By_Per_Year map<int16, int32>, nama dosen
+    dan jurnal dictionary-encoded). Kolom ditetapkan dari batch pertama.
+    """
+
+    extension = ".parquet"
+
+    def __init__(self, path: str, years: Optional[Set[int]] = None):
+        if pa is None:
+            raise ImportError("ParquetSink membutuhkan pyarrow (pip install pyarrow)")
+        super().__init__(path, years)
+        self._writer = None
+        self._columns: List[str] = []
+
+    def _write(self, publications: List[Dict]):
+        df = pd.DataFrame(publications)
+        if self._writer is None:
+            self._columns = list(df.columns)
+        table = dataframe_to_arrow(df.reindex(columns=self._columns))
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema, compression='zstd')
+        self._writer.write_table(table.cast(self._writer.schema))
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+    def _read(self) -> pd.DataFrame:
+        # Integer nullable tetap integer (tanpa ini Tahun/Sitasi kosong membuat kolom menjadi float)
+        integer_types = {pa.int16(): pd.Int16Dtype(), pa.int32(): pd.Int32Dtype()}
+        df = pq.read_table(self.path).to_pandas(types_mapper=integer_types.get)
+        for column in PARQUET_DICTIONARY_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype(object)
+        if 'Cited_By_Per_Year' in df.columns:
+            df['Cited_By_Per_Year'] = [dict(m) if m is not None else {} for m in df['Cited_By_Per_Year']]
+        return expand_cited_by_years(df, self.years)
+
+
+SINK_TYPES = {
+    'csv': CsvSink,
+    'jsonl': JsonlSink,
+    'parquet': ParquetSink,
+}
+
+
+def create_sink(fmt: str, base_path: str, years: Optional[Set[int]] = None) -> ResultSink:
+    """
+    Membuat sink sesuai format.
+
+    Args:
+        fmt (str): 'csv', 'jsonl', atau 'parquet'
+        base_path (str): Path output tanpa ekstensi
+        years (Optional[Set[int]]): Tahun untuk kolom <tahun>_cited_by
+
+    Returns:
+        ResultSink: Sink yang siap menerima publikasi
+    """
+    if fmt not in SINK_TYPES:
+        raise ValueError(f"Format sink tidak valid: {fmt}. Gunakan {', '.join(SINK_TYPES)}")
+    sink_type = SINK_TYPES[fmt]
+    return sink_type(base_path + sink_type.extension, years)
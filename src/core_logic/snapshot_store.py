@@ -0,0 +1,137 @@
+"""
+Snapshot store module for Google Scholar scraper.
+Menyimpan snapshot publikasi per dosen (judul, sitasi, tahun, dan hasil parsing halaman
+detail) dari run terakhir. Dipakai mode incremental untuk hanya mengambil ulang halaman
+detail publikasi yang baru atau berubah.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+from .utils import sanitize_filename
+
+
+def publication_key(pub_data: Dict) -> str:
+    """
+    Key stabil untuk satu publikasi: ID citation_for_view dari Detail_Link,
+    atau judul (huruf kecil) jika link tidak tersedia.
+
+    Args:
+        pub_data (Dict): Data publikasi dari baris profil
+
+    Returns:
+        str: Key publikasi
+    """
+    detail_link = pub_data.get('Detail_Link') or ""
+    citation_id = dict(parse_qsl(urlparse(detail_link).query)).get('citation_for_view')
+    if citation_id:
+        return citation_id
+    return " ".join((pub_data.get('Judul') or "").lower().split())
+
+
+def row_signature(pub_data: Dict) -> Tuple[str, str, str]:
+    """
+    Nilai dari daftar publikasi profil yang dibandingkan antar run.
+
+    Args:
+        pub_data (Dict): Data publikasi dari baris profil
+
+    Returns:
+        Tuple[str, str, str]: (judul, sitasi, tahun)
+    """
+    return (
+        (pub_data.get('Judul') or "").strip(),
+        (pub_data.get('Sitasi') or "").strip(),
+        (pub_data.get('Tahun') or "").strip(),
+    )
+
+
+class SnapshotStore:
+    """
+    Penyimpanan snapshot publikasi per dosen, satu file JSON per dosen.
+    """
+
+    def __init__(self, snapshot_dir: str = "cache/snapshots"):
+        """
+        Inisialisasi store.
+
+        Args:
+            snapshot_dir (str): Folder penyimpanan file snapshot
+        """
+        self.snapshot_dir = snapshot_dir
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+
+    def _path_for(self, nama_dosen: str) -> str:
+        """
+        Path file snapshot untuk dosen.
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+
+        Returns:
+            str: Path file JSON
+        """
+        filename = sanitize_filename(" ".join(nama_dosen.lower().split())) or "_"
+        return os.path.join(self.snapshot_dir, f"{filename}.json")
+
+    def load(self, nama_dosen: str) -> Dict[str, Dict]:
+        """
+        Memuat snapshot publikasi dosen dari run sebelumnya.
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+
+        Returns:
+            Dict[str, Dict]: Entry per key publikasi ({'signature', 'details'}),
+                             kosong jika belum ada snapshot
+        """
+        path = self._path_for(nama_dosen)
+        if not os.path.exists(path):
+            return {}
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Gagal membaca snapshot {path}: {e}")
+            return {}
+
+        publications = data.get('publications', {})
+        for entry in publications.values():
+            entry['signature'] = tuple(entry.get('signature', ()))
+            details = entry.get('details') or {}
+            # JSON menyimpan key tahun sebagai string; kembalikan ke int
+            per_year = details.get('Cited_By_Per_Year')
+            if isinstance(per_year, dict):
+                details['Cited_By_Per_Year'] = {int(year): count for year, count in per_year.items()}
+            entry['details'] = details
+        return publications
+
+    def save(self, nama_dosen: str, publications: Dict[str, Dict]):
+        """
+        Menyimpan snapshot publikasi dosen (menimpa snapshot sebelumnya).
+
+        Args:
+            nama_dosen (str): Nama dosen yang sudah dibersihkan
+            publications (Dict[str, Dict]): Entry per key publikasi ({'signature', 'details'})
+        """
+        path = self._path_for(nama_dosen)
+        data = {
+            'nama': nama_dosen,
+            'updated_at': datetime.now().isoformat(),
+            'publications': {
+                key: {'signature': list(entry['signature']), 'details': entry['details']}
+                for key, entry in publications.items()
+            }
+        }
+
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Gagal menyimpan snapshot {path}: {e}")
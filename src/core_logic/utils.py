@@ -5,6 +5,7 @@ Berisi fungsi-fungsi bantuan seperti pembersihan nama dosen.
 
 import re
 from typing import List
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 
 
 def clean_dosen_name(full_name: str) -> str:
@@ -129,6 +130,63 @@ def extract_spreadsheet_id_from_url(url: str) -> str:
     return ""
 
 
+def build_profile_page_url(profile_url: str, cstart: int, pagesize: int = 100) -> str:
+    """
+    Membuat URL halaman daftar publikasi profil dengan parameter cstart/pagesize.
+    
+    Args:
+        profile_url (str): URL profil Google Scholar (citations?user=...)
+        cstart (int): Index baris publikasi pertama yang diminta
+        pagesize (int): Jumlah baris per halaman (maksimal 100)
+        
+    Returns:
+        str: URL profil dengan parameter paginasi
+        
+    Examples:
+        >>> build_profile_page_url("https://scholar.google.com/citations?user=ABC&hl=id", 100)
+        "https://scholar.google.com/citations?user=ABC&hl=id&cstart=100&pagesize=100"
+    """
+    parsed = urlparse(profile_url)
+    params = [(k, v) for k, v in parse_qsl(parsed.query) if k not in ('cstart', 'pagesize')]
+    params.append(('cstart', str(cstart)))
+    params.append(('pagesize', str(pagesize)))
+    return urlunparse(parsed._replace(query=urlencode(params)))
+
+
+def extract_scholar_user_id(profile_url: str) -> str:
+    """
+    Mengekstrak ID user Google Scholar dari URL profil.
+    
+    Args:
+        profile_url (str): URL profil Google Scholar (citations?user=...)
+        
+    Returns:
+        str: ID user, atau string kosong jika tidak ditemukan
+        
+    Examples:
+        >>> extract_scholar_user_id("https://scholar.google.com/citations?user=ABC123&hl=id")
+        "ABC123"
+    """
+    if not profile_url:
+        return ""
+    
+    return dict(parse_qsl(urlparse(profile_url).query)).get('user', "")
+
+
+def build_profile_url(user_id: str, hl: str = "id") -> str:
+    """
+    Membuat URL profil Google Scholar dari ID user.
+    
+    Args:
+        user_id (str): ID user Google Scholar
+        hl (str): Bahasa antarmuka
+        
+    Returns:
+        str: URL profil
+    """
+    return f"https://scholar.google.com/citations?{urlencode([('user', user_id), ('hl', hl)])}"
+
+
 def parse_publication_info(info_string: str) -> dict:
     """
     Melakukan parsing cerdas pada string informasi publikasi.
@@ -22,6 +22,7 @@ from src.core_logic.file_handler import (
     read_dosen_from_file,
     save_to_csv,
     save_to_excel,
+    save_to_parquet,
     generate_summary_docx,
     ensure_output_directory,
     transfer_data_to_sheets,
@@ -29,6 +30,7 @@ from src.core_logic.file_handler import (
 )
 from src.core_logic.utils import clean_dosen_name
 from src.core_logic.scraper import GoogleScholarScraper
+from src.core_logic.driver_manager import DriverManager
 
 
 class GoogleScholarScraperGUI:
@@ -54,19 +56,30 @@ class GoogleScholarScraperGUI:
         self.scraping_mode = tk.StringVar(value="batch")  # NEW: batch or single
         self.output_format = tk.StringVar(value="excel")  # Default: Excel
         self.headless_mode = tk.BooleanVar(value=False)
+        self.http_mode = tk.BooleanVar(value=False)  # HTTP fetch with Selenium fallback
+        self.use_cache = tk.BooleanVar(value=True)  # On-disk page cache (cache/pages)
+        self.incremental_mode = tk.BooleanVar(value=False)  # Only re-fetch changed publications
+        self.lean_browser = tk.BooleanVar(value=True)  # Block images/CSS/fonts, eager page load
+        self.keep_browser = tk.BooleanVar(value=True)  # Keep Chrome warm between scraping runs
+        self.use_result_store = tk.BooleanVar(value=False)  # Also upsert results into output/results.db
         self.wait_time = tk.IntVar(value=10)
         self.captcha_wait_time = tk.IntVar(value=5)  # CAPTCHA wait time in minutes
+        self.num_workers = tk.IntVar(value=1)  # Number of parallel Chrome workers
         # Year selection for per-year cited_by counts
         self.current_year = datetime.now().year
         self.year_from = tk.IntVar(value=self.current_year - 3)
         self.year_to = tk.IntVar(value=self.current_year)
         self.is_running = False
+        self.active_scraper = None  # Running scraper instance (for the Stop button)
+        # Chrome yang tetap hidup antar run (health check + recycle setelah N halaman / memori besar)
+        self.driver_manager = DriverManager(max_pages=500, max_memory_mb=1500)
         self.last_scraped_file = None  # Track last scraped Excel file
         
         # Variables for Upload Tab
         self.excel_file_path = tk.StringVar()
         self.spreadsheet_url = tk.StringVar()
         self.sheet_name = tk.StringVar()
+        self.delta_upload = tk.BooleanVar(value=True)  # Only send new/changed/removed rows
         self.is_uploading = False
         
         # Load configuration from .env
@@ -80,6 +93,18 @@ class GoogleScholarScraperGUI:
         
         # Initialize input mode (show batch by default)
         self._toggle_input_mode()
+        
+        # Tutup Chrome yang disimpan saat jendela ditutup
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+    
+    def _on_close(self):
+        """
+        Stop any running scraper, close the warm browser, and close the window.
+        """
+        if self.active_scraper:
+            self.active_scraper.request_stop()
+        self.driver_manager.close()
+        self.root.destroy()
     
     def _load_config(self):
         """
@@ -306,7 +331,8 @@ class GoogleScholarScraperGUI:
         formats = [
             ("CSV (.csv)", "csv"),
             ("Excel (.xlsx)", "excel"),
-            ("Keduanya (CSV + Excel)", "both")
+            ("Keduanya (CSV + Excel)", "both"),
+            ("Parquet (.parquet, kolom bertipe, butuh pyarrow)", "parquet")
         ]
         
         for text, value in formats:
@@ -340,6 +366,66 @@ class GoogleScholarScraperGUI:
         )
         headless_check.pack(anchor=tk.W, pady=5)
         
+        # HTTP fetch mode
+        http_check = tk.Checkbutton(
+            settings_section,
+            text="Mode HTTP (Tanpa browser, Chrome hanya dipakai saat CAPTCHA)",
+            variable=self.http_mode,
+            font=("Arial", 10),
+            cursor="hand2"
+        )
+        http_check.pack(anchor=tk.W, pady=5)
+        
+        # Page cache
+        cache_check = tk.Checkbutton(
+            settings_section,
+            text="Gunakan Cache Halaman (Tidak mengunduh ulang halaman yang belum kedaluwarsa)",
+            variable=self.use_cache,
+            font=("Arial", 10),
+            cursor="hand2"
+        )
+        cache_check.pack(anchor=tk.W, pady=5)
+        
+        # Incremental refresh
+        incremental_check = tk.Checkbutton(
+            settings_section,
+            text="Mode Incremental (Detail hanya diambil untuk publikasi baru/berubah)",
+            variable=self.incremental_mode,
+            font=("Arial", 10),
+            cursor="hand2"
+        )
+        incremental_check.pack(anchor=tk.W, pady=5)
+        
+        # Lean browser
+        lean_check = tk.Checkbutton(
+            settings_section,
+            text="Browser Ringan (Tanpa gambar/CSS/font, profil Chrome disimpan)",
+            variable=self.lean_browser,
+            font=("Arial", 10),
+            cursor="hand2"
+        )
+        lean_check.pack(anchor=tk.W, pady=5)
+        
+        # Keep browser warm between runs
+        keep_browser_check = tk.Checkbutton(
+            settings_section,
+            text="Pertahankan Browser (Chrome tetap terbuka untuk scraping berikutnya)",
+            variable=self.keep_browser,
+            font=("Arial", 10),
+            cursor="hand2"
+        )
+        keep_browser_check.pack(anchor=tk.W, pady=5)
+        
+        # Result store (opt-in)
+        result_store_check = tk.Checkbutton(
+            settings_section,
+            text="Simpan juga ke Result Store (output/results.db, riwayat perubahan per dosen)",
+            variable=self.use_result_store,
+            font=("Arial", 10),
+            cursor="hand2"
+        )
+        result_store_check.pack(anchor=tk.W, pady=5)
+        
         # Wait time
         wait_frame = tk.Frame(settings_section)
         wait_frame.pack(fill=tk.X, pady=5)
@@ -387,6 +473,33 @@ class GoogleScholarScraperGUI:
             fg="gray"
         ).pack(side=tk.LEFT, padx=10)
         
+        # Number of parallel workers
+        workers_frame = tk.Frame(settings_section)
+        workers_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Label(
+            workers_frame,
+            text="Jumlah Worker:",
+            font=("Arial", 10)
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        
+        workers_spinbox = tk.Spinbox(
+            workers_frame,
+            from_=1,
+            to=8,
+            textvariable=self.num_workers,
+            width=10,
+            font=("Arial", 10)
+        )
+        workers_spinbox.pack(side=tk.LEFT)
+        
+        tk.Label(
+            workers_frame,
+            text="(Browser Chrome paralel, masing-masing memproses dosen berbeda)",
+            font=("Arial", 9),
+            fg="gray"
+        ).pack(side=tk.LEFT, padx=10)
+        
         # Year range selection for cited_by per year
         year_frame = tk.Frame(settings_section)
         year_frame.pack(fill=tk.X, pady=5)
@@ -657,6 +770,16 @@ class GoogleScholarScraperGUI:
             fg="#666666"
         ).pack(side=tk.LEFT, padx=(10, 0))
         
+        # Delta sync
+        delta_check = tk.Checkbutton(
+            sheets_section,
+            text="Hanya kirim perubahan (baris baru/berubah/hilang sejak upload terakhir)",
+            variable=self.delta_upload,
+            font=("Arial", 10),
+            cursor="hand2"
+        )
+        delta_check.pack(anchor=tk.W, pady=(10, 0))
+        
         # ===== Section 3: Upload Actions =====
         action_section = tk.LabelFrame(
             main_frame,
@@ -1017,13 +1140,9 @@ class GoogleScholarScraperGUI:
         
         log_folder = tags[0]
         
-        # Read summary file
-        summary_file = None
-        if os.path.exists(log_folder):
-            for file in os.listdir(log_folder):
-                if file.startswith("summary_") and file.endswith(".json"):
-                    summary_file = os.path.join(log_folder, file)
-                    break
+        # Read summary file (run lanjutan terakhir jika session pernah di-resume)
+        from src.core_logic.logger import latest_log_file
+        summary_file = latest_log_file(log_folder, "summary_", ".json") if os.path.exists(log_folder) else None
         
         if not summary_file or not os.path.exists(summary_file):
             self.session_details_text.delete(1.0, tk.END)
@@ -1187,7 +1306,8 @@ class GoogleScholarScraperGUI:
                 spreadsheet_url=spreadsheet_url,
                 sheet_name=sheet_name,
                 web_app_url=self.config['apps_script_url'],
-                status_callback=self.upload_log
+                status_callback=self.upload_log,
+                delta=self.delta_upload.get()
             )
             
             self.upload_log("")
@@ -1257,6 +1377,11 @@ class GoogleScholarScraperGUI:
                 self.single_entry.focus()
                 return
         
+        # Scraper sebelumnya masih menyelesaikan dosen terakhir (dan mungkin memakai Chrome yang sama)
+        if self.active_scraper:
+            messagebox.showwarning("Tunggu", "Proses sebelumnya masih berhenti. Coba lagi sebentar lagi.")
+            return
+        
         # Disable start button, enable stop button
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
@@ -1277,6 +1402,9 @@ class GoogleScholarScraperGUI:
         Stop the scraping process.
         """
         self.is_running = False
+        if self.active_scraper:
+            # Berhenti setelah dosen yang sedang diproses; progres tersimpan di journal session
+            self.active_scraper.request_stop()
         self.log("⏹️ Proses dihentikan oleh user")
         self._update_status("Stopped by user")
         
@@ -1336,6 +1464,17 @@ class GoogleScholarScraperGUI:
             self.log(f"      Mode: {'Headless' if self.headless_mode.get() else 'Browser Visible'}")
             self.log(f"      Timeout: {self.wait_time.get()} detik")
             self.log(f"      CAPTCHA Timeout: {self.captcha_wait_time.get()} menit")
+            self.log(f"      Worker paralel: {self.num_workers.get()}")
+            self.log(f"      Fetch: {'HTTP (fallback Selenium)' if self.http_mode.get() else 'Selenium'}")
+            self.log(f"      Cache halaman: {'Aktif' if self.use_cache.get() else 'Nonaktif'}")
+            self.log(f"      Incremental: {'Ya' if self.incremental_mode.get() else 'Tidak'}")
+            self.log(f"      Browser ringan: {'Ya' if self.lean_browser.get() else 'Tidak'}")
+            if self.keep_browser.get():
+                warm = "Chrome sudah siap" if self.driver_manager.has_driver() else "Chrome baru"
+                self.log(f"      Pertahankan browser: Ya ({warm})")
+            else:
+                # Chrome yang tersimpan dari run sebelumnya tidak dipakai lagi
+                self.driver_manager.close()
             
             # Prepare year list if valid range is selected
             year_start = self.year_from.get()
@@ -1350,12 +1489,25 @@ class GoogleScholarScraperGUI:
             scraper = GoogleScholarScraper(
                 headless=self.headless_mode.get(),
                 wait_time=self.wait_time.get(),
-                captcha_wait_minutes=self.captcha_wait_time.get()
+                captcha_wait_minutes=self.captcha_wait_time.get(),
+                num_workers=self.num_workers.get(),
+                fetch_mode='http' if self.http_mode.get() else 'selenium',
+                cache_dir="cache/pages" if self.use_cache.get() else None,
+                profile_cache_path="cache/profile_ids.json" if self.use_cache.get() else None,
+                profile_overrides_path="input/profile_overrides.csv",
+                snapshot_dir="cache/snapshots",
+                incremental=self.incremental_mode.get(),
+                lean_driver=self.lean_browser.get(),
+                user_data_dir="cache/chrome_profile" if self.lean_browser.get() else None,
+                driver_manager=self.driver_manager if self.keep_browser.get() else None,
+                result_store_path="output/results.db" if self.use_result_store.get() else None
             )
             
+            self.active_scraper = scraper
             df_results = scraper.run_scraper(dosen_names_clean, years=years_list)
             
             if not self.is_running:
+                self.log(f"💾 Progres tersimpan. Lanjutkan dengan: python main.py --resume {scraper.logger.session_id}")
                 return
             
             # Step 4: Results
@@ -1380,18 +1532,27 @@ class GoogleScholarScraperGUI:
             base_filename = f"publikasi_{input_filename}_{timestamp}"
             
             output_format = self.output_format.get()
+            if scraper.result_store:
+                self.log("      🗄️  Result store diperbarui: output/results.db")
             
             if output_format in ["csv", "both"]:
                 csv_path = save_to_csv(df_results, os.path.join(output_dir, f"{base_filename}.csv"))
                 self.log(f"      ✅ CSV: {os.path.basename(csv_path)}")
             
+            if output_format == "parquet":
+                try:
+                    parquet_path = save_to_parquet(df_results, os.path.join(output_dir, f"{base_filename}.parquet"))
+                    self.log(f"      ✅ Parquet: {os.path.basename(parquet_path)}")
+                except ImportError as e:
+                    self.log(f"      ⚠️ {e}")
+            
             if output_format in ["excel", "both"]:
                 excel_path = save_to_excel(df_results, os.path.join(output_dir, f"{base_filename}.xlsx"))
                 self.log(f"      ✅ Excel: {os.path.basename(excel_path)}")
                 # Save last scraped file for upload tab
                 self.last_scraped_file = excel_path
-            elif output_format == "csv":
-                # If only CSV, still try to create Excel for upload
+            elif output_format in ["csv", "parquet"]:
+                # If only CSV/Parquet, still try to create Excel for upload
                 excel_path = save_to_excel(df_results, os.path.join(output_dir, f"{base_filename}.xlsx"))
                 self.last_scraped_file = excel_path
             
@@ -1423,6 +1584,7 @@ class GoogleScholarScraperGUI:
             self.start_btn.config(state=tk.NORMAL)
             self.stop_btn.config(state=tk.DISABLED)
             self.is_running = False
+            self.active_scraper = None
 
 
 def run_gui():
@@ -0,0 +1,137 @@
+"""
+Test script untuk pipeline asyncio.
+Menjalankan AsyncScrapePipeline dengan scraper._load_html palsu (tanpa jaringan/Chrome) dan
+menguji urutan hasil, backpressure antrian, batas fetch per host, serta dosen yang gagal.
+"""
+
+import asyncio
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from src.core_logic import async_pipeline
+from src.core_logic.async_pipeline import AsyncScrapePipeline
+from src.core_logic.http_fetcher import CaptchaDetectedError
+from src.core_logic.scraper import GoogleScholarScraper
+
+
+# Jumlah publikasi per dosen; dosen di awal daftar paling lambat agar selesai paling akhir
+PUBLICATIONS = {"Andi": 4, "Budi": 3, "Citra": 2, "Dewi": 3, "Captcha": 3, "Gagal": 1}
+DELAY = {"Andi": 0.06, "Budi": 0.04, "Citra": 0.02}
+
+DETAIL_HTML = """
+<html><body><div id="gsc_oci_table">
+  <div class="gs_scl"><div class="gsc_oci_field">Jurnal</div><div class="gsc_oci_value">Jurnal {name}</div></div>
+</div></body></html>
+"""
+
+
+def _profile_html(name: str) -> str:
+    rows = "".join(
+        f'<tr class="gsc_a_tr"><td class="gsc_a_t">'
+        f'<a href="/citations?view_op=view_citation&amp;user={name}&amp;citation_for_view={name}:p{i}" '
+        f'class="gsc_a_at">{name} {i}</a><div class="gs_gray">{name}</div><div class="gs_gray">Venue</div></td>'
+        f'<td class="gsc_a_c"><a class="gsc_a_ac">{i}</a></td>'
+        f'<td class="gsc_a_y"><span class="gsc_a_h">2020</span></td></tr>'
+        for i in range(PUBLICATIONS[name])
+    )
+    return f'<html><body><table id="gsc_a_t"><tbody id="gsc_a_b">{rows}</tbody></table></body></html>'
+
+
+class FakeScholar:
+    """Pengganti scraper._load_html: halaman sintetis per URL, mencatat fetch yang berjalan bersamaan."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def load_html(self, url: str, refresh: bool = False):
+        query = parse_qs(urlsplit(url).query)
+        name = (query.get('q') or query.get('user'))[0]
+
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(DELAY.get(name, 0.01))
+            if 'q' in query:
+                if name == "Gagal":
+                    return None
+                return f'<h4 class="gs_rt2"><a href="/citations?user={name}&amp;hl=id">{name}</a></h4>'
+            if 'citation_for_view' not in query:
+                return _profile_html(name)
+            if name == "Captcha":
+                raise CaptchaDetectedError(f"CAPTCHA not solved within timeout: {url}")
+            if query['citation_for_view'][0] == "Dewi:p1":
+                return None
+            return DETAIL_HTML.format(name=name)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class RecordingQueue(asyncio.Queue):
+    """asyncio.Queue yang mencatat put() yang harus menunggu karena antrian penuh."""
+
+    instances = []
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self.blocked_puts = 0
+        self.max_size = 0
+        RecordingQueue.instances.append(self)
+
+    async def put(self, item):
+        if self.full():
+            self.blocked_puts += 1
+        await super().put(item)
+        self.max_size = max(self.max_size, self.qsize())
+
+
+def test_async_pipeline():
+    """Hasil urut sesuai input, antrian terbatas menahan stage hulu, fetch per host dibatasi,
+    dan dosen yang gagal (CAPTCHA, pencarian gagal) tidak membuat join menggantung."""
+    scraper = GoogleScholarScraper(fetch_mode='http', rate_per_minute=None)
+    scraper.years_to_collect = None
+    fake = FakeScholar()
+    scraper._load_html = fake.load_html
+
+    pipeline = AsyncScrapePipeline(scraper, concurrency=6, per_host_limit=2, queue_size=1)
+    names = list(PUBLICATIONS)
+    outcome = {}
+
+    queue_class = async_pipeline.asyncio.Queue
+    async_pipeline.asyncio.Queue = RecordingQueue
+    RecordingQueue.instances = []
+    try:
+        runner = threading.Thread(target=lambda: outcome.update(result=pipeline.run(names)), daemon=True)
+        runner.start()
+        runner.join(timeout=20)
+    finally:
+        async_pipeline.asyncio.Queue = queue_class
+
+    assert not runner.is_alive(), "pipeline menggantung"
+    publications = outcome['result']
+
+    assert [pub['Nama Dosen'] for pub in publications] == (
+        ["Andi"] * 4 + ["Budi"] * 3 + ["Citra"] * 2 + ["Dewi"] * 3)
+    assert [pub['Judul'] for pub in publications[:4]] == [f"Andi {i}" for i in range(4)]
+    assert sorted(pipeline.results) == [0, 1, 2, 3]
+
+    # Detail yang gagal diambil tetap menghasilkan baris (tanpa data detail)
+    dewi = [pub for pub in publications if pub['Nama Dosen'] == "Dewi"]
+    assert dewi[0]['Journal_Name'] == "Jurnal Dewi"
+    assert dewi[1]['Journal_Name'] != "Jurnal Dewi"
+
+    assert fake.max_in_flight == 2
+
+    bounded = [q for q in RecordingQueue.instances if q.maxsize]
+    assert len(bounded) == 3
+    assert all(q.max_size <= 1 for q in bounded)
+    assert sum(q.blocked_puts for q in bounded) > 0
+
+
+if __name__ == "__main__":
+    test_async_pipeline()
+    print("\nTest completed!")
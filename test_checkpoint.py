@@ -0,0 +1,113 @@
+"""
+Test script untuk checkpoint journal.
+Menguji pembacaan journal untuk resume: baris terpotong, start ulang, tipe key tahun, dan
+daftar dosen session.
+"""
+
+import json
+import os
+import tempfile
+
+from src.core_logic.checkpoint import CheckpointJournal, journal_path_for
+
+
+def test_load_completed():
+    """Hanya dosen dengan event done yang dikembalikan, dengan batch sejak start terakhir."""
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = CheckpointJournal(os.path.join(tmp, "session", "journal.jsonl"))
+
+        journal.start_dosen("Andi")
+        journal.record_batch("Andi", [{'Judul': "A1", 'Cited_By_Per_Year': {2022: 3, 2023: 5}}])
+        journal.record_batch("Andi", [{'Judul': "A2", 'Cited_By_Per_Year': {}}])
+        journal.mark_done("Andi", 2)
+
+        # Budi terhenti di tengah lalu diulang: batch dari percobaan pertama dibuang
+        journal.start_dosen("Budi")
+        journal.record_batch("Budi", [{'Judul': "B-lama"}])
+        journal.start_dosen("Budi")
+        journal.record_batch("Budi", [{'Judul': "B1"}])
+        journal.mark_done("Budi", 1)
+
+        # Dosen tanpa publikasi: done tanpa batch
+        journal.start_dosen("Citra")
+        journal.mark_done("Citra", 0)
+
+        # Dewi belum selesai saat crash
+        journal.start_dosen("Dewi")
+        journal.record_batch("Dewi", [{'Judul': "D1"}])
+
+        completed = journal.load_completed()
+
+    assert sorted(completed) == ["Andi", "Budi", "Citra"]
+    assert [pub['Judul'] for pub in completed["Andi"]] == ["A1", "A2"]
+    assert completed["Andi"][0]['Cited_By_Per_Year'] == {2022: 3, 2023: 5}
+    assert [pub['Judul'] for pub in completed["Budi"]] == ["B1"]
+    assert completed["Citra"] == []
+
+
+def test_load_completed_restart_after_done():
+    """Start baru setelah done (dosen diulang) membatalkan hasil sebelumnya sampai done berikutnya."""
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = CheckpointJournal(os.path.join(tmp, "journal.jsonl"))
+        journal.start_dosen("Andi")
+        journal.record_batch("Andi", [{'Judul': "A1"}])
+        journal.mark_done("Andi", 1)
+        journal.start_dosen("Andi")
+        journal.record_batch("Andi", [{'Judul': "A1-baru"}])
+
+        assert journal.load_completed() == {}
+
+
+def test_load_completed_truncated_line():
+    """Baris terakhir yang terpotong saat crash diabaikan tanpa membuang event sebelumnya."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal.jsonl")
+        journal = CheckpointJournal(path)
+        journal.start_dosen("Andi")
+        journal.record_batch("Andi", [{'Judul': "A1"}])
+        journal.mark_done("Andi", 1)
+        journal.start_dosen("Budi")
+
+        partial = json.dumps({'event': 'batch', 'nama': "Budi", 'publications': [{'Judul': "B1"}]})
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(partial[:len(partial) // 2])
+
+        completed = journal.load_completed()
+
+    assert list(completed) == ["Andi"]
+    assert completed["Andi"][0]['Judul'] == "A1"
+
+
+def test_load_completed_missing_file():
+    """Journal yang belum ada berarti belum ada dosen yang selesai."""
+    with tempfile.TemporaryDirectory() as tmp:
+        assert CheckpointJournal(os.path.join(tmp, "journal.jsonl")).load_completed() == {}
+
+
+def test_load_session():
+    """Daftar dosen dan tahun session dibaca dari journal; journal lama tanpa event session -> None."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = journal_path_for("20250101_120000", log_dir=tmp)
+        assert path == os.path.join(tmp, "session_20250101_120000", "journal_20250101_120000.jsonl")
+        
+        journal = CheckpointJournal(path)
+        assert journal.load_session() is None
+        journal.start_dosen("Andi")
+        assert journal.load_session() is None
+        
+        journal.start_session(["Andi", "Budi"], [2024, 2023])
+        journal.mark_done("Andi", 0)
+        assert journal.load_session() == {'dosen': ["Andi", "Budi"], 'years': [2023, 2024]}
+        assert list(journal.load_completed()) == ["Andi"]
+        
+        journal.start_session(["Citra"])
+        assert CheckpointJournal(path).load_session() == {'dosen': ["Citra"], 'years': None}
+
+
+if __name__ == "__main__":
+    test_load_completed()
+    test_load_completed_restart_after_done()
+    test_load_completed_truncated_line()
+    test_load_completed_missing_file()
+    test_load_session()
+    print("\nTest completed!")
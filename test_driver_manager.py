@@ -0,0 +1,62 @@
+"""
+Test script untuk DriverManager.
+Menguji pemakaian ulang driver, health check, dan daur ulang tanpa membuka Chrome.
+"""
+
+from src.core_logic.driver_manager import DriverManager
+
+
+class FakeDriver:
+    """Pengganti WebDriver: cukup untuk health check dan quit."""
+
+    def __init__(self):
+        self.alive = True
+        self.window_handles = ['main']
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def quit(self):
+        self.alive = False
+
+
+def test_reuse_and_health_check():
+    """Driver sehat dengan konfigurasi sama dipakai ulang; driver mati atau konfigurasi beda dibuat ulang."""
+    manager = DriverManager(max_pages=0, max_memory_mb=0)
+
+    first = manager.get_driver(FakeDriver, config=('headless', True))
+    assert manager.get_driver(FakeDriver, config=('headless', True)) is first
+    assert manager.starts == 1
+
+    first.alive = False  # Chrome crash / ditutup user
+    second = manager.get_driver(FakeDriver, config=('headless', True))
+    assert second is not first
+
+    third = manager.get_driver(FakeDriver, config=('visible', True))
+    assert third is not second and not second.alive
+    assert manager.recycles == 2
+
+    manager.close()
+    assert not third.alive and not manager.has_driver()
+
+
+def test_recycle_after_max_pages():
+    """Driver dibuat ulang setelah max_pages halaman."""
+    manager = DriverManager(max_pages=3, max_memory_mb=0)
+
+    first = manager.get_driver(FakeDriver)
+    manager.record_pages(2)
+    assert manager.get_driver(FakeDriver) is first
+
+    manager.record_pages(1)
+    second = manager.get_driver(FakeDriver)
+    assert second is not first and not first.alive
+    assert manager.pages == 0
+
+
+if __name__ == "__main__":
+    test_reuse_and_health_check()
+    test_recycle_after_max_pages()
+    print("\nTest completed!")
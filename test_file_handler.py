@@ -0,0 +1,295 @@
+"""
+Test script untuk file handler.
+Menguji lebar kolom Excel, isi file XLSX yang ditulis secara streaming, tabel ringkasan DOCX,
+serta protokol upload per chunk dan delta sync ke Apps Script (dengan web app palsu).
+"""
+
+import base64
+import gzip
+import json
+import os
+import tempfile
+
+import openpyxl
+import pandas as pd
+import requests
+from docx import Document
+
+from src.core_logic import file_handler
+from src.core_logic.sinks import publications_to_dataframe
+
+
+PUBLICATIONS = [
+    {'Judul': "Judul yang cukup panjang", 'Tahun': "2022", 'Sitasi': "5",
+     'Cited_By_Per_Year': {2023: 2}, 'Nama Dosen': "Budi"},
+    {'Judul': "B", 'Tahun': None, 'Sitasi': float('nan'), 'Cited_By_Per_Year': {}, 'Nama Dosen': "Budi"},
+]
+
+
+def test_excel_column_widths():
+    """Lebar = teks terpanjang (header atau nilai) + 2, maksimal 50; nilai kosong diabaikan."""
+    df = publications_to_dataframe(PUBLICATIONS)
+    df.loc[0, 'Nama Dosen'] = "x" * 80
+    widths = dict(zip(df.columns, file_handler._excel_column_widths(df)))
+    print(widths)
+    assert widths['Judul'] == len("Judul yang cukup panjang") + 2
+    assert widths['Tahun'] == len("Tahun") + 2
+    assert widths['Cited_By_Per_Year'] == len("Cited_By_Per_Year") + 2
+    assert widths['Nama Dosen'] == 50
+
+
+def test_save_to_excel_values():
+    """Isi XLSX sama untuk jalur xlsxwriter dan openpyxl: NaN/None kosong, dict menjadi teks."""
+    df = publications_to_dataframe(PUBLICATIONS)
+    writer = file_handler.xlsxwriter
+    try:
+        for module in {writer, None}:
+            file_handler.xlsxwriter = module
+            with tempfile.TemporaryDirectory() as tmp:
+                path = file_handler.save_to_excel(df, os.path.join(tmp, "hasil"))
+                worksheet = openpyxl.load_workbook(path).active
+                rows = list(worksheet.iter_rows(values_only=True))
+            print(rows)
+            assert worksheet.title == 'Publications'
+            assert rows[0] == ('Judul', 'Tahun', 'Sitasi', 'Cited_By_Per_Year', 'Nama Dosen', '2023_cited_by')
+            assert rows[1] == ("Judul yang cukup panjang", "2022", "5", "{2023: 2}", "Budi", 2)
+            assert rows[2] == ("B", None, None, "{}", "Budi", 0)
+    finally:
+        file_handler.xlsxwriter = writer
+
+
+def _table_rows(path: str) -> list:
+    return [[cell.text for cell in row.cells] for table in Document(path).tables for row in table.rows]
+
+
+def test_summary_docx_tables():
+    """Tabel per dosen berisi nomor urut, judul, venue, tahun; teks khusus tetap utuh."""
+    df = pd.DataFrame({
+        'Judul': ["Data & <Model>", "Baris\nbaru", "Satu"],
+        'Venue': ["J1", "J2", "J3"],
+        'Tahun': ["2020", "", "2021"],
+        'Nama Dosen': ["Budi", "Budi", "Ani"],
+    })
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = _table_rows(file_handler.generate_summary_docx(df, os.path.join(tmp, "ringkasan")))
+    print(rows)
+    header = ['No', 'Judul', 'Venue', 'Tahun']
+    assert rows == [header, ['1', "Satu", "J3", "2021"],
+                    header, ['1', "Data & <Model>", "J1", "2020"], ['2', "Baris\nbaru", "J2", ""]]
+
+
+def test_summary_docx_parts():
+    """DOCX terpisah: dosen dibagi per jumlah atau per kolom kelompok, dibuat di beberapa proses."""
+    df = pd.DataFrame({
+        'Judul': [f"Judul {i}" for i in range(5)],
+        'Tahun': ["2020"] * 5,
+        'Nama Dosen': ["A", "A", "B", "C", "D"],
+        'Fakultas': ["Teknik", "Teknik", "Sains", "Teknik", "Sains"],
+    })
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = file_handler.generate_summary_docx_parts(df, tmp, lecturers_per_part=3, max_workers=2)
+        assert [os.path.basename(path) for path in paths] == ["summary_part001.docx", "summary_part002.docx"]
+        assert len(_table_rows(paths[0])) == 3 + 4 and len(_table_rows(paths[1])) == 2
+
+        paths = file_handler.generate_summary_docx_parts(df, tmp, group_column='Fakultas', max_workers=1)
+        assert [os.path.basename(path) for path in paths] == ["summary_Sains.docx", "summary_Teknik.docx"]
+
+
+class FakeWebApp:
+    """Web app palsu yang mengikuti protokol init/append/finalize/delta apps-script-web-app.gs."""
+
+    def __init__(self, fail_on_chunk=None):
+        self.sheet = {}
+        self.uploads = {}
+        self.requests = []
+        self.fail_on_chunk = fail_on_chunk
+
+    def post(self, url, json=None, headers=None, timeout=None):
+        self.requests.append(json)
+        if json['action'] == 'append' and json['chunkIndex'] == self.fail_on_chunk:
+            raise requests.exceptions.ConnectionError("koneksi terputus")
+
+        if json['action'] == 'delta':
+            return self._delta(json)
+
+        state = self.uploads.get(json['uploadId'])
+        if json['action'] == 'init':
+            if state:
+                return FakeResponse({'status': "success", 'nextChunk': state['nextChunk']})
+            self.sheet = {1: json['header']}
+            self.uploads[json['uploadId']] = {'nextChunk': 0}
+            return FakeResponse({'status': "success", 'nextChunk': 0})
+        if json['action'] == 'append':
+            rows = _decode(json['payload'])
+            for i, row in enumerate(rows):
+                self.sheet[2 + json['offset'] + i] = row
+            state['nextChunk'] = max(state['nextChunk'], json['chunkIndex'] + 1)
+            return FakeResponse({'status': "success", 'nextChunk': state['nextChunk']})
+        del self.uploads[json['uploadId']]
+        return FakeResponse({'status': "success", 'rowsWritten': json['totalRows'] + 1})
+
+    def _delta(self, request):
+        rows = [self.sheet[row] for row in sorted(self.sheet)]
+        if len(rows) != request['expectedRows'] or rows[0] != request['header']:
+            return FakeResponse({'status': "conflict", 'message': "Sheet tidak cocok"})
+        delta = _decode(request['payload'])
+        for start, count, values in delta['updates']:
+            rows[start - 1:start - 1 + count] = values
+        for start, count in delta['deletes']:
+            del rows[start - 1:start - 1 + count]
+        rows.extend(delta['inserts'])
+        self.sheet = {i + 1: row for i, row in enumerate(rows)}
+        return FakeResponse({'status': "success", 'rowsWritten': len(rows)})
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+def _decode(payload: str) -> list:
+    return json.loads(gzip.decompress(base64.b64decode(payload)).decode('utf-8'))
+
+
+def test_chunked_upload_resume():
+    """Upload dikirim per chunk gzip+base64; setelah gagal, upload ulang melanjutkan dari chunk terakhir."""
+    df = pd.DataFrame({'Judul': [f"Judul {i}" for i in range(7)], 'Sitasi': [i if i % 3 else None for i in range(7)]})
+    post, sleep = requests.post, file_handler.time.sleep
+    file_handler.time.sleep = lambda seconds: None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = file_handler.save_to_excel(df, os.path.join(tmp, "hasil"))
+            url = "https://docs.google.com/spreadsheets/d/SHEET123/edit"
+            web_app = FakeWebApp(fail_on_chunk=2)
+            requests.post = web_app.post
+            messages = []
+
+            try:
+                file_handler.transfer_data_to_sheets(path, url, "Publikasi", "https://fake", messages.append,
+                                                     chunk_rows=3, manifest_dir=os.path.join(tmp, "manifest"))
+                assert False, "upload seharusnya gagal di chunk 3"
+            except Exception as e:
+                assert "chunk 3" in str(e)
+            assert sorted(web_app.sheet) == [1, 2, 3, 4, 5, 6, 7]
+
+            web_app.fail_on_chunk = None
+            web_app.requests.clear()
+            result = file_handler.transfer_data_to_sheets(path, url, "Publikasi", "https://fake",
+                                                          messages.append, chunk_rows=3,
+                                                          manifest_dir=os.path.join(tmp, "manifest"))
+    finally:
+        requests.post, file_handler.time.sleep = post, sleep
+
+    print("\n".join(messages))
+    assert [(r['action'], r.get('chunkIndex')) for r in web_app.requests] == [
+        ('init', None), ('append', 2), ('finalize', None)]
+    assert result['rowsWritten'] == 8
+    assert [web_app.sheet[row] for row in sorted(web_app.sheet)] == (
+        [['Judul', 'Sitasi']] + [[f"Judul {i}", "" if i % 3 == 0 else f"{float(i)}"] for i in range(7)])
+    assert any("Chunk 3/3: 7/7 baris (100%)" in message for message in messages)
+
+
+def _publications(citations, titles):
+    return pd.DataFrame({
+        'Nama Dosen': ["Budi"] * len(titles),
+        'Judul': titles,
+        'Sitasi': citations,
+        'Link': [f"https://scholar.google.com/citations?view_op=view_citation&citation_for_view=abc:{t}"
+                 for t in titles],
+    })
+
+
+def test_delta_upload():
+    """Upload kedua hanya mengirim baris yang berubah, hilang, atau baru; isi sheet sama dengan upload penuh."""
+    post = requests.post
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest_dir = os.path.join(tmp, "manifest")
+            url = "https://docs.google.com/spreadsheets/d/SHEET123/edit"
+            web_app = FakeWebApp()
+            requests.post = web_app.post
+
+            titles = [f"P{i}" for i in range(6)]
+            first = file_handler.save_to_excel(_publications([str(i) for i in range(6)], titles), os.path.join(tmp, "a"))
+            file_handler.transfer_data_to_sheets(first, url, "Publikasi", "https://fake", None,
+                                                 delta=True, manifest_dir=manifest_dir)
+            assert [r['action'] for r in web_app.requests] == ['init', 'append', 'finalize']
+
+            # P1 dan P4 berubah sitasi, P2 hilang, P6 baru
+            titles = ["P0", "P1", "P3", "P4", "P5", "P6"]
+            new_df = _publications(["0", "10", "3", "40", "5", "6"], titles)
+            second = file_handler.save_to_excel(new_df, os.path.join(tmp, "b"))
+            web_app.requests.clear()
+            result = file_handler.transfer_data_to_sheets(second, url, "Publikasi", "https://fake", None,
+                                                          delta=True, manifest_dir=manifest_dir)
+            assert [r['action'] for r in web_app.requests] == ['delta']
+            delta = _decode(web_app.requests[0]['payload'])
+            assert [(start, count) for start, count, _ in delta['updates']] == [(3, 1), (6, 1)]
+            assert delta['deletes'] == [[4, 1]]
+            assert [row[1] for row in delta['inserts']] == ["P6"]
+            assert result['cellsWritten'] == 3 * 4
+
+            expected = [list(new_df.columns)] + new_df.values.tolist()
+            assert [web_app.sheet[row] for row in sorted(web_app.sheet)] == expected
+
+            # Tanpa perubahan: tidak ada request ke web app
+            web_app.requests.clear()
+            result = file_handler.transfer_data_to_sheets(second, url, "Publikasi", "https://fake", None,
+                                                          delta=True, manifest_dir=manifest_dir)
+            assert web_app.requests == [] and result['rowsWritten'] == 0
+    finally:
+        requests.post = post
+
+
+def test_delta_after_full_upload():
+    """Upload tanpa delta memperbarui manifest, sehingga delta berikutnya dihitung terhadap isi sheet sekarang."""
+    post = requests.post
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest_dir = os.path.join(tmp, "manifest")
+            url = "https://docs.google.com/spreadsheets/d/SHEET123/edit"
+            web_app = FakeWebApp()
+            requests.post = web_app.post
+
+            titles = [f"P{i}" for i in range(4)]
+            first = file_handler.save_to_excel(_publications(["1", "2", "3", "4"], titles), os.path.join(tmp, "a"))
+            file_handler.transfer_data_to_sheets(first, url, "Publikasi", "https://fake", None,
+                                                 delta=True, manifest_dir=manifest_dir)
+
+            # Upload biasa dengan jumlah baris sama tetapi urutan terbalik
+            titles.reverse()
+            second = file_handler.save_to_excel(_publications(["4", "3", "2", "1"], titles), os.path.join(tmp, "b"))
+            file_handler.transfer_data_to_sheets(second, url, "Publikasi", "https://fake", None,
+                                                 delta=False, manifest_dir=manifest_dir)
+
+            # Hanya P3 (baris pertama di sheet) yang berubah
+            third_df = _publications(["40", "3", "2", "1"], titles)
+            third = file_handler.save_to_excel(third_df, os.path.join(tmp, "c"))
+            web_app.requests.clear()
+            file_handler.transfer_data_to_sheets(third, url, "Publikasi", "https://fake", None,
+                                                 delta=True, manifest_dir=manifest_dir)
+    finally:
+        requests.post = post
+
+    assert [r['action'] for r in web_app.requests] == ['delta']
+    delta = _decode(web_app.requests[0]['payload'])
+    assert [(start, count) for start, count, _ in delta['updates']] == [(2, 1)]
+    assert [web_app.sheet[row] for row in sorted(web_app.sheet)] == (
+        [list(third_df.columns)] + third_df.values.tolist())
+
+
+if __name__ == "__main__":
+    test_excel_column_widths()
+    test_save_to_excel_values()
+    test_summary_docx_tables()
+    test_summary_docx_parts()
+    test_chunked_upload_resume()
+    test_delta_upload()
+    test_delta_after_full_upload()
+    print("\nTest completed!")
@@ -0,0 +1,116 @@
+"""
+Test script untuk JobQueue.
+Menguji klaim tugas, lease yang habis (retry), batas percobaan, dan beberapa proses worker
+yang mengambil tugas dari satu file SQLite yang sama.
+"""
+
+import multiprocessing
+import os
+import tempfile
+
+from src.core_logic.job_queue import JobQueue
+
+
+class FakeClock:
+    """Jam palsu untuk mensimulasikan lease yang habis."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_claim_complete_results():
+    """Tugas diklaim sesuai urutan input, hasil dikembalikan urut dengan key tahun int."""
+    with tempfile.TemporaryDirectory() as tmp:
+        job_queue = JobQueue(os.path.join(tmp, "jobs.db"))
+        job_id = job_queue.create_job(["Budi", "Ani", "Budi", "Citra"], job_id="job1")
+        assert job_queue.create_job(["Lain"], job_id="job1") == "job1"  # Job yang ada tidak diubah
+        assert job_queue.progress(job_id)['total'] == 3
+
+        first = job_queue.claim(job_id, "w1")
+        second = job_queue.claim(job_id, "w2")
+        assert (first['nama'], second['nama']) == ("Budi", "Ani")
+
+        pub = {'Nama Dosen': "Ani", 'Judul': "A", 'Cited_By_Per_Year': {2024: 3}}
+        assert job_queue.complete(job_id, "Ani", "w2", [pub])
+        assert not job_queue.complete(job_id, "Budi", "w2", [])  # Bukan pemilik lease
+        assert job_queue.complete(job_id, "Budi", "w1", [{'Nama Dosen': "Budi", 'Judul': "B"}])
+        assert not job_queue.is_finished(job_id)
+
+        third = job_queue.claim(job_id, "w1")
+        assert job_queue.fail(job_id, third['nama'], "w1", "PROFILE_NOT_FOUND: -", retry=False) == 'failed'
+        assert job_queue.claim(job_id, "w1") is None
+        assert job_queue.is_finished(job_id)
+
+        results = job_queue.results(job_id)
+        print(f"Results: {results}")
+        assert [pub['Judul'] for pub in results] == ["B", "A"]
+        assert results[1]['Cited_By_Per_Year'] == {2024: 3}
+        assert job_queue.failures(job_id)[0]['nama'] == "Citra"
+
+
+def test_lease_expiry_and_retry():
+    """Lease yang habis dikembalikan ke antrian; setelah max_attempts tugas ditandai gagal."""
+    with tempfile.TemporaryDirectory() as tmp:
+        clock = FakeClock()
+        job_queue = JobQueue(os.path.join(tmp, "jobs.db"), lease_seconds=60, max_attempts=2, clock=clock)
+        job_id = job_queue.create_job(["Budi"])
+
+        assert job_queue.claim(job_id, "w1")['attempts'] == 1
+        clock.now += 45
+        assert job_queue.heartbeat(job_id, "Budi", "w1")  # Lease diperpanjang sampai +105
+        clock.now += 45
+        assert job_queue.claim(job_id, "w2") is None
+
+        clock.now += 61  # w1 berhenti mengirim heartbeat
+        retry = job_queue.claim(job_id, "w2")
+        assert retry['attempts'] == 2
+        assert not job_queue.heartbeat(job_id, "Budi", "w1")
+        assert not job_queue.complete(job_id, "Budi", "w1", [])
+
+        clock.now += 61
+        progress = job_queue.progress(job_id)
+        print(f"Progress: {progress}")
+        assert progress['failed'] == 1 and job_queue.is_finished(job_id)
+        assert "Lease habis" in job_queue.failures(job_id)[0]['error']
+
+
+def _worker_process(db_path: str, job_id: str, worker_id: str):
+    """Worker sederhana: klaim dan selesaikan tugas sampai antrian habis."""
+    job_queue = JobQueue(db_path)
+    while True:
+        task = job_queue.claim(job_id, worker_id)
+        if task is None:
+            return
+        job_queue.complete(job_id, task['nama'], worker_id,
+                           [{'Nama Dosen': task['nama'], 'Worker': worker_id}])
+
+
+def test_multiple_worker_processes():
+    """Beberapa proses berbagi satu queue: setiap dosen dikerjakan tepat satu kali."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "jobs.db")
+        names = [f"Dosen {i}" for i in range(60)]
+        job_id = JobQueue(db_path).create_job(names)
+
+        context = multiprocessing.get_context('spawn')
+        processes = [context.Process(target=_worker_process, args=(db_path, job_id, f"w{i}"))
+                     for i in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        results = JobQueue(db_path).results(job_id)
+        print(f"Workers: {sorted({pub['Worker'] for pub in results})}")
+        assert [pub['Nama Dosen'] for pub in results] == names
+
+
+if __name__ == "__main__":
+    test_claim_complete_results()
+    test_lease_expiry_and_retry()
+    test_multiple_worker_processes()
+    print("\nTest completed!")
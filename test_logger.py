@@ -3,7 +3,9 @@ Test script untuk ScraperLogger.
 Menguji fungsi logging tanpa melakukan scraping sesungguhnya.
 """
 
-from src.core_logic.logger import ScraperLogger
+from src.core_logic.logger import ScraperLogger, get_all_sessions, latest_log_file
+import os
+import tempfile
 import time
 
 def test_logger():
@@ -50,8 +52,50 @@ def test_logger():
     
     return summary
 
+def test_resume_log_files():
+    """Run lanjutan menulis file _resume<N> baru; summary terbaru yang dibaca."""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = ScraperLogger(log_dir=tmp, session_id="run1")
+        first.start_session(["Andi", "Budi"])
+        first.log_success("Andi", 3)
+        first.log_failure("Budi", "Timeout", "TIMEOUT")
+        first.end_session()
+        
+        for run_number in (1, 2):
+            resumed = ScraperLogger(log_dir=tmp, session_id="run1", resume=True)
+            assert resumed.file_id == f"run1_resume{run_number}"
+            assert resumed.log_dir == first.log_dir
+            resumed.start_session(["Andi", "Budi"])
+            resumed.log_success("Andi", 3, "Dilanjutkan dari journal")
+            resumed.log_success("Budi", run_number)
+            resumed.end_session()
+        
+        files = sorted(os.listdir(first.log_dir))
+        assert "detailed_log_run1.csv" in files and "failed_names_run1.txt" in files
+        assert "detailed_log_run1_resume1.csv" in files and "detailed_log_run1_resume2.csv" in files
+        assert latest_log_file(first.log_dir, "summary_", ".json").endswith("summary_run1_resume2.json")
+        
+        sessions = get_all_sessions(tmp)
+        assert len(sessions) == 1
+        assert sessions[0]['statistics']['success_count'] == 2
+
+def test_register_dosen():
+    """Dosen yang didaftarkan setelah start_session ikut dihitung, tanpa duplikat."""
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = ScraperLogger(log_dir=tmp, session_id="job1_w1")
+        logger.start_session([])
+        logger.register_dosen("Andi")
+        logger.register_dosen("Budi")
+        logger.register_dosen("Andi")  # Tugas diambil ulang setelah lease habis
+        logger.log_success("Andi", 2)
+        
+        assert logger.dosen_list == ["Andi", "Budi"]
+        assert logger.get_summary()['pending'] == 1
+
 if __name__ == "__main__":
     summary = test_logger()
+    test_resume_log_files()
+    test_register_dosen()
     print(f"\nFinal Summary:")
     print(f"  Session ID: {summary['session_id']}")
     print(f"  Log Folder: {summary['log_dir']}")
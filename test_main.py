@@ -0,0 +1,100 @@
+"""
+Test script untuk mode sharded di main.py.
+Menguji penggabungan hasil shard, pembagian rate limit antar shard, dan sumber file output
+(hasil run vs result store) tanpa membuka Chrome.
+"""
+
+import os
+import tempfile
+
+import pandas as pd
+
+import main
+
+
+def test_merge_shard_results():
+    """Hasil shard diurutkan sesuai input; kolom tahun yang tidak ada di satu shard diisi 0."""
+    shard_0 = pd.DataFrame({
+        'Nama Dosen': ["Citra", "Andi", "Andi"],
+        'Judul': ["C1", "A1", "A2"],
+        '2023_cited_by': [1, 2, 3],
+    })
+    shard_1 = pd.DataFrame({
+        'Nama Dosen': ["Budi"],
+        'Judul': ["B1"],
+        '2021_cited_by': [5],
+        '2023_cited_by': [4],
+    })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i, df in enumerate([shard_0, shard_1, pd.DataFrame()]):
+            path = os.path.join(tmp, f"shard_{i}.pkl")
+            df.to_pickle(path)
+            paths.append(path)
+
+        merged = main.merge_shard_results(paths, ["Andi", "Budi", "Citra"])
+
+    assert list(merged.columns) == ['Nama Dosen', 'Judul', '2021_cited_by', '2023_cited_by']
+    assert merged['Judul'].tolist() == ["A1", "A2", "B1", "C1"]
+    assert merged['2021_cited_by'].tolist() == [0, 0, 5, 0]
+    assert merged['2021_cited_by'].dtype == int
+
+
+def test_merge_shard_results_empty():
+    """Tanpa baris di semua shard, hasil gabungan adalah DataFrame kosong."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "shard_0.pkl")
+        pd.DataFrame().to_pickle(path)
+        assert main.merge_shard_results([path], ["Andi"]).empty
+
+
+def test_shard_rate_limit_split():
+    """Setiap shard mendapat RATE_LIMIT_* dibagi jumlah shard (satu IP untuk semua proses)."""
+    captured = {}
+    scraper_class = main.GoogleScholarScraper
+    main.GoogleScholarScraper = lambda **kwargs: captured.update(kwargs)
+    try:
+        main.build_scraper(cache_only=False, incremental=False, rate_share=3)
+    finally:
+        main.GoogleScholarScraper = scraper_class
+
+    assert captured['rate_per_minute'] == main.RATE_LIMIT_PER_MINUTE / 3
+    assert captured['min_rate_per_minute'] == main.RATE_LIMIT_MIN / 3
+    assert captured['max_rate_per_minute'] == main.RATE_LIMIT_MAX / 3
+
+def test_save_results_uses_run_dataframe():
+    """File hasil run hanya berisi DataFrame run ini; data lama di result store hanya lewat ekspor."""
+    def pub(nama, pub_id, sitasi):
+        return {'Judul': f"Judul {pub_id}", 'Sitasi': sitasi, 'Nama Dosen': nama, 'Cited_By_Per_Year': {},
+                'Link': f"https://scholar.google.com/citations?view_op=view_citation&citation_for_view=U:{pub_id}"}
+
+    store_path = main.RESULT_STORE_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        main.RESULT_STORE_PATH = os.path.join(tmp, "results.db")
+        try:
+            store = main.ResultStore(main.RESULT_STORE_PATH)
+            store.upsert_lecturer("Andi", [pub("Andi", "a", "1")], session_id="lama")
+            store.upsert_lecturer("Budi", [pub("Budi", "b", "2")], session_id="lama")
+
+            # Run ini: Andi gagal, Budi berhasil dengan sitasi baru
+            df_run = main.publications_to_dataframe([pub("Budi", "b", "5")])
+            main.save_results(df_run, base_path=os.path.join(tmp, "run"), formats=('csv',))
+            main.save_results(None, ["Andi", "Budi"], base_path=os.path.join(tmp, "export"), formats=('csv',))
+
+            run_csv = pd.read_csv(os.path.join(tmp, "run.csv"))
+            export_csv = pd.read_csv(os.path.join(tmp, "export.csv"))
+        finally:
+            main.RESULT_STORE_PATH = store_path
+
+    assert run_csv['Nama Dosen'].tolist() == ["Budi"]
+    assert run_csv['Sitasi'].tolist() == [5]
+    assert export_csv['Nama Dosen'].tolist() == ["Andi", "Budi"]
+
+
+if __name__ == "__main__":
+    test_merge_shard_results()
+    test_merge_shard_results_empty()
+    test_shard_rate_limit_split()
+    test_save_results_uses_run_dataframe()
+    print("\nTest completed!")
@@ -0,0 +1,73 @@
+"""
+Test script untuk PageCache.
+Menguji normalisasi URL, TTL per jenis halaman, dan eviction LRU tanpa akses jaringan.
+"""
+
+import os
+import tempfile
+import time
+
+from src.core_logic.page_cache import PageCache, normalize_url, classify_url
+
+
+PROFILE_URL = "https://scholar.google.com/citations?user=ABC123&hl=id"
+DETAIL_URL = "https://scholar.google.com/citations?view_op=view_citation&hl=id&user=ABC123&citation_for_view=ABC123:x"
+
+
+def test_normalize_and_classify():
+    """URL ekuivalen menghasilkan key yang sama dan jenis halaman terdeteksi."""
+    assert normalize_url("HTTPS://Scholar.Google.com/citations?hl=id&user=ABC123#x") == \
+        normalize_url("https://scholar.google.com/citations?user=ABC123&hl=id")
+
+    assert classify_url("https://scholar.google.com/scholar?hl=id&q=budi") == 'search'
+    assert classify_url(PROFILE_URL) == 'profile'
+    assert classify_url(DETAIL_URL) == 'detail'
+
+
+def test_get_put_and_ttl():
+    """Entry kedaluwarsa tidak dikembalikan, kecuali pada mode replay (ignore_ttl)."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = PageCache(cache_dir, ttl={'profile': 60})
+        cache.put(PROFILE_URL, "<html>profil</html>")
+
+        assert cache.get("https://scholar.google.com/citations?hl=id&user=ABC123") == "<html>profil</html>"
+
+        cache.ttl['profile'] = -1
+        assert cache.get(PROFILE_URL) is None
+        assert cache.get(PROFILE_URL, ignore_ttl=True) == "<html>profil</html>"
+
+        stats = cache.get_stats()
+        print(f"Stats: {stats}")
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+        assert stats['entries'] == 1
+
+
+def test_lru_eviction():
+    """Halaman yang paling lama tidak diakses dihapus lebih dulu saat cache penuh."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = PageCache(cache_dir, max_size_mb=1)
+        # HTML acak agar ukuran file gzip mendekati ukuran aslinya (~256 KB)
+        pages = {f"{DETAIL_URL}{i}": os.urandom(256 * 1024).hex() for i in range(3)}
+
+        for i, (url, html) in enumerate(pages.items()):
+            cache.put(url, html)
+            # Pastikan mtime berbeda walaupun resolusi filesystem kasar
+            os.utime(cache._path_for(url), (time.time() - 100 + i, time.time() - 100 + i))
+
+        # Akses halaman pertama sehingga halaman kedua menjadi yang paling lama
+        urls = list(pages)
+        assert cache.get(urls[0]) is not None
+
+        cache.put(f"{DETAIL_URL}new", os.urandom(256 * 1024).hex())
+
+        assert cache.get(urls[0]) is not None
+        assert cache.get(urls[1]) is None
+        assert cache.get_stats()['size_mb'] <= 1
+
+
+if __name__ == "__main__":
+    test_normalize_and_classify()
+    test_get_put_and_ttl()
+    test_lru_eviction()
+    print("\nTest completed!")
@@ -0,0 +1,130 @@
+"""
+Test script untuk parser HTML.
+Memastikan LxmlParser menghasilkan output yang sama dengan SoupParser (implementasi referensi)
+untuk halaman profil, detail, dan pencarian Google Scholar.
+"""
+
+from src.core_logic.parsers import ScholarParser, SoupParser, LxmlParser, get_parser
+
+
+PROFILE_HTML = """
+<html><body>
+<table id="gsc_a_t"><tbody id="gsc_a_b">
+  <tr class="gsc_a_tr">
+    <td class="gsc_a_t">
+      <a href="/citations?view_op=view_citation&amp;hl=id&amp;user=ABC123&amp;citation_for_view=ABC123:u5HHmVD_uO8C" class="gsc_a_at">
+        Sistem Informasi   Akademik <b>Berbasis</b> Web
+      </a>
+      <div class="gs_gray">B Santoso, A Rahman</div>
+      <div class="gs_gray">Jurnal Teknik Informatika 12 (2), 10-20<span class="gs_oph">, 2019</span></div>
+    </td>
+    <td class="gsc_a_c"><a href="#" class="gsc_a_ac gs_ibl">1.234</a></td>
+    <td class="gsc_a_y"><span class="gsc_a_h gsc_a_hc gs_ibl">2019</span></td>
+  </tr>
+  <tr class="gsc_a_tr">
+    <td class="gsc_a_t">
+      <a href="/citations?view_op=view_citation&amp;hl=id&amp;user=ABC123&amp;citation_for_view=ABC123:d1gkVwhDpl0C" class="gsc_a_at">Analisis&nbsp;Data</a>
+      <div class="gs_gray">B Santoso</div>
+      <div class="gs_gray">Prosiding Seminar Nasional Teknologi ...</div>
+    </td>
+    <td class="gsc_a_c"><a href="#" class="gsc_a_ac gs_ibl"></a></td>
+    <td class="gsc_a_y"><span class="gsc_a_h gsc_a_hc gs_ibl"></span></td>
+  </tr>
+  <tr class="gsc_a_tr"><td class="gsc_a_e">Tidak ada artikel</td></tr>
+</tbody></table>
+<button type="button" id="gsc_bpf_more" class="gs_btnPD"><span>Tampilkan lainnya</span></button>
+</body></html>
+"""
+
+DETAIL_HTML = """
+<html><body>
+<div id="gsc_oci_table">
+  <div class="gs_scl"><div class="gsc_oci_field">Pengarang</div><div class="gsc_oci_value">Budi Santoso, Ahmad Rahman</div></div>
+  <div class="gs_scl"><div class="gsc_oci_field">Tanggal terbit</div><div class="gsc_oci_value">2019/7/1</div></div>
+  <div class="gs_scl"><div class="gsc_oci_field">Jurnal</div><div class="gsc_oci_value">Jurnal Teknik</div></div>
+  <div class="gs_scl"><div class="gsc_oci_field">Halaman</div><div class="gsc_oci_value">10-20</div></div>
+  <div class="gs_scl"><div class="gsc_oci_field">Deskripsi</div>
+    <div class="gsc_oci_value"><div class="gsh_small"><div class="gsh_csp">Penelitian ini <i>membahas</i> sistem.</div></div></div></div>
+  <div class="gs_scl"><div class="gsc_oci_field">Total kutipan</div><div class="gsc_oci_value">
+    <div style="margin-bottom:1em"><a href="#">Dirujuk 1.015 kali</a></div>
+    <div id="gsc_oci_graph_bars">
+      <span class="gsc_oci_g_t" style="left:10px">2021</span>
+      <span class="gsc_oci_g_t">2022</span>
+      <span class="gsc_oci_g_t">2023</span>
+      <a href="#" class="gsc_oci_g_a"><span class="gsc_oci_g_al">5</span></a>
+      <a href="#" class="gsc_oci_g_a"><span class="gsc_oci_g_al">1.010</span></a>
+    </div>
+  </div></div>
+</div>
+</body></html>
+"""
+
+SEARCH_HTML = """
+<html><body><div id="gs_res_ccl">
+  <h4 class="gs_rt2"><a href="/citations?user=ABC123&amp;hl=id&amp;oi=ao">Budi <b>Santoso</b></a></h4>
+</div></body></html>
+"""
+
+
+def test_profile_rows_equivalent():
+    """Baris profil dari kedua parser identik, termasuk skip_rows."""
+    reference = SoupParser().parse_profile_rows(PROFILE_HTML)
+    fast = LxmlParser().parse_profile_rows(PROFILE_HTML)
+
+    assert fast == reference
+    assert len(reference) == 3
+    assert reference[0]['Judul'] == "Sistem Informasi   AkademikBerbasisWeb"
+    assert reference[0]['Venue_Raw'] == "Jurnal Teknik Informatika 12 (2), 10-20, 2019"
+    assert reference[0]['Sitasi'] == "1.234"
+    assert reference[1]['Is_Incomplete'] is True
+    assert reference[2]['Judul'] == ""
+
+    assert LxmlParser().parse_profile_rows(PROFILE_HTML, skip_rows=1) == reference[1:]
+    assert SoupParser().parse_profile_rows(PROFILE_HTML, skip_rows=1) == reference[1:]
+
+
+def test_detail_equivalent():
+    """Field detail dan grafik sitasi per tahun identik."""
+    reference = SoupParser().parse_detail(DETAIL_HTML)
+    fast = LxmlParser().parse_detail(DETAIL_HTML)
+
+    print(f"Detail: {reference}")
+    assert fast == reference
+    assert reference['Journal'] == "Jurnal Teknik"
+    assert reference['Cited_By_Per_Year'] == {2021: 5, 2022: 1010, 2023: 0}
+
+    assert SoupParser().parse_detail("<html><body></body></html>") == {}
+    assert LxmlParser().parse_detail("<html><body></body></html>") == {}
+
+
+def test_search_and_more_button_equivalent():
+    """URL profil hasil pencarian dan status tombol 'Tampilkan lainnya' identik."""
+    for parser_name in ('bs4', 'lxml'):
+        parser = get_parser(parser_name)
+        assert parser.parse_search_profile_url(SEARCH_HTML) == \
+            "https://scholar.google.com/citations?user=ABC123&hl=id&oi=ao"
+        assert parser.parse_search_profile_url("<html></html>") is None
+        assert parser.has_more_publications(PROFILE_HTML) is True
+        assert parser.has_more_publications(PROFILE_HTML.replace('class="gs_btnPD"', 'disabled')) is False
+
+
+def test_parser_interface_is_abstract():
+    """ScholarParser hanya interface; backend yang belum lengkap tidak bisa dibuat."""
+    class PartialParser(ScholarParser):
+        def parse_detail(self, html):
+            return {}
+
+    for parser_class in (ScholarParser, PartialParser):
+        try:
+            parser_class()
+            assert False, f"{parser_class.__name__} seharusnya abstrak"
+        except TypeError:
+            pass
+
+
+if __name__ == "__main__":
+    test_profile_rows_equivalent()
+    test_detail_equivalent()
+    test_search_and_more_button_equivalent()
+    test_parser_interface_is_abstract()
+    print("\nTest completed!")
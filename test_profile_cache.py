@@ -0,0 +1,73 @@
+"""
+Test script untuk cache profil.
+Menguji penyimpanan nama -> profil, prioritas override manual, invalidasi, dan penggabungan
+file cache yang ditulis oleh beberapa proses.
+"""
+
+import os
+import tempfile
+
+from src.core_logic.profile_cache import ProfileIdCache, normalize_name_key
+
+
+PROFILE_URL = "https://scholar.google.com/citations?user=ABC123xyz&hl=id"
+
+
+def test_set_get_and_persist():
+    """Nama dinormalisasi; hasil resolve langsung tersimpan dan terbaca oleh instance baru."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache", "profile_ids.json")
+        cache = ProfileIdCache(path)
+        cache.set("Budi  Santoso", PROFILE_URL)
+
+        assert normalize_name_key("  BUDI Santoso ") == "budi santoso"
+        assert cache.get("budi santoso") == PROFILE_URL
+
+        reloaded = ProfileIdCache(path)
+        assert reloaded.get("Budi Santoso") == PROFILE_URL
+        assert reloaded.entries["budi santoso"]['user_id'] == "ABC123xyz"
+
+        reloaded.invalidate("Budi Santoso")
+        assert reloaded.get("Budi Santoso") is None
+        assert ProfileIdCache(path).get("Budi Santoso") is None
+
+
+def test_overrides():
+    """Override CSV (URL atau ID user) diprioritaskan dan tidak ditimpa hasil pencarian."""
+    with tempfile.TemporaryDirectory() as tmp:
+        overrides = os.path.join(tmp, "profile_overrides.csv")
+        with open(overrides, 'w', encoding='utf-8') as f:
+            f.write("Nama,Profil\n")
+            f.write(f"Budi Santoso,{PROFILE_URL}\n")
+            f.write("Siti Nurhaliza,XYZ987abc\n")
+            f.write("Tanpa Profil,\n")
+
+        cache = ProfileIdCache(os.path.join(tmp, "profile_ids.json"), overrides)
+        cache.set("Budi Santoso", "https://scholar.google.com/citations?user=SALAH")
+        cache.invalidate("Budi Santoso")
+
+        assert cache.get("budi santoso") == PROFILE_URL
+        assert "user=XYZ987abc" in cache.get("Siti Nurhaliza")
+        assert cache.get("Tanpa Profil") is None
+        assert cache.entries == {}
+
+
+def test_concurrent_writers_merge():
+    """Dua instance (mis. dua shard) yang menulis file yang sama tidak saling menghapus entry."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profile_ids.json")
+        first = ProfileIdCache(path)
+        second = ProfileIdCache(path)
+
+        first.set("Andi", "https://scholar.google.com/citations?user=AAA")
+        second.set("Budi", "https://scholar.google.com/citations?user=BBB")
+
+        merged = ProfileIdCache(path)
+        assert sorted(merged.entries) == ["andi", "budi"]
+
+
+if __name__ == "__main__":
+    test_set_get_and_persist()
+    test_overrides()
+    test_concurrent_writers_merge()
+    print("\nTest completed!")
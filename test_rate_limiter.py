@@ -0,0 +1,94 @@
+"""
+Test script untuk AdaptiveRateLimiter.
+Menguji token bucket dan penyesuaian laju AIMD dengan jam palsu (tanpa sleep sungguhan).
+"""
+
+import tempfile
+
+from src.core_logic.logger import ScraperLogger
+from src.core_logic.rate_limiter import AdaptiveRateLimiter
+
+
+class FakeClock:
+    """Jam palsu: sleep memajukan waktu tanpa benar-benar menunggu."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def make_limiter(**kwargs) -> AdaptiveRateLimiter:
+    clock = FakeClock()
+    return AdaptiveRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_token_bucket_pacing():
+    """Setelah burst habis, fetch berikutnya menunggu 60/rate detik."""
+    limiter = make_limiter(rate_per_minute=30, burst=2)
+
+    waits = [limiter.acquire() for _ in range(4)]
+    print(f"Waits: {waits}")
+    assert waits[0] == 0
+    assert all(abs(wait - 2.0) < 1e-9 for wait in waits[1:])
+    assert limiter.get_stats()['acquired'] == 4
+
+
+def test_aimd_adjustment():
+    """Laju naik bertahap saat berhasil, turun tajam saat CAPTCHA, dan dibatasi min/max."""
+    changes = []
+    limiter = make_limiter(rate_per_minute=20, min_rate=4, max_rate=22, increase_every=5,
+                           decrease_holdoff=30, on_change=lambda rate, reason: changes.append((rate, reason)))
+
+    for _ in range(15):
+        limiter.handle_event('OK')
+    assert limiter.rate == 22  # 20 -> 21 -> 22, lalu dibatasi max_rate
+
+    limiter.handle_event('CAPTCHA')
+    assert limiter.rate == 11
+    limiter.handle_event('CAPTCHA')  # Masih dalam holdoff: tidak turun dua kali
+    assert limiter.rate == 11
+
+    limiter._clock.now += 31
+    limiter.handle_event('TIMEOUT')
+    assert abs(limiter.rate - 8.8) < 1e-9
+
+    for _ in range(5):
+        limiter._clock.now += 31
+        limiter.on_captcha()
+    assert limiter.rate == 4
+
+    stats = limiter.get_stats()
+    assert stats['captcha_events'] == 7
+    assert stats['timeout_events'] == 1
+    assert stats['highest_rate'] == 22
+    assert changes[0] == (21, 'SUCCESS')
+    assert (11, 'CAPTCHA') in changes
+
+
+def test_logger_feeds_limiter():
+    """Event fetch dari ScraperLogger diteruskan ke limiter dan perubahan laju tercatat."""
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = ScraperLogger(log_dir=log_dir)
+        limiter = make_limiter(rate_per_minute=30, on_change=logger.record_rate_change)
+        logger.add_listener(limiter.handle_event)
+
+        logger.log_fetch_event('OK', "https://scholar.google.com/citations?user=ABC123")
+        logger.log_fetch_event('CAPTCHA', "https://scholar.google.com/sorry/index")
+
+        assert limiter.rate == 15
+        assert logger.fetch_counts == {'OK': 1, 'CAPTCHA': 1}
+        assert logger.rate_changes[-1]['reason'] == 'CAPTCHA'
+        assert [event['event_type'] for event in logger.fetch_events] == ['CAPTCHA']
+        assert logger.details == []
+
+
+if __name__ == "__main__":
+    test_token_bucket_pacing()
+    test_aimd_adjustment()
+    test_logger_feeds_limiter()
+    print("\nTest completed!")
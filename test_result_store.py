@@ -0,0 +1,74 @@
+"""
+Test script untuk ResultStore.
+Menguji upsert per dosen, riwayat perubahan, dan ekspor DataFrame dari database.
+"""
+
+import os
+import tempfile
+
+from src.core_logic.result_store import ResultStore
+from src.core_logic.sinks import publications_to_dataframe
+
+
+def make_pub(nama: str, pub_id: str, judul: str, sitasi: str, per_year: dict) -> dict:
+    return {
+        'Judul': judul,
+        'Penulis': "A Penulis",
+        'Tahun': "2022",
+        'Sitasi': sitasi,
+        'Journal_Name': "Jurnal",
+        'Cited_By_Per_Year': per_year,
+        'Nama Dosen': nama,
+        'Link': f"https://scholar.google.com/citations?view_op=view_citation&citation_for_view=USER:{pub_id}",
+    }
+
+
+def test_upsert_and_history():
+    """Upsert kedua mencatat sitasi yang berubah, publikasi baru, dan publikasi yang hilang."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultStore(os.path.join(tmp, "results.db"))
+
+        first = [make_pub("Budi", "a", "Judul A", "5", {2023: 2, 2024: 3}),
+                 make_pub("Budi", "b", "Judul B", "1", {2024: 1})]
+        assert store.upsert_lecturer("Budi", first, session_id="s1") == {'added': 2, 'updated': 0, 'removed': 0}
+
+        second = [make_pub("Budi", "a", "Judul A", "7", {2023: 2, 2024: 5}),
+                  make_pub("Budi", "c", "Judul C", "0", {})]
+        stats = store.upsert_lecturer("Budi", second, session_id="s2")
+        print(f"Stats: {stats}")
+        assert stats == {'added': 1, 'updated': 1, 'removed': 1}
+
+        history = store.lecturer_history("Budi")
+        fields = {(change['pub_key'], change['field']): change for change in history}
+        assert fields[("USER:a", 'sitasi')]['old_value'] == "5"
+        assert fields[("USER:a", 'sitasi')]['new_value'] == "7"
+        assert fields[("USER:b", 'removed')]['old_value'] == "Judul B"
+        assert store.get_stats() == {'lecturers': 1, 'publications': 2, 'changes': 2}
+
+
+def test_query_dataframe_matches_run_output():
+    """DataFrame dari result store sama dengan DataFrame run_scraper, urut sesuai input."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultStore(os.path.join(tmp, "results.db"))
+        ani = [make_pub("Ani", "x", "Judul X", "3", {2022: 3})]
+        budi = [make_pub("Budi", "a", "Judul A", "5", {2023: 2, 2024: 3}),
+                make_pub("Budi", "b", "Judul B", "1", {})]
+        store.upsert_lecturer("Budi", budi)
+        store.upsert_lecturer("Ani", ani)
+
+        expected = publications_to_dataframe(ani + budi)
+        df = store.query_dataframe(["Ani", "Budi", "Tidak Ada"])
+        print(df)
+        assert list(df.columns) == list(expected.columns)
+        assert df.drop(columns='Cited_By_Per_Year').equals(expected.drop(columns='Cited_By_Per_Year'))
+        assert df['Cited_By_Per_Year'].tolist() == expected['Cited_By_Per_Year'].tolist()
+
+        df_years = store.query_dataframe(["Budi"], years=[2024, 2025])
+        assert df_years['2024_cited_by'].tolist() == [3, 0]
+        assert df_years['2025_cited_by'].tolist() == [0, 0]
+
+
+if __name__ == "__main__":
+    test_upsert_and_history()
+    test_query_dataframe_matches_run_output()
+    print("\nTest completed!")
@@ -0,0 +1,85 @@
+"""
+Test script untuk GoogleScholarScraper.
+Menguji pengaturan worker pool dan alur pengambilan halaman profil per halaman (cstart)
+dengan scraper._load_html palsu (tanpa jaringan/Chrome).
+"""
+
+from urllib.parse import parse_qs, urlsplit
+
+from src.core_logic.driver_manager import DriverManager
+from src.core_logic.scraper import GoogleScholarScraper
+
+
+MORE_BUTTON = '<button id="gsc_bpf_more" type="button">Tampilkan lainnya</button>'
+
+
+def _profile_page(titles, has_more: bool) -> str:
+    rows = "".join(
+        f'<tr class="gsc_a_tr"><td class="gsc_a_t">'
+        f'<a href="/citations?view_op=view_citation&amp;user=ABC&amp;citation_for_view=ABC:{title}" '
+        f'class="gsc_a_at">{title}</a><div class="gs_gray">Penulis</div><div class="gs_gray">Venue</div></td>'
+        f'<td class="gsc_a_c"><a class="gsc_a_ac">1</a></td>'
+        f'<td class="gsc_a_y"><span class="gsc_a_h">2020</span></td></tr>'
+        for title in titles
+    )
+    return (f'<html><body><table id="gsc_a_t"><tbody id="gsc_a_b">{rows}</tbody></table>'
+            f'{MORE_BUTTON if has_more else ""}</body></html>')
+
+
+def test_paged_profile_continues_past_duplicate_page():
+    """Halaman yang semua judulnya duplikat tidak menghentikan paging selama tombol masih aktif."""
+    pages = {
+        0: _profile_page(["A", "B"], has_more=True),
+        100: _profile_page(["A", "B"], has_more=True),  # Semua judul sudah pernah diambil
+        200: _profile_page(["C"], has_more=True),
+        300: _profile_page([], has_more=True),  # Halaman kosong: berhenti walau tombol masih aktif
+    }
+    fetched = []
+
+    def load_html(url: str, refresh: bool = False):
+        query = parse_qs(urlsplit(url).query)
+        if 'q' in query:
+            return '<h4 class="gs_rt2"><a href="/citations?user=ABC&amp;hl=id">Andi</a></h4>'
+        if 'citation_for_view' in query:
+            return '<html><body><div id="gsc_oci_table"></div></body></html>'
+        cstart = int(query.get('cstart', ["0"])[0])
+        fetched.append(cstart)
+        return pages.get(cstart)
+
+    scraper = GoogleScholarScraper(fetch_mode='http', rate_per_minute=None)
+    scraper.years_to_collect = None
+    scraper._load_html = load_html
+
+    publications = scraper.scrape_dosen_publications("Andi")
+
+    assert [pub['Judul'] for pub in publications] == ["A", "B", "C"]
+    assert fetched == [0, 100, 200, 300]
+
+
+def test_worker_driver_settings():
+    """Worker memakai batas daur ulang scraper utama; worker pertama memakai Chrome dari manager GUI."""
+    manager = DriverManager(max_pages=7, max_memory_mb=900)
+    scraper = GoogleScholarScraper(fetch_mode='http', rate_per_minute=10, driver_manager=manager)
+    scraper.years_to_collect = None
+
+    first, second = scraper._spawn_worker(1), scraper._spawn_worker(2)
+    assert first.driver_manager is manager
+    assert first._driver_config() == scraper._driver_config()
+    assert second.driver_manager is not manager
+    assert (second.driver_manager.max_pages, second.driver_manager.max_memory_mb) == (7, 900)
+    assert second.driver_profile == "worker_2"
+    assert second.fetch_mode == 'http' and second.http_fetcher is scraper.http_fetcher
+    assert second.rate_limiter is scraper.rate_limiter
+
+    # Tanpa manager dari luar setiap worker memakai manager sendiri dengan batas yang sama
+    own = GoogleScholarScraper(max_pages_per_driver=3, max_driver_memory_mb=800)
+    own.years_to_collect = None
+    worker = own._spawn_worker(1)
+    assert worker.driver_manager is not own.driver_manager
+    assert (worker.driver_manager.max_pages, worker.driver_manager.max_memory_mb) == (3, 800)
+
+
+if __name__ == "__main__":
+    test_paged_profile_continues_past_duplicate_page()
+    test_worker_driver_settings()
+    print("\nTest completed!")
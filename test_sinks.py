@@ -0,0 +1,99 @@
+"""
+Test script untuk result sink.
+Menguji ekspansi kolom <tahun>_cited_by, sink CSV/JSONL yang ditulis per dosen, dan skema
+Parquet bertipe (dilewati jika pyarrow tidak terpasang).
+"""
+
+import os
+import tempfile
+
+import pandas as pd
+
+from src.core_logic.file_handler import save_to_parquet
+from src.core_logic.sinks import CsvSink, JsonlSink, ParquetSink, pa, pq, publications_to_dataframe
+
+
+PUBLICATIONS = [
+    {'Judul': "A", 'Sitasi': "5", 'Cited_By_Per_Year': {2023: 2, 2024: 3}, 'Nama Dosen': "Budi"},
+    {'Judul': "B", 'Sitasi': "", 'Cited_By_Per_Year': {}, 'Nama Dosen': "Budi"},
+    {'Judul': "C", 'Sitasi': "4", 'Cited_By_Per_Year': {2021: 1, 2024: 3}, 'Nama Dosen': "Ani"},
+]
+
+
+def test_expand_cited_by_years():
+    """Kolom tahun sama dengan ekspansi lama (satu apply per tahun)."""
+    df = publications_to_dataframe(PUBLICATIONS)
+    expected = pd.DataFrame(PUBLICATIONS)
+    for year in [2021, 2023, 2024]:
+        expected[f"{year}_cited_by"] = expected['Cited_By_Per_Year'].apply(
+            lambda m, y=year: int(m.get(y, 0)) if isinstance(m, dict) else 0)
+    print(df)
+    assert df.equals(expected)
+
+    df_years = publications_to_dataframe(PUBLICATIONS, years={2024, 2025})
+    assert list(df_years.columns[-2:]) == ['2024_cited_by', '2025_cited_by']
+    assert df_years['2025_cited_by'].tolist() == [0, 0, 0]
+
+
+def test_csv_sink_rewrites_header_for_new_years():
+    """Tahun yang baru muncul di dosen berikutnya tetap mendapat kolom (baris lama diisi 0)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with CsvSink(os.path.join(tmp, "hasil.csv")) as sink:
+            sink.write("Budi", PUBLICATIONS[:2])
+            sink.write("Ani", PUBLICATIONS[2:])
+
+        df = sink.to_dataframe()
+        print(df)
+        assert list(df.columns) == ['Judul', 'Sitasi', 'Nama Dosen', '2021_cited_by', '2023_cited_by', '2024_cited_by']
+        assert df['2021_cited_by'].tolist() == [0, 0, 1]
+        assert df['2023_cited_by'].tolist() == [2, 0, 0]
+        assert (sink.rows, sink.lecturers) == (3, 2)
+
+
+def test_jsonl_sink_lazy_dataframe():
+    """DataFrame dari JSONL sink sama dengan DataFrame yang dibangun di memori."""
+    with tempfile.TemporaryDirectory() as tmp:
+        sink = JsonlSink(os.path.join(tmp, "hasil.jsonl"))
+        sink.write("Budi", PUBLICATIONS[:2])
+        sink.write("Kosong", [])
+        sink.write("Ani", PUBLICATIONS[2:])
+
+        df = sink.to_dataframe()
+        assert sink.closed and sink.lecturers == 3
+        assert df.equals(publications_to_dataframe(PUBLICATIONS))
+
+
+def test_parquet_typed_schema():
+    """Parquet menyimpan tahun/sitasi sebagai integer, sitasi per tahun sebagai map, nama sebagai dictionary."""
+    if pa is None:
+        print("pyarrow tidak terpasang, test dilewati")
+        return
+
+    publications = [dict(pub, Tahun=tahun, Journal_Name="Jurnal")
+                    for pub, tahun in zip(PUBLICATIONS, ["2022", "", "2020"])]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = save_to_parquet(publications_to_dataframe(publications), os.path.join(tmp, "hasil"))
+        schema = pq.read_schema(path)
+        print(schema)
+        assert schema.field('Tahun').type == pa.int16()
+        assert schema.field('Sitasi').type == pa.int32()
+        assert schema.field('2024_cited_by').type == pa.int32()
+        assert schema.field('Cited_By_Per_Year').type == pa.map_(pa.int16(), pa.int32())
+        assert pa.types.is_dictionary(schema.field('Nama Dosen').type)
+        assert pa.types.is_dictionary(schema.field('Journal_Name').type)
+
+        with ParquetSink(os.path.join(tmp, "stream.parquet")) as sink:
+            sink.write("Budi", publications[:2])
+            sink.write("Ani", publications[2:])
+        df = sink.to_dataframe()
+        assert df['Tahun'].tolist()[::2] == [2022, 2020] and df['Tahun'].isna().tolist()[1]
+        assert df['Cited_By_Per_Year'].tolist() == [pub['Cited_By_Per_Year'] for pub in publications]
+        assert df['2024_cited_by'].tolist() == [3, 0, 3]
+
+
+if __name__ == "__main__":
+    test_expand_cited_by_years()
+    test_csv_sink_rewrites_header_for_new_years()
+    test_jsonl_sink_lazy_dataframe()
+    test_parquet_typed_schema()
+    print("\nTest completed!")
@@ -0,0 +1,66 @@
+"""
+Test script untuk snapshot store dan mode incremental.
+Menguji key publikasi, simpan/muat snapshot, dan pemilihan halaman detail yang perlu diambil ulang.
+"""
+
+import os
+import tempfile
+
+from src.core_logic.scraper import GoogleScholarScraper
+from src.core_logic.snapshot_store import SnapshotStore, publication_key, row_signature
+
+
+def _row(citation_id: str, title: str, citations: str = "1", year: str = "2020") -> dict:
+    link = f"https://scholar.google.com/citations?view_op=view_citation&user=ABC&citation_for_view={citation_id}"
+    return {'Judul': title, 'Sitasi': citations, 'Tahun': year, 'Detail_Link': link}
+
+
+def test_publication_key():
+    """Key memakai citation_for_view; tanpa link memakai judul yang dinormalisasi."""
+    assert publication_key(_row("ABC:p1", "Judul")) == "ABC:p1"
+    assert publication_key({'Judul': "  Sistem   Informasi ", 'Detail_Link': None}) == "sistem informasi"
+    assert row_signature({'Judul': " A ", 'Sitasi': None, 'Tahun': "2021"}) == ("A", "", "2021")
+
+
+def test_save_and_load():
+    """Snapshot tersimpan per dosen; signature kembali menjadi tuple dan key tahun menjadi int."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SnapshotStore(os.path.join(tmp, "snapshots"))
+        store.save("Budi Santoso", {
+            "ABC:p1": {'signature': ("A", "5", "2020"),
+                       'details': {'Journal_Name': "Jurnal", 'Cited_By_Per_Year': {2022: 2, 2023: 3}}},
+        })
+
+        loaded = store.load("budi  santoso")
+        assert loaded["ABC:p1"]['signature'] == ("A", "5", "2020")
+        assert loaded["ABC:p1"]['details']['Cited_By_Per_Year'] == {2022: 2, 2023: 3}
+        assert store.load("Dosen Lain") == {}
+
+
+def test_incremental_plan():
+    """Detail publikasi yang tidak berubah dipakai ulang; baru dan berubah diambil ulang."""
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = GoogleScholarScraper(snapshot_dir=os.path.join(tmp, "snapshots"), incremental=True,
+                                       rate_per_minute=None)
+        previous_rows = [_row("ABC:p1", "Tetap"), _row("ABC:p2", "Sitasi naik"), _row("ABC:p3", "Tanpa detail")]
+        details = {previous_rows[0]['Detail_Link']: {'Journal_Name': "J1"},
+                   previous_rows[1]['Detail_Link']: {'Journal_Name': "J2"}}
+        snapshot = {}
+        scraper._update_snapshot(previous_rows, details, snapshot)
+        scraper._save_snapshot("Budi", snapshot)
+
+        rows = [_row("ABC:p1", "Tetap"), _row("ABC:p2", "Sitasi naik", citations="9"),
+                _row("ABC:p3", "Tanpa detail"), _row("ABC:p4", "Baru")]
+        reused, fetch_urls, changed_urls = scraper._plan_row_details(rows, scraper._load_snapshot("Budi"))
+
+    assert reused == {rows[0]['Detail_Link']: {'Journal_Name': "J1"}}
+    assert fetch_urls == [row['Detail_Link'] for row in rows[1:]]
+    # Hanya publikasi lama yang berubah yang melewati cache halaman
+    assert changed_urls == {rows[1]['Detail_Link'], rows[2]['Detail_Link']}
+
+
+if __name__ == "__main__":
+    test_publication_key()
+    test_save_and_load()
+    test_incremental_plan()
+    print("\nTest completed!")